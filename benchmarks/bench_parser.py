@@ -0,0 +1,66 @@
+"""Measure parser cost as sections grow.
+
+Reports mistune tokenization and md2cv's section walk separately, in
+total and per entry, so non-linear growth in either shows up as a rising
+per-entry cost.
+
+What md2cv controls is the walk: it should stay linear, at microseconds
+per entry, so 5,000 entries are walked in tens of milliseconds. It does
+not make a full parse take milliseconds. Tokenizing is done by mistune.
+Depending on the entry shape it costs tens to hundreds of microseconds
+per entry, or seconds for 5,000 entries, and it dominates a full parse.
+In watch mode, parse_cv_incremental only tokenizes the sections that
+changed.
+
+Usage: python benchmarks/bench_parser.py [--sizes 1000 5000] [-n RUNS]
+
+Sizes are entries per section; each synthetic CV has three sections.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from md2cv.parser import _markdown, _walk_tokens
+
+from synthetic import synthetic_cv
+
+SHAPES = ("h3", "bold", "raw")
+
+
+def _best(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("-n", "--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'shape':>6} {'entries':>8} {'tokenize':>12} {'tok/entry':>12} "
+        f"{'walk':>12} {'walk/entry':>12}"
+    )
+    for shape in SHAPES:
+        for size in args.sizes:
+            text = synthetic_cv(size, shape)
+            tokens = _markdown(text)
+            tokenize = _best(lambda: _markdown(text), args.runs)
+            walk = _best(lambda: _walk_tokens(tokens), args.runs)
+            entries = size * 3
+            print(
+                f"{shape:>6} {entries:>8} {tokenize * 1000:9.1f} ms "
+                f"{tokenize / entries * 1e6:9.1f} us {walk * 1000:9.1f} ms "
+                f"{walk / entries * 1e6:9.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
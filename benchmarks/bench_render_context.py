@@ -0,0 +1,67 @@
+"""Compare per-render cost with and without a shared RenderContext.
+
+Usage: python benchmarks/bench_render_context.py [MARKDOWN_FILE] [-n RUNS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from md2cv.context import RenderContext
+from md2cv.parser import parse_cv
+from md2cv.pdf import _scale_params
+from md2cv.renderer import assemble_html, render_body, render_style
+from md2cv.themes import get_theme
+
+DEFAULT_INPUT = Path(__file__).parent.parent / "tests" / "fixtures" / "sample_long.md"
+
+
+def _time(fn, runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", nargs="?", default=DEFAULT_INPUT, type=Path)
+    parser.add_argument("-n", "--runs", type=int, default=10)
+    parser.add_argument("--theme", default="professional")
+    args = parser.parse_args()
+
+    from weasyprint import HTML
+
+    theme = get_theme(args.theme)
+    cv = parse_cv(args.input.read_text(encoding="utf-8"))
+    body = render_body(cv, theme)
+    style = _scale_params(theme.default_style, 0.85)
+
+    def fresh():
+        html = assemble_html(theme, body, render_style(style, theme))
+        HTML(string=html).render()
+
+    context = RenderContext()
+    context.render(body, style, theme)  # Warm the font and stylesheet caches
+
+    def shared():
+        context.render(body, style, theme)
+
+    fresh()  # Exclude one-off import and fontconfig start-up from both
+    results = {"fresh": _time(fresh, args.runs), "shared": _time(shared, args.runs)}
+    for name, times in results.items():
+        print(
+            f"{name:>7}: mean {statistics.mean(times) * 1000:8.1f} ms, "
+            f"min {min(times) * 1000:8.1f} ms over {len(times)} renders"
+        )
+    saving = statistics.mean(results["fresh"]) - statistics.mean(results["shared"])
+    print(f" saving: {saving * 1000:8.1f} ms per render")
+
+
+if __name__ == "__main__":
+    main()
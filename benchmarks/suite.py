@@ -0,0 +1,205 @@
+"""Benchmark suite: time each pipeline stage on synthetic CVs.
+
+Commands:
+    run       Time parse_cv, render_html, one layout pass
+              (_render_and_count_pages) and a full generate_pdf for every
+              case, recording how many renders auto-fit needed. Writes JSON.
+    compare   Compare two result files and exit non-zero on regressions.
+
+Usage:
+    python benchmarks/suite.py run -o baseline.json
+    python benchmarks/suite.py run -o current.json
+    python benchmarks/suite.py compare baseline.json current.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from md2cv import __version__
+from md2cv.parser import parse_cv
+from md2cv.pdf import FitResult, _render_and_count_pages, generate_pdf
+from md2cv.renderer import render_body, render_html
+from md2cv.themes import get_theme
+
+from synthetic import SHAPES, synthetic_cv, write_photo
+
+SIZES = {"small": 3, "medium": 8, "large": 20}
+TIMINGS = ("parse_ms", "html_ms", "layout_ms", "pdf_ms")
+COUNTS = ("fit_renders",)
+
+
+def _cases(sizes: list[str], shapes: list[str]) -> list[tuple[str, str, str, bool]]:
+    cases = [
+        (f"{size}-{shape}", size, shape, False) for size in sizes for shape in shapes
+    ]
+    # Photo embedding changes both the body size and the layout
+    cases += [(f"{size}-mixed-photo", size, "mixed", True) for size in sizes]
+    return cases
+
+
+def _best_ms(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def run_case(
+    size: str, shape: str, photo: Path | None, theme_name: str, runs: int, pdf: bool
+) -> dict:
+    """Time one case and return its metrics."""
+    text = synthetic_cv(SIZES[size], shape)
+    theme = get_theme(theme_name)
+    cv = parse_cv(text)
+    cv.photo_path = str(photo) if photo else None
+
+    metrics = {
+        "parse_ms": _best_ms(lambda: parse_cv(text), runs),
+        "html_ms": _best_ms(lambda: render_html(cv, theme=theme), runs),
+    }
+    if not pdf:
+        return metrics
+
+    body = render_body(cv, theme)
+    _render_and_count_pages(body, theme.default_style, theme)  # Warm fonts
+    metrics["layout_ms"] = _best_ms(
+        lambda: _render_and_count_pages(body, theme.default_style, theme), runs
+    )
+    result = FitResult()
+    with tempfile.TemporaryDirectory(prefix="md2cv-bench-") as tmp:
+        output = Path(tmp) / "cv.pdf"
+        metrics["pdf_ms"] = _best_ms(
+            lambda: generate_pdf(cv, output, theme=theme, result=result), runs
+        )
+    metrics["fit_renders"] = result.renders
+    return metrics
+
+
+def run(args: argparse.Namespace) -> int:
+    results: dict = {
+        "md2cv": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "theme": args.theme,
+        "cases": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="md2cv-bench-") as tmp:
+        photo = write_photo(Path(tmp) / "photo.png")
+        for name, size, shape, with_photo in _cases(args.sizes, args.shapes):
+            metrics = run_case(
+                size,
+                shape,
+                photo if with_photo else None,
+                args.theme,
+                args.runs,
+                not args.no_pdf,
+            )
+            results["cases"][name] = metrics
+            summary = "  ".join(
+                f"{key} {value:.1f}" if key.endswith("_ms") else f"{key} {value}"
+                for key, value in metrics.items()
+            )
+            print(f"{name:<20} {summary}", file=sys.stderr)
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float, min_ms: float
+) -> list[str]:
+    """Return a description of every regression of ``current`` over ``baseline``.
+
+    A timing regresses when it is more than ``threshold`` (a fraction)
+    slower and at least ``min_ms`` slower in absolute terms; a render
+    count regresses when it grows at all.
+    """
+    regressions = []
+    for name, old in sorted(baseline["cases"].items()):
+        new = current["cases"].get(name)
+        if new is None:
+            continue
+        for key in TIMINGS:
+            if key in old and key in new:
+                delta = new[key] - old[key]
+                if delta > min_ms and new[key] > old[key] * (1 + threshold):
+                    # A zero baseline (e.g. a --no-pdf stage) has no ratio
+                    change = f"+{delta / old[key]:.0%}" if old[key] else "n/a"
+                    regressions.append(
+                        f"{name} {key}: {old[key]:.1f} -> {new[key]:.1f} ms "
+                        f"({change})"
+                    )
+        for key in COUNTS:
+            if key in old and key in new and new[key] > old[key]:
+                regressions.append(f"{name} {key}: {old[key]} -> {new[key]}")
+    return regressions
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    regressions = compare_results(baseline, current, args.threshold, args.min_ms)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    compared = len(baseline["cases"].keys() & current["cases"].keys())
+    print(f"{compared} case(s) compared, {len(regressions)} regression(s).")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the suite and write JSON.")
+    run_parser.add_argument("-o", "--output", help="Result file (default: stdout)")
+    run_parser.add_argument("-n", "--runs", type=int, default=3)
+    run_parser.add_argument("--theme", default="professional")
+    run_parser.add_argument(
+        "--sizes", nargs="+", choices=list(SIZES), default=list(SIZES)
+    )
+    run_parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=SHAPES)
+    run_parser.add_argument(
+        "--no-pdf", action="store_true", help="Skip the WeasyPrint stages."
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Flag regressions against a baseline."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown as a fraction (default: 0.2).",
+    )
+    compare_parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=1.0,
+        help="Ignore slowdowns smaller than this many ms (default: 1.0).",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Synthetic CVs of configurable size and shape for the benchmarks.
+
+Shapes:
+    h3     ``### Title | Date`` entries with org, tags and bullets (CV.md format)
+    bold   ``**Title** | Org | Date`` entries with bullets
+    raw    paragraphs and numbered lists that fall back to raw HTML
+    mixed  one section of each of the above
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+import zlib
+from pathlib import Path
+
+SHAPES = ("h3", "bold", "raw", "mixed")
+
+_WORDS = (
+    "design build scalable service pipeline latency team platform data "
+    "migration reliability customer launch analysis model cost reduced "
+    "improved automated distributed storage query cache api release"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _h3_section(rng: random.Random, heading: str, entries: int) -> list[str]:
+    lines = [f"## {heading}", ""]
+    for i in range(entries):
+        lines += [
+            f"### {_sentence(rng, 3)[:-1]} | 20{10 + i % 15}–20{11 + i % 15}",
+            f"**Company {i}** | City {i % 7}",
+            f"**Skills:** {', '.join(rng.sample(_WORDS, 4))}",
+            "",
+            *(f"- {_sentence(rng, rng.randint(8, 20))}" for _ in range(3)),
+            "",
+        ]
+    return lines
+
+
+def _bold_section(rng: random.Random, heading: str, entries: int) -> list[str]:
+    lines = [f"## {heading}", ""]
+    for i in range(entries):
+        lines += [
+            f"**{_sentence(rng, 3)[:-1]}** | University {i} | 20{10 + i % 15}",
+            *(f"- {_sentence(rng, rng.randint(6, 14))}" for _ in range(2)),
+            "",
+        ]
+    return lines
+
+
+def _raw_section(rng: random.Random, heading: str, entries: int) -> list[str]:
+    lines = [f"## {heading}", "", _sentence(rng, 30), ""]
+    lines += [f"{i + 1}. {_sentence(rng, rng.randint(10, 25))}" for i in range(entries)]
+    return lines + [""]
+
+
+_BUILDERS = {"h3": _h3_section, "bold": _bold_section, "raw": _raw_section}
+
+
+def synthetic_cv(entries: int, shape: str = "mixed", seed: int = 0) -> str:
+    """Return markdown for a CV with ``entries`` items per section.
+
+    The same arguments always give the same text.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape {shape!r}; expected one of {SHAPES}")
+    rng = random.Random(seed)
+    lines = [
+        "# Jane Doe",
+        "",
+        "**Senior Engineer**",
+        "",
+        "jane@example.com | +1 555 0100 | example.com | Berlin",
+        "",
+    ]
+    shapes = ("h3", "bold", "raw") if shape == "mixed" else (shape,) * 3
+    for heading, section_shape in zip(("Experience", "Education", "Projects"), shapes):
+        lines += _BUILDERS[section_shape](rng, heading, entries)
+    return "\n".join(lines)
+
+
+def write_photo(path: Path, width: int = 300, height: int = 400) -> Path:
+    """Write a solid-colour PNG of the given size to use as a CV photo."""
+    row = b"\x00" + b"\x80\x90\xa0" * width
+    data = zlib.compress(row * height)
+
+    def chunk(kind: bytes, payload: bytes) -> bytes:
+        body = kind + payload
+        return struct.pack(">I", len(payload)) + body + struct.pack(
+            ">I", zlib.crc32(body)
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", data)
+        + chunk(b"IEND", b"")
+    )
+    return path
@@ -0,0 +1,253 @@
+"""Asyncio API: render without blocking the event loop.
+
+Rendering runs in a thread or process executor, with a limit on how many
+documents are rendered at once::
+
+    renderer = AsyncRenderer(ProcessPoolExecutor(4), max_concurrency=4)
+    pdf = await renderer.generate_pdf(cv, page_size="letter")
+
+``render_html_async`` and ``generate_pdf_async`` use a shared default
+renderer (the event loop's default thread pool, one document per CPU)
+unless given one.
+
+Auto-fit is driven from the event loop one layout round at a time, so a
+cancelled render stops before its next round; the round already running
+in the executor is left to finish. Nothing is written to disk unless a
+``fit_cache`` is passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import weakref
+from collections.abc import Generator
+from concurrent.futures import Executor
+
+from md2cv.cache import FitCache
+from md2cv.estimate import FitEstimator, FitPrior
+from md2cv.models import CVData, StyleParams
+from md2cv.pdf import (
+    FIT_TOLERANCE_PT,
+    FitResult,
+    _fill_ratio,
+    _FirstProbe,
+    _fit_steps,
+    _is_final_layout,
+    _measure_factor,
+    _page_style,
+    _render_and_count_pages,
+    _render_document,
+    _scale_params,
+)
+from md2cv.renderer import EmbeddedPhoto, render_body, render_html
+from md2cv.stats import FitIteration
+from md2cv.themes import Theme, get_theme
+
+# Executor tasks are module-level functions so process pools can run them.
+
+
+def _prepare_body(
+    cv: CVData, theme: Theme | str, photo: EmbeddedPhoto | None
+) -> tuple[Theme, str]:
+    """Load the theme if needed and render the body markup."""
+    if isinstance(theme, str):
+        theme = get_theme(theme)
+    return theme, render_body(cv, theme, photo)
+
+
+def _layout_and_write(
+    body: str,
+    style: StyleParams,
+    theme: Theme,
+    final_fill: tuple[float, float] | None = None,
+    always: bool = False,
+) -> tuple[int, float, bytes | None]:
+    """Lay out the body; serialize the PDF if it is final, or ``always``.
+
+    The layout is final when it is a first auto-fit probe that the search
+    will accept as it is (see _FirstProbe). Serializing it right away
+    saves laying out the same factor again; other probes are discarded.
+    """
+    doc = _render_document(body, style, theme)
+    pages, fill = len(doc.pages), _fill_ratio(doc)
+    final = always or _is_final_layout(pages, fill, final_fill)
+    return pages, fill, doc.write_pdf() if final else None
+
+
+def _write(body: str, style: StyleParams, theme: Theme) -> bytes:
+    """Lay out the body and return the serialized PDF."""
+    return _render_document(body, style, theme).write_pdf()
+
+
+class AsyncRenderer:
+    """Runs renders in an executor, at most ``max_concurrency`` at a time.
+
+    Args:
+        executor: Where rendering runs: a ThreadPoolExecutor keeps the
+            loop responsive, a ProcessPoolExecutor also renders in
+            parallel. None uses the event loop's default executor. Each
+            thread renders with its own RenderContext.
+        max_concurrency: Documents rendered at once (default: CPU count).
+            Further calls wait for a slot.
+    """
+
+    def __init__(
+        self, executor: Executor | None = None, max_concurrency: int | None = None
+    ) -> None:
+        self.executor = executor
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        # A semaphore belongs to one event loop
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    async def render_html(
+        self,
+        cv: CVData,
+        style: StyleParams | None = None,
+        theme: Theme | None = None,
+        theme_name: str = "professional",
+        photo: EmbeddedPhoto | None = None,
+    ) -> str:
+        """Render a CV to a self-contained HTML string, like render_html."""
+        async with self._slot():
+            return await self._run(render_html, cv, style, theme, theme_name, photo)
+
+    async def generate_pdf(
+        self,
+        cv: CVData,
+        page_size: str = "a4",
+        auto_fit: bool = True,
+        theme_name: str = "professional",
+        fit_tolerance: float = FIT_TOLERANCE_PT,
+        fit_workers: int = 1,
+        fit_cache: FitCache | None = None,
+        prior: FitPrior | None = None,
+        estimator: FitEstimator | None = None,
+        fit_strategy: str = "search",
+        theme: Theme | None = None,
+        result: FitResult | None = None,
+        photo: EmbeddedPhoto | None = None,
+    ) -> bytes:
+        """Generate a PDF and return its bytes.
+
+        Takes the same options as md2cv.pdf.generate_pdf, except that
+        ``fit_workers`` probes run in this renderer's executor.
+        """
+        if fit_strategy not in ("search", "measure"):
+            raise ValueError(f"Unknown fit strategy: {fit_strategy!r}")
+        if result is None:
+            result = FitResult()
+
+        async with self._slot():
+            theme, body = await self._run(
+                _prepare_body, cv, theme or theme_name, photo
+            )
+            base_style = _page_style(theme, page_size)
+            if not auto_fit:
+                pages, _, data = await self._run(
+                    _layout_and_write, body, base_style, theme, None, True
+                )
+                result.factor, result.renders = 1.0, 1
+                result.fits = pages <= 1
+                return data
+
+            steps = _fit_steps(
+                cv,
+                theme,
+                base_style,
+                page_size,
+                fit_tolerance,
+                fit_workers,
+                fit_cache,
+                prior,
+                estimator,
+                fit_strategy,
+                result,
+            )
+            try:
+                return await self._drive_fit(steps, body, base_style, theme, result)
+            finally:
+                steps.close()
+
+    async def _drive_fit(
+        self,
+        steps: Generator[list[float] | None, object, tuple[float, bool]],
+        body: str,
+        base_style: StyleParams,
+        theme: Theme,
+        result: FitResult,
+    ) -> bytes:
+        """Answer _fit_steps with executor layouts; return the final PDF."""
+        first: bytes | None = None
+        reply = None
+        try:
+            while True:
+                step = steps.send(reply)
+                if step is None:
+                    reply = await self._run(_measure_factor, body, base_style, theme)
+                    continue
+                styles = [_scale_params(base_style, f) for f in step]
+                start = time.perf_counter()
+                if isinstance(step, _FirstProbe):
+                    pages, fill, first = await self._run(
+                        _layout_and_write, body, styles[0], theme, step.final_fill
+                    )
+                    reply = [(pages, fill)]
+                else:
+                    reply = await asyncio.gather(
+                        *(
+                            self._run(_render_and_count_pages, body, style, theme)
+                            for style in styles
+                        )
+                    )
+                seconds = time.perf_counter() - start
+                result.trace.extend(
+                    FitIteration(factor, pages, fill, seconds)
+                    for factor, (pages, fill) in zip(step, reply)
+                )
+        except StopIteration as stop:
+            factor, reuse = stop.value
+        if reuse and first is not None:
+            return first
+        return await self._run(_write, body, _scale_params(base_style, factor), theme)
+
+    def _slot(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self.max_concurrency
+            )
+        return semaphore
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+
+_default_renderer: AsyncRenderer | None = None
+
+
+def default_renderer() -> AsyncRenderer:
+    """Return the shared AsyncRenderer used when none is given."""
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = AsyncRenderer()
+    return _default_renderer
+
+
+async def render_html_async(
+    cv: CVData, renderer: AsyncRenderer | None = None, **options
+) -> str:
+    """Async render_html; see AsyncRenderer.render_html."""
+    return await (renderer or default_renderer()).render_html(cv, **options)
+
+
+async def generate_pdf_async(
+    cv: CVData, renderer: AsyncRenderer | None = None, **options
+) -> bytes:
+    """Async generate_pdf returning the PDF bytes; see AsyncRenderer.generate_pdf."""
+    return await (renderer or default_renderer()).generate_pdf(cv, **options)
@@ -0,0 +1,187 @@
+"""Theme assets: the ``theme-asset:`` URL scheme and an in-memory cache.
+
+Theme CSS and templates can refer to files shipped next to them, e.g.
+``url(theme-asset:fonts/Inter.woff2)`` or ``<img src="theme-asset:logo.svg">``,
+which resolve inside the theme's directory. For PDFs, WeasyPrint fetches
+them (and local ``file:`` URLs) through ``url_fetcher``, which serves
+them from a size-bounded LRU cache, so repeated renders in one process
+read each file once. Standalone HTML gets them inlined as data URIs.
+"""
+
+from __future__ import annotations
+
+import base64
+import mimetypes
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import unquote, urlsplit
+from urllib.request import url2pathname
+
+from md2cv.themes import Theme
+
+SCHEME = "theme-asset"
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# theme-asset: references in CSS url(...) or HTML attributes
+_ASSET_RE = re.compile(rf"""{SCHEME}:([^\s"'()<>]+)""")
+
+
+class Asset(NamedTuple):
+    """A cached file: its contents and MIME type."""
+
+    data: bytes
+    mime: str
+
+
+class AssetCache:
+    """LRU cache of asset files, bounded by total size in bytes.
+
+    Entries are validated against the file's mtime and size, so an edited
+    asset is read again. Safe to share between threads.
+    """
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._entries: OrderedDict[Path, tuple[tuple[int, int], Asset]] = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str | Path) -> Asset:
+        """Return a file's contents, reading it only if not cached.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = Path(path)
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == stamp:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+
+        mime, _ = mimetypes.guess_type(path.name)
+        asset = Asset(path.read_bytes(), mime or "application/octet-stream")
+        with self._lock:
+            self.misses += 1
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._size -= len(old[1].data)
+            if len(asset.data) <= self.max_bytes:
+                self._entries[path] = (stamp, asset)
+                self._size += len(asset.data)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+        return asset
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_default_cache: AssetCache | None = None
+
+
+def get_asset_cache() -> AssetCache:
+    """Return the process-wide AssetCache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = AssetCache()
+    return _default_cache
+
+
+def resolve_asset(url: str, theme: Theme) -> Path:
+    """Return the file a ``theme-asset:`` URL refers to.
+
+    Raises:
+        ValueError: If the URL is not a theme asset or points outside the
+            theme's directory.
+    """
+    scheme, _, rest = url.partition(":")
+    if scheme.lower() != SCHEME or theme.directory is None:
+        raise ValueError(f"Not a theme asset of {theme.name!r}: {url}")
+    relative = unquote(rest.split("?")[0].split("#")[0]).lstrip("/")
+    root = theme.directory.resolve()
+    path = (root / relative).resolve()
+    if not path.is_relative_to(root):
+        raise ValueError(f"Theme asset outside the theme directory: {url}")
+    return path
+
+
+def inline_assets(
+    text: str, theme: Theme, cache: AssetCache | None = None
+) -> str:
+    """Replace ``theme-asset:`` URLs in HTML or CSS with data URIs.
+
+    References that cannot be resolved are left as they are.
+    """
+    if f"{SCHEME}:" not in text:
+        return text
+    cache = cache or get_asset_cache()
+
+    def data_uri(match: re.Match) -> str:
+        try:
+            asset = cache.load(resolve_asset(match.group(0), theme))
+        except (OSError, ValueError):
+            return match.group(0)
+        encoded = base64.b64encode(asset.data).decode("ascii")
+        return f"data:{asset.mime};base64,{encoded}"
+
+    return _ASSET_RE.sub(data_uri, text)
+
+
+def url_fetcher(theme: Theme, cache: AssetCache | None = None):
+    """Build a WeasyPrint URL fetcher serving theme and local files from cache.
+
+    ``theme-asset:`` URLs resolve inside ``theme``'s directory, ``file:``
+    URLs are read through the cache too, and anything else goes to
+    WeasyPrint's default fetcher.
+    """
+    cache = cache or get_asset_cache()
+
+    def local_path(url: str) -> Path | None:
+        scheme = url.partition(":")[0].lower()
+        if scheme == SCHEME:
+            return resolve_asset(url, theme)
+        if scheme == "file":
+            return Path(url2pathname(urlsplit(url).path))
+        return None
+
+    try:
+        from weasyprint.urls import URLFetcher, URLFetcherResponse
+    except ImportError:
+        # WeasyPrint < 68: fetchers are functions returning a dict
+        from weasyprint import default_url_fetcher
+
+        def fetch(url: str) -> dict:
+            path = local_path(url)
+            if path is None:
+                return default_url_fetcher(url)
+            asset = cache.load(path)
+            return {
+                "string": asset.data,
+                "mime_type": asset.mime,
+                "redirected_url": url,
+            }
+
+        return fetch
+
+    class _CachedFetcher(URLFetcher):
+        def fetch(self, url, headers=None):
+            path = local_path(url)
+            if path is None:
+                return super().fetch(url, headers)
+            asset = cache.load(path)
+            return URLFetcherResponse(url, asset.data, {"Content-Type": asset.mime})
+
+    return _CachedFetcher()
@@ -0,0 +1,257 @@
+"""Batch conversion of many CVs across a pool of warm worker processes."""
+
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from md2cv.cache import BuildCache
+from md2cv.models import CVData
+from md2cv.stats import RenderStats
+from md2cv.themes import get_theme
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchOptions:
+    """Rendering options shared by every file in a batch."""
+
+    page_size: str = "a4"
+    theme_name: str = "professional"
+    auto_fit: bool = True
+    fit_strategy: str = "search"
+    use_cache: bool = True
+    fit_model: str | None = None
+    emit_html: bool = False
+    html_only: bool = False
+    skip_unchanged: bool = False
+
+    def digest_options(self) -> dict:
+        """Options that affect the outputs, for BuildCache.digest."""
+        return {
+            "theme": self.theme_name,
+            "page_size": self.page_size,
+            "auto_fit": self.auto_fit,
+            "fit_strategy": self.fit_strategy,
+            "emit_html": self.emit_html,
+            "html_only": self.html_only,
+        }
+
+
+@dataclass
+class BatchResult:
+    """Outcome of converting one input file."""
+
+    input_path: Path
+    outputs: list[Path] = field(default_factory=list)
+    error: str | None = None
+    seconds: float = 0.0
+    stats: RenderStats = field(default_factory=RenderStats)
+    skipped: bool = False  # Up to date; nothing was rendered
+    # What auto-fit learned, for the parent's --fit-model (see run_batch)
+    observations: list = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def collect_inputs(specs: Iterable[str]) -> Iterator[Path]:
+    """Expand directories (their ``*.md`` files), globs and plain paths."""
+    for spec in specs:
+        path = Path(spec)
+        if path.is_dir():
+            yield from sorted(path.glob("*.md"))
+        elif path.is_file():
+            yield path
+        else:
+            for match in sorted(glob.glob(spec, recursive=True)):
+                if Path(match).is_file():
+                    yield Path(match)
+
+
+def output_base(input_path: Path, out_dir: Path | None) -> Path:
+    """Return the output path (without suffix) for an input file."""
+    if out_dir is None:
+        return input_path.with_suffix("")
+    return out_dir / input_path.stem
+
+
+# Per-process state, populated by _init_worker.
+_worker: dict = {}
+
+
+def _init_worker(options: BatchOptions) -> None:
+    """Load the theme and warm up WeasyPrint once per worker process."""
+    from md2cv.cache import FitCache
+    from md2cv.estimate import FitEstimator
+
+    theme = get_theme(options.theme_name)
+    # Starts from the saved model; what it learns goes back to run_batch
+    estimator = None
+    if options.fit_model:
+        estimator = (
+            FitEstimator.load(options.fit_model)
+            if Path(options.fit_model).is_file()
+            else FitEstimator()
+        )
+    _worker.update(
+        options=options,
+        theme=theme,
+        estimator=estimator,
+        fit_cache=FitCache() if options.use_cache else None,
+    )
+    if not options.html_only:
+        from md2cv.context import get_render_context
+        from md2cv.renderer import render_body
+
+        try:
+            body = render_body(CVData(name="warm-up"), theme)
+            get_render_context().render(body, theme.default_style, theme)
+        except Exception:
+            # Leave the error to surface per file rather than break the pool.
+            logger.debug("WeasyPrint warm-up failed", exc_info=True)
+
+
+def _convert_one(input_path: Path, base: Path) -> BatchResult:
+    """Convert a single file inside a worker, capturing any failure."""
+    from md2cv.parser import parse_cv
+    from md2cv.pdf import generate_pdf
+    from md2cv.renderer import render_html
+
+    options: BatchOptions = _worker["options"]
+    theme = _worker["theme"]
+    result = BatchResult(input_path=input_path)
+    stats = result.stats
+    start = time.perf_counter()
+    try:
+        with stats.stage("parse"):
+            cv = parse_cv(input_path.read_text(encoding="utf-8"))
+        base.parent.mkdir(parents=True, exist_ok=True)
+        if not options.html_only:
+            pdf_path = base.with_suffix(".pdf")
+            generate_pdf(
+                cv,
+                output_path=pdf_path,
+                page_size=options.page_size,
+                auto_fit=options.auto_fit,
+                fit_strategy=options.fit_strategy,
+                fit_cache=_worker["fit_cache"],
+                estimator=_worker["estimator"],
+                theme=theme,
+                stats=stats,
+            )
+            result.outputs.append(pdf_path)
+        if options.html_only or options.emit_html:
+            html_path = base.with_suffix(".html")
+            with stats.stage("render_html"):
+                html = render_html(cv, theme=theme)
+            html_path.write_text(html, encoding="utf-8")
+            result.outputs.append(html_path)
+    except Exception as exc:
+        # Reported per file; one bad CV must not abort the batch.
+        result.error = f"{type(exc).__name__}: {exc}"
+    if _worker["estimator"] is not None:
+        result.observations = _worker["estimator"].take_new()
+    result.seconds = time.perf_counter() - start
+    stats.sample_rss()
+    return result
+
+
+def run_batch(
+    inputs: Iterable[Path],
+    options: BatchOptions,
+    out_dir: Path | None = None,
+    jobs: int | None = None,
+) -> Iterator[BatchResult]:
+    """Convert many files in a process pool, yielding results as they finish.
+
+    At most ``2 * jobs`` files are in flight at once, so memory stays
+    bounded however many inputs there are. A failing file yields a result
+    with ``error`` set and does not stop the batch. With
+    ``options.skip_unchanged``, files whose inputs match the last
+    successful build yield a ``skipped`` result without being rendered.
+    An input whose output base (see output_base) was already taken by
+    another file, e.g. ``a/cv.md`` and ``b/cv.md`` with one ``out_dir``,
+    yields an error instead of overwriting that file's outputs; an input
+    listed twice is converted once.
+    With ``options.fit_model``, the auto-fit observations of every worker
+    are collected here and the model is saved once, at the end.
+    """
+    from md2cv.estimate import FitEstimator
+
+    get_theme(options.theme_name)  # Fail fast on an unknown theme
+    jobs = jobs or os.cpu_count() or 1
+    window = 2 * jobs
+    pending: dict[Future, tuple[Path, str | None]] = {}
+    builds = BuildCache() if options.skip_unchanged else None
+    estimator = None
+    if options.fit_model and not options.html_only:
+        estimator = (
+            FitEstimator.load(options.fit_model)
+            if Path(options.fit_model).is_file()
+            else FitEstimator()
+        )
+    learned = False
+    # Output base -> the input writing it
+    claimed: dict[Path, Path] = {}
+
+    def finished(done: set[Future]) -> Iterator[BatchResult]:
+        nonlocal learned
+        for future in done:
+            base, digest = pending.pop(future)
+            result = future.result()
+            if digest is not None and result.ok:
+                builds.record(base, digest, result.outputs)
+            if estimator is not None and result.observations:
+                estimator.merge(result.observations)
+                learned = True
+            yield result
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(options,)
+        ) as pool:
+            for input_path in inputs:
+                base = output_base(input_path, out_dir)
+                owner = claimed.get(base.resolve())
+                if owner is not None:
+                    if owner != input_path.resolve():
+                        yield BatchResult(
+                            input_path=input_path,
+                            error=f"Output {base} is already written for {owner}",
+                        )
+                    continue
+                claimed[base.resolve()] = input_path.resolve()
+                digest = None
+                if builds is not None:
+                    try:
+                        digest = builds.digest(
+                            input_path.read_bytes(),
+                            options.theme_name,
+                            options.digest_options(),
+                        )
+                    except OSError:
+                        pass  # Let the worker report the unreadable file
+                    else:
+                        if builds.up_to_date(base, digest):
+                            yield BatchResult(input_path=input_path, skipped=True)
+                            continue
+                pending[pool.submit(_convert_one, input_path, base)] = (base, digest)
+                if len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from finished(done)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished(done)
+    finally:
+        # Also after a failure or an early stop: keep what was learned
+        if learned:
+            estimator.save(options.fit_model)
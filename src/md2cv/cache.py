@@ -0,0 +1,207 @@
+"""Persistent on-disk caches: auto-fit results and build stamps."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import NamedTuple
+
+from md2cv import __version__
+from md2cv.models import CVData, StyleParams
+from md2cv.themes import Theme, theme_files
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def default_cache_dir() -> Path:
+    """Return md2cv's cache directory (``$XDG_CACHE_HOME/md2cv``)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "md2cv"
+
+
+class FitEntry(NamedTuple):
+    """A cached auto-fit result."""
+
+    factor: float
+    fill: float
+
+
+class FitCache:
+    """Maps a CV/theme/page-size digest to the best auto-fit factor.
+
+    Entries are small JSON files; reading one refreshes its mtime, and the
+    least recently used entries are evicted beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.directory = (
+            Path(directory) if directory else default_cache_dir() / "fit"
+        )
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(
+        cv: CVData,
+        theme: Theme,
+        base_style: StyleParams,
+        tolerance: float,
+    ) -> str:
+        """Digest everything that affects the auto-fit result.
+
+        Theme assets such as bundled fonts change text metrics, so their
+        sizes and mtimes are part of the key.
+        """
+        payload = json.dumps(
+            {
+                "cv": asdict(cv),
+                "theme": theme.name,
+                "template": theme.template_string,
+                "css": [theme.static_css, theme.style_string],
+                "files": {str(p): _file_state(p) for p in theme_files(theme.name)},
+                "style": asdict(base_style),
+                "tolerance": tolerance,
+                "version": __version__,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> FitEntry | None:
+        """Return the cached entry for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = FitEntry(float(data["factor"]), float(data["fill"]))
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry
+
+    def put(self, key: str, factor: float, fill: float) -> None:
+        """Store an entry, evicting the least recently used beyond the limit."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps({"factor": factor, "fill": fill}), encoding="utf-8"
+            )
+            tmp.replace(path)
+            self._evict()
+        except OSError:
+            # A read-only or full cache must never fail a render.
+            pass
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _evict(self) -> None:
+        entries = list(self.directory.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+
+class BuildCache:
+    """Make-style record of the inputs each output was last built from.
+
+    For each output base (the output path without its suffix) a small
+    JSON stamp holds a digest of the inputs and the size and mtime of the
+    files written. An output is up to date when the digest matches and
+    those files are still there, unchanged.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = (
+            Path(directory) if directory else default_cache_dir() / "builds"
+        )
+        self._theme_digests: dict[str, str] = {}
+
+    def digest(
+        self,
+        markdown: str | bytes,
+        theme_name: str,
+        options: dict,
+        photo: str | Path | None = None,
+    ) -> str:
+        """Digest the markdown, photo, theme files, options and md2cv version."""
+        if isinstance(markdown, str):
+            markdown = markdown.encode("utf-8")
+        h = hashlib.sha256()
+        for part in (
+            __version__.encode(),
+            json.dumps(options, sort_keys=True).encode(),
+            self._theme_digest(theme_name).encode(),
+            _file_digest(photo).encode() if photo else b"",
+            markdown,
+        ):
+            # Length-prefixed, so parts cannot run into each other
+            h.update(len(part).to_bytes(8, "big"))
+            h.update(part)
+        return h.hexdigest()
+
+    def up_to_date(self, base: Path, digest: str) -> bool:
+        """Whether ``base`` was last built from inputs with this digest."""
+        try:
+            stamp = json.loads(self._path(base).read_text(encoding="utf-8"))
+            if stamp["digest"] != digest:
+                return False
+            return all(
+                _file_state(Path(path)) == state
+                for path, state in stamp["outputs"].items()
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def record(self, base: Path, digest: str, outputs: list[Path]) -> None:
+        """Remember that ``outputs`` were built from inputs with this digest."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stamp = {
+                "digest": digest,
+                "outputs": {str(p.resolve()): _file_state(p) for p in outputs},
+            }
+            path = self._path(base)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(stamp), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            # A read-only or full cache must never fail a render.
+            pass
+
+    def _path(self, base: Path) -> Path:
+        name = hashlib.sha256(str(Path(base).resolve()).encode("utf-8"))
+        return self.directory / f"{name.hexdigest()}.json"
+
+    def _theme_digest(self, name: str) -> str:
+        if name not in self._theme_digests:
+            self._theme_digests[name] = hashlib.sha256(
+                "".join(_file_digest(path) for path in theme_files(name)).encode()
+            ).hexdigest()
+        return self._theme_digests[name]
+
+
+def _file_digest(path: str | Path) -> str:
+    """Return the SHA-256 of a file's contents ("missing" if unreadable)."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _file_state(path: Path) -> list[int] | None:
+    """Return a file's [size, mtime_ns], or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
@@ -2,21 +2,54 @@
 
 from __future__ import annotations
 
+import json
+import os
+import time
 from pathlib import Path
 
 import click
 
 from md2cv import __version__
+from md2cv.photo import DEFAULT_DPI, DEFAULT_QUALITY
 
 
-@click.command()
-@click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
+class _DefaultGroup(click.Group):
+    """Command group that falls back to ``convert`` for unknown arguments.
+
+    Keeps ``md2cv resume.md ...`` working alongside subcommands.
+    """
+
+    default_command = "convert"
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if args and args[0] not in self.commands and args[0] not in (
+            "--help",
+            "--version",
+        ):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_DefaultGroup)
+@click.version_option(version=__version__)
+def main() -> None:
+    """Markdown to CV/resume converter with auto-fit PDF generation.
+
+    md2cv INPUT_FILE is shorthand for md2cv convert INPUT_FILE.
+    """
+
+
+@main.command()
+@click.argument(
+    "input_file", type=click.Path(exists=True, dir_okay=False, allow_dash=True)
+)
 @click.option(
     "-o",
     "--output",
-    type=click.Path(dir_okay=False),
+    type=click.Path(dir_okay=False, allow_dash=True),
     default=None,
-    help="Output file path (default: <input_stem>.pdf)",
+    help="Output file path, or - for stdout (default: <input_stem>.pdf, "
+    "or stdout when reading stdin)",
 )
 @click.option(
     "--html",
@@ -31,81 +64,736 @@ from md2cv import __version__
 )
 @click.option(
     "--page-size",
+    "page_sizes",
     type=click.Choice(["a4", "letter"], case_sensitive=False),
-    default="a4",
-    help="Page size for PDF output.",
+    multiple=True,
+    default=["a4"],
+    help="Page size for PDF output. Repeat to render several sizes.",
 )
 @click.option(
     "--no-auto-fit",
     is_flag=True,
     help="Disable auto-shrink to fit content on one page.",
 )
+@click.option(
+    "--fit-strategy",
+    type=click.Choice(["search", "measure"], case_sensitive=False),
+    default="search",
+    help="How auto-fit finds the scale: re-render and search, or measure "
+    "the content height once and confirm the prediction.",
+)
+@click.option(
+    "--fit-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Processes used to try auto-fit scales in parallel.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or update the on-disk auto-fit cache.",
+)
+@click.option(
+    "--fit-model",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="JSON file of earlier auto-fit results used to warm-start the "
+    "search; updated after the run.",
+)
 @click.option(
     "--photo",
     type=click.Path(exists=True, dir_okay=False),
     default=None,
     help="Path to a portrait photo (JPEG/PNG) to embed in the CV.",
 )
+@click.option(
+    "--photo-dpi",
+    type=click.IntRange(min=72),
+    default=DEFAULT_DPI,
+    show_default=True,
+    help="Resolution the photo is downscaled to, at its printed size.",
+)
+@click.option(
+    "--photo-quality",
+    type=click.IntRange(1, 95),
+    default=DEFAULT_QUALITY,
+    show_default=True,
+    help="JPEG quality of the embedded photo.",
+)
 @click.option(
     "--theme",
-    default="professional",
-    help="Theme to use for rendering.",
+    "themes",
+    multiple=True,
+    default=["professional"],
+    help="Theme to use for rendering. Repeat to render several themes.",
 )
-@click.version_option(version=__version__)
-def main(
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes used when rendering several themes or page "
+    "sizes (default: one per variant, up to the CPU count).",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and rebuild whenever the input, photo or theme "
+    "files change.",
+)
+@click.option(
+    "--stats",
+    "show_stats",
+    is_flag=True,
+    help="Report per-stage timings, the auto-fit trace, output size and "
+    "peak memory on stderr.",
+)
+@click.option(
+    "--stats-format",
+    type=click.Choice(["text", "json"], case_sensitive=False),
+    default="text",
+    show_default=True,
+    help="Format of the --stats report.",
+)
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    help="Do nothing if the markdown, photo, theme, options and md2cv "
+    "version are unchanged since the outputs were last built.",
+)
+@click.option(
+    "--profile",
+    "profile_dir",
+    type=click.Path(file_okay=False),
+    envvar="MD2CV_PROFILE",
+    default=None,
+    help="Profile each pipeline stage and write pstats files and "
+    "flamegraph-compatible collapsed stacks to this directory "
+    "[env: MD2CV_PROFILE].",
+)
+def convert(
     input_file: str,
     output: str | None,
     emit_html: bool,
     html_only: bool,
-    page_size: str,
+    page_sizes: tuple[str, ...],
     no_auto_fit: bool,
+    fit_strategy: str,
+    fit_workers: int,
+    no_cache: bool,
+    fit_model: str | None,
     photo: str | None,
-    theme: str,
+    photo_dpi: int,
+    photo_quality: int,
+    themes: tuple[str, ...],
+    jobs: int | None,
+    watch: bool,
+    show_stats: bool,
+    stats_format: str,
+    skip_unchanged: bool,
+    profile_dir: str | None,
 ) -> None:
     """Convert a Markdown CV/resume to PDF or HTML.
 
-    INPUT_FILE is the path to a Markdown (.md) file containing your CV.
+    INPUT_FILE is the path to a Markdown (.md) file containing your CV, or
+    - to read it from stdin. With several --theme or --page-size values,
+    every combination is rendered in parallel as
+    <output_stem>-<theme>-<page_size>.pdf.
     """
-    from md2cv.parser import parse_cv
-    from md2cv.pdf import generate_pdf
+    from md2cv.cache import BuildCache, FitCache
+    from md2cv.estimate import FitEstimator, FitPrior
+    from md2cv.fanout import FanoutOptions
+    from md2cv.parser import parse_cv_incremental
+    from md2cv.pdf import FitResult, generate_pdf, write_pdf
+    from md2cv.photo import load_photo
     from md2cv.renderer import render_html
+    from md2cv.stats import RenderStats
+    from md2cv.themes import get_theme
 
-    input_path = Path(input_file)
-    markdown_text = input_path.read_text(encoding="utf-8")
-
-    # Parse
-    cv = parse_cv(markdown_text)
+    if not show_stats:
+        stats_format = None
+    read_stdin = input_file == "-"
+    to_stdout = output == "-" or (read_stdin and not output)
+    if watch and (read_stdin or to_stdout):
+        raise click.UsageError("--watch needs files, not stdin/stdout.")
+    if emit_html and to_stdout:
+        raise click.UsageError("--html cannot be combined with output to stdout.")
+    if skip_unchanged and to_stdout:
+        raise click.UsageError("--skip-unchanged needs an output file.")
+    input_path = None if read_stdin else Path(input_file)
+    page_sizes = [size.lower() for size in page_sizes]
+    fan_out = len(set(themes)) > 1 or (len(set(page_sizes)) > 1 and not html_only)
+    if fan_out:
+        if to_stdout or watch:
+            raise click.UsageError(
+                "Several themes or page sizes need file output and no --watch."
+            )
+        if profile_dir or fit_model:
+            raise click.UsageError(
+                "--profile and --fit-model cannot be combined with several "
+                "themes or page sizes."
+            )
+    theme, page_size = themes[0], page_sizes[0]
 
-    # Attach photo if provided
-    if photo:
-        cv.photo_path = photo
+    def read_source() -> str:
+        if read_stdin:
+            return click.get_binary_stream("stdin").read().decode("utf-8")
+        return input_path.read_text(encoding="utf-8")
 
-    # Determine output path
-    if output:
+    # Determine output path (None: stdout)
+    if to_stdout:
+        out = None
+    elif output:
         out = Path(output)
     else:
         suffix = ".html" if html_only else ".pdf"
         out = input_path.with_suffix(suffix)
 
-    # Generate outputs
-    if html_only:
-        html_str = render_html(cv, theme_name=theme)
-        html_path = out.with_suffix(".html")
-        html_path.write_text(html_str, encoding="utf-8")
-        click.echo(f"HTML written to {html_path}")
-    else:
-        pdf_path = out.with_suffix(".pdf")
-        generate_pdf(
-            cv,
-            output_path=pdf_path,
+    estimator = None
+    if fit_model and not html_only:
+        estimator = (
+            FitEstimator.load(fit_model)
+            if Path(fit_model).is_file()
+            else FitEstimator()
+        )
+    fit_cache = None if no_cache else FitCache()
+
+    def build(cv, stats: RenderStats, prior=None) -> FitResult | None:
+        # Attach photo if provided, sized for the theme's photo box
+        embedded = None
+        if photo:
+            cv.photo_path = photo
+            with stats.stage("photo"):
+                embedded = load_photo(
+                    photo, get_theme(theme).photo_size, photo_dpi, photo_quality
+                )
+
+        # Generate outputs
+        if html_only:
+            with stats.stage("render_html"):
+                html_str = render_html(cv, theme_name=theme, photo=embedded)
+            if out is None:
+                data = html_str.encode("utf-8")
+                stdout = click.get_binary_stream("stdout")
+                stdout.write(data)
+                stdout.flush()
+                stats.output_bytes = len(data)
+                return None
+            html_path = out.with_suffix(".html")
+            html_path.write_text(html_str, encoding="utf-8")
+            stats.output_bytes = html_path.stat().st_size
+            click.echo(f"HTML written to {html_path}")
+            return None
+
+        options = dict(
             page_size=page_size,
             auto_fit=not no_auto_fit,
             theme_name=theme,
+            fit_workers=fit_workers,
+            fit_strategy=fit_strategy.lower(),
+            fit_cache=fit_cache,
+            prior=prior,
+            estimator=estimator,
+            stats=stats,
+            photo=embedded,
         )
-        click.echo(f"PDF written to {pdf_path}")
+        if out is None:
+            # Stream the PDF straight into the pipe
+            stdout = click.get_binary_stream("stdout")
+            write_pdf(cv, stdout, **options)
+            stdout.flush()
+        else:
+            pdf_path = out.with_suffix(".pdf")
+            generate_pdf(cv, output_path=pdf_path, **options)
+            click.echo(f"PDF written to {pdf_path}")
+        if estimator is not None:
+            estimator.save(fit_model)
 
         if emit_html:
-            html_str = render_html(cv, theme_name=theme)
+            with stats.stage("render_html"):
+                html_str = render_html(cv, theme_name=theme, photo=embedded)
             html_path = out.with_suffix(".html")
             html_path.write_text(html_str, encoding="utf-8")
             click.echo(f"HTML written to {html_path}")
+        return stats.fit
+
+    profiler = None
+    if profile_dir:
+        from md2cv.profiling import Profiler
+
+        profiler = Profiler()
+
+    def new_stats() -> RenderStats:
+        stats = RenderStats()
+        stats.profiler = profiler
+        return stats
+
+    def report(stats: RenderStats) -> None:
+        if profiler is not None:
+            profiler.write(profile_dir)
+            click.echo(f"Profile written to {profile_dir}", err=True)
+        if stats_format is None:
+            return
+        stats.sample_rss()
+        if stats_format.lower() == "json":
+            click.echo(json.dumps(stats.to_dict(), indent=2), err=True)
+        else:
+            click.echo(stats.format_text(), err=True)
+
+    stats = new_stats()
+    source = read_source()
+    with stats.stage("parse"):
+        parsed = parse_cv_incremental(None, source)
+    cv = parsed.cv
+
+    builds = BuildCache() if skip_unchanged else None
+    if builds is not None:
+        # Raw bytes, as run_batch digests them (read_text folds CRLF)
+        raw_source = (
+            input_path.read_bytes() if input_path else source.encode("utf-8")
+        )
+
+    def input_digest(theme_name: str, size: str | None) -> str:
+        # Same options and source bytes as run_batch, so batch and
+        # convert runs share stamps
+        options = {
+            "theme": theme_name,
+            "page_size": size,
+            "auto_fit": not no_auto_fit,
+            "fit_strategy": fit_strategy.lower(),
+            "emit_html": emit_html,
+            "html_only": html_only,
+        }
+        if photo:
+            options.update(photo_dpi=photo_dpi, photo_quality=photo_quality)
+        return builds.digest(raw_source, theme_name, options, photo)
+
+    if fan_out:
+        if photo:
+            cv.photo_path = photo
+        _convert_variants(
+            cv,
+            themes,
+            [None] if html_only else page_sizes,
+            out.with_suffix(""),
+            FanoutOptions(
+                auto_fit=not no_auto_fit,
+                fit_strategy=fit_strategy.lower(),
+                fit_workers=fit_workers,
+                use_cache=not no_cache,
+                emit_html=emit_html,
+                html_only=html_only,
+                photo_dpi=photo_dpi,
+                photo_quality=photo_quality,
+            ),
+            jobs,
+            stats_format,
+            builds,
+            input_digest,
+        )
+        return
+
+    result = None
+    digest = input_digest(theme, page_size) if builds is not None else None
+    if digest is not None and builds.up_to_date(out.with_suffix(""), digest):
+        click.echo(f"{out} is up to date; skipped.")
+    else:
+        result = build(cv, stats)
+        if digest is not None:
+            outputs = [out.with_suffix(".html" if html_only else ".pdf")]
+            if emit_html and not html_only:
+                outputs.append(out.with_suffix(".html"))
+            builds.record(out.with_suffix(""), digest, outputs)
+        report(stats)
+    if not watch:
+        if profiler is not None:
+            profiler.close()
+        return
+
+    from md2cv.themes import theme_files
+    from md2cv.watch import watch as watch_files
+
+    watched = [input_path, *theme_files(theme)]
+    if photo:
+        watched.append(Path(photo))
+
+    def rebuild(changed: list[Path]) -> None:
+        nonlocal parsed, cv, result
+        start = time.perf_counter()
+        stats = new_stats()
+        try:
+            # Only sections whose source changed are parsed again
+            with stats.stage("parse"):
+                parsed = parse_cv_incremental(parsed, read_source())
+            new_cv = parsed.cv
+            new_cv.photo_path = cv.photo_path
+            if changed == [input_path] and new_cv == cv:
+                click.echo("No content changes; skipped rebuild.")
+                return
+            # Start auto-fit from the previous best scale
+            prior = FitPrior(result.factor, result.factor) if result else None
+            result = build(new_cv, stats, prior)
+            cv = new_cv
+        except Exception as exc:
+            # Keep watching so the next save can fix the error.
+            click.echo(f"Error: {exc}", err=True)
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        click.echo(f"Rebuilt in {elapsed:.0f} ms")
+        report(stats)
+
+    click.echo(f"Watching {input_path} for changes (Ctrl+C to stop)...")
+    try:
+        watch_files(watched, rebuild)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if profiler is not None:
+            profiler.close()
+
+
+def _convert_variants(
+    cv,
+    themes,
+    page_sizes,
+    base: Path,
+    options,
+    jobs: int | None,
+    stats_format: str | None,
+    builds=None,
+    input_digest=None,
+) -> None:
+    """Render every theme/page-size combination and report like ``batch``.
+
+    With a BuildCache, variants whose ``input_digest(theme, page_size)``
+    matches their last build are skipped.
+    """
+    from md2cv.fanout import render_variants, variant_base, variants
+
+    combos = variants(themes, page_sizes)
+    digests = {}
+    if builds is not None:
+        digests = {v: input_digest(*v) for v in combos}
+        combos = [
+            v
+            for v in combos
+            if not builds.up_to_date(variant_base(base, v), digests[v])
+        ]
+    skipped = len(digests) - len(combos)
+    rendered = failed = 0
+    all_stats = []
+    try:
+        results = (
+            render_variants(cv, combos, base, options, jobs=jobs) if combos else []
+        )
+        for result in results:
+            label = "/".join(filter(None, result.variant))
+            if result.ok:
+                rendered += 1
+                all_stats.append(result.stats)
+                if builds is not None:
+                    builds.record(
+                        variant_base(base, result.variant),
+                        digests[result.variant],
+                        result.outputs,
+                    )
+                outputs = ", ".join(str(p) for p in result.outputs)
+                click.echo(f"{label} -> {outputs}")
+            else:
+                failed += 1
+                click.echo(f"{label}: {result.error}", err=True)
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+
+    if builds is not None:
+        click.echo(
+            f"Rendered {rendered} variant(s), {skipped} unchanged, {failed} failed."
+        )
+    else:
+        click.echo(f"Rendered {rendered} variant(s), {failed} failed.")
+    if stats_format is not None and all_stats:
+        from md2cv.stats import format_summary, summarize
+
+        summary = summarize(all_stats)
+        if stats_format.lower() == "json":
+            click.echo(json.dumps(summary, indent=2), err=True)
+        else:
+            click.echo(format_summary(summary), err=True)
+    if failed:
+        raise SystemExit(1)
+
+
+@main.command()
+@click.argument("inputs", nargs=-1, required=True)
+@click.option(
+    "--out-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory for outputs (default: next to each input).",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help="Number of worker processes.",
+)
+@click.option(
+    "--html",
+    "emit_html",
+    is_flag=True,
+    help="Also produce an HTML file alongside each PDF.",
+)
+@click.option(
+    "--html-only",
+    is_flag=True,
+    help="Produce only HTML output, skip PDF generation.",
+)
+@click.option(
+    "--page-size",
+    type=click.Choice(["a4", "letter"], case_sensitive=False),
+    default="a4",
+    help="Page size for PDF output.",
+)
+@click.option(
+    "--no-auto-fit",
+    is_flag=True,
+    help="Disable auto-shrink to fit content on one page.",
+)
+@click.option(
+    "--fit-strategy",
+    type=click.Choice(["search", "measure"], case_sensitive=False),
+    default="search",
+    help="How auto-fit finds the scale.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or update the on-disk auto-fit cache.",
+)
+@click.option(
+    "--fit-model",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="JSON file of earlier auto-fit results used to warm-start the search.",
+)
+@click.option(
+    "--theme",
+    default="professional",
+    help="Theme to use for rendering.",
+)
+@click.option(
+    "--stats",
+    "show_stats",
+    is_flag=True,
+    help="Report per-stage timing histograms across all files on stderr.",
+)
+@click.option(
+    "--stats-format",
+    type=click.Choice(["text", "json"], case_sensitive=False),
+    default="text",
+    show_default=True,
+    help="Format of the --stats report.",
+)
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    help="Skip files whose markdown, theme, options and md2cv version are "
+    "unchanged since their outputs were last built.",
+)
+def batch(
+    inputs: tuple[str, ...],
+    out_dir: str | None,
+    jobs: int,
+    emit_html: bool,
+    html_only: bool,
+    page_size: str,
+    no_auto_fit: bool,
+    fit_strategy: str,
+    no_cache: bool,
+    fit_model: str | None,
+    theme: str,
+    show_stats: bool,
+    stats_format: str,
+    skip_unchanged: bool,
+) -> None:
+    """Convert many Markdown CVs in parallel.
+
+    INPUTS are Markdown files, directories (all *.md files inside) or glob
+    patterns. Each file is reported as it finishes; failures are listed
+    without stopping the batch.
+    """
+    from md2cv.batch import BatchOptions, collect_inputs, run_batch
+
+    if not show_stats:
+        stats_format = None
+
+    options = BatchOptions(
+        page_size=page_size,
+        theme_name=theme,
+        auto_fit=not no_auto_fit,
+        fit_strategy=fit_strategy.lower(),
+        use_cache=not no_cache,
+        fit_model=fit_model,
+        emit_html=emit_html,
+        html_only=html_only,
+        skip_unchanged=skip_unchanged,
+    )
+    try:
+        results = run_batch(
+            collect_inputs(inputs),
+            options,
+            out_dir=Path(out_dir) if out_dir else None,
+            jobs=jobs,
+        )
+        converted = skipped = failed = 0
+        all_stats = []
+        for result in results:
+            if result.skipped:
+                skipped += 1
+            elif result.ok:
+                converted += 1
+                all_stats.append(result.stats)
+                outputs = ", ".join(str(p) for p in result.outputs)
+                click.echo(f"{result.input_path} -> {outputs}")
+            else:
+                failed += 1
+                click.echo(f"{result.input_path}: {result.error}", err=True)
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+
+    if skip_unchanged:
+        click.echo(
+            f"Converted {converted} file(s), {skipped} unchanged, {failed} failed."
+        )
+    else:
+        click.echo(f"Converted {converted} file(s), {failed} failed.")
+    if stats_format is not None and all_stats:
+        from md2cv.stats import format_summary, summarize
+
+        summary = summarize(all_stats)
+        if stats_format.lower() == "json":
+            click.echo(json.dumps(summary, indent=2), err=True)
+        else:
+            click.echo(format_summary(summary), err=True)
+    if failed:
+        raise SystemExit(1)
+
+
+@main.command()
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    show_default=True,
+    help="Address to bind.",
+)
+@click.option(
+    "--port",
+    type=int,
+    default=8000,
+    show_default=True,
+    help="TCP port to listen on.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Listen on a Unix socket instead of TCP.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help="Number of warm worker processes (concurrent renders).",
+)
+@click.option(
+    "--max-queue",
+    type=click.IntRange(min=0),
+    default=64,
+    show_default=True,
+    help="Requests allowed to wait for a worker before new ones get 503.",
+)
+@click.option(
+    "--max-body",
+    type=click.IntRange(min=1),
+    default=16 * 1024 * 1024,
+    show_default=True,
+    help="Largest request body in bytes; larger ones get 413.",
+)
+def serve(
+    host: str,
+    port: int,
+    socket_path: str | None,
+    workers: int,
+    max_queue: int,
+    max_body: int,
+) -> None:
+    """Run a render server with a pool of warm workers.
+
+    POST markdown to /render (?format=pdf|html&theme=...&page_size=...) to
+    get PDF or HTML back; GET /health reports queue depth and latencies.
+    """
+    from md2cv.server import RenderService, make_server
+
+    service = RenderService(
+        workers=workers, max_queue=max_queue, max_body=max_body
+    )
+    service.start()
+    server = make_server(service, host=host, port=port, socket_path=socket_path)
+    where = socket_path or f"http://{host}:{server.server_address[1]}"
+    click.echo(f"md2cv serving on {where} with {workers} worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+@main.command()
+@click.option(
+    "--theme",
+    "themes",
+    multiple=True,
+    help="Theme to warm up (default: all). Repeat for several.",
+)
+@click.option(
+    "--no-font-cache",
+    is_flag=True,
+    help="Do not run fc-cache.",
+)
+@click.option(
+    "--html-only",
+    is_flag=True,
+    help="Skip the WeasyPrint layout, e.g. where only HTML is rendered.",
+)
+def warmup(themes: tuple[str, ...], no_font_cache: bool, html_only: bool) -> None:
+    """Prepare caches so the first render is as fast as later ones.
+
+    Builds fontconfig's font cache, checks each theme's bundled fonts and
+    renders every theme once, which fills the on-disk template cache. Run
+    it when building an image, e.g. RUN md2cv warmup in a Dockerfile.
+    """
+    from md2cv.warmup import warm_up
+
+    failed = 0
+    try:
+        for step in warm_up(
+            list(themes) or None, font_cache=not no_font_cache, pdf=not html_only
+        ):
+            if step.error:
+                failed += 1
+                click.echo(f"{step.name}: {step.error}", err=True)
+                continue
+            detail = f" ({step.detail})" if step.detail else ""
+            click.echo(f"{step.name}: {step.seconds * 1000:.0f} ms{detail}")
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    if failed:
+        raise SystemExit(1)
@@ -0,0 +1,97 @@
+"""Shared WeasyPrint state for repeated renders in one thread."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from md2cv.assets import AssetCache, get_asset_cache, url_fetcher
+from md2cv.models import StyleParams
+from md2cv.renderer import render_style, wrap_document
+from md2cv.themes import Theme
+
+# Parsed static stylesheets kept per context; edited or user themes in a
+# long-running process would otherwise pile up old ones
+MAX_STATIC_SHEETS = 16
+
+
+class RenderContext:
+    """Reusable WeasyPrint resources for rendering many documents.
+
+    Holds a single FontConfiguration, each theme's static CSS parsed once
+    into a ``weasyprint.CSS``, and a URL fetcher per theme that serves
+    ``theme-asset:`` and local files from an AssetCache. Each render then
+    only parses the small StyleParams-dependent stylesheet, and fonts and
+    images are read from disk once per process.
+    """
+
+    def __init__(self, assets: AssetCache | None = None) -> None:
+        from weasyprint.text.fonts import FontConfiguration
+
+        self.font_config = FontConfiguration()
+        self.assets = assets or get_asset_cache()
+        self._static_sheets: OrderedDict[tuple, object] = OrderedDict()
+        self._fetchers: dict[tuple[str, Path | None], object] = {}
+
+    def url_fetcher(self, theme: Theme):
+        """Return the cached URL fetcher for a theme's assets."""
+        key = (theme.name, theme.directory)
+        fetcher = self._fetchers.get(key)
+        if fetcher is None:
+            fetcher = self._fetchers[key] = url_fetcher(theme, self.assets)
+        return fetcher
+
+    def static_stylesheet(self, theme: Theme):
+        """Return the theme's static CSS as a parsed ``weasyprint.CSS``.
+
+        The MAX_STATIC_SHEETS most recently used sheets are kept.
+        """
+        from weasyprint import CSS
+
+        key = (theme.name, theme.directory, theme.static_css)
+        sheet = self._static_sheets.get(key)
+        if sheet is not None:
+            self._static_sheets.move_to_end(key)
+            return sheet
+        sheet = CSS(
+            string=theme.static_css,
+            font_config=self.font_config,
+            url_fetcher=self.url_fetcher(theme),
+        )
+        self._static_sheets[key] = sheet
+        while len(self._static_sheets) > MAX_STATIC_SHEETS:
+            self._static_sheets.popitem(last=False)
+        return sheet
+
+    def render(self, body: str, style: StyleParams, theme: Theme):
+        """Lay out body markup at a style and return the WeasyPrint Document."""
+        from weasyprint import CSS, HTML
+
+        fetcher = self.url_fetcher(theme)
+        style_sheet = CSS(
+            string=render_style(style, theme),
+            font_config=self.font_config,
+            url_fetcher=fetcher,
+        )
+        return HTML(string=wrap_document(body), url_fetcher=fetcher).render(
+            stylesheets=[self.static_stylesheet(theme), style_sheet],
+            font_config=self.font_config,
+        )
+
+
+# Per-thread contexts: WeasyPrint's FontConfiguration, parsed stylesheets
+# and URL fetchers must not be shared between threads.
+_local = threading.local()
+
+
+def get_render_context() -> RenderContext:
+    """Return this thread's RenderContext, creating it on first use.
+
+    Worker processes render on one thread and so share one context; a
+    thread pool (e.g. the asyncio default executor) gets one per thread.
+    """
+    context = getattr(_local, "context", None)
+    if context is None:
+        context = _local.context = RenderContext()
+    return context
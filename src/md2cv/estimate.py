@@ -0,0 +1,149 @@
+"""Warm-start priors for auto-fit, learned from earlier documents."""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import NamedTuple
+
+from md2cv.models import CVData
+
+DEFAULT_NEIGHBOURS = 5
+DEFAULT_MARGIN = 0.02
+DEFAULT_MAX_OBSERVATIONS = 1000  # Per theme and page size
+
+# (group, features, factor), as recorded by FitEstimator.observe
+Observation = tuple[str, list[float], float]
+
+
+class FitPrior(NamedTuple):
+    """Expected range of the best auto-fit factor."""
+
+    low: float
+    high: float
+
+
+def cv_features(cv: CVData) -> list[float]:
+    """Summarise the content size of a CV.
+
+    Returns:
+        [characters, sections, entries, detail bullets, raw HTML characters].
+    """
+    chars = len(cv.name) + len(cv.subtitle) + sum(len(i) for i in cv.contact.items)
+    entries = details = raw_chars = 0
+    for section in cv.sections:
+        chars += len(section.heading)
+        raw_chars += len(section.raw_html)
+        for entry in section.entries:
+            entries += 1
+            details += len(entry.details)
+            chars += (
+                len(entry.title)
+                + len(entry.organization)
+                + len(entry.date_range)
+                + len(entry.description)
+                + len(entry.tags)
+                + sum(len(d) for d in entry.details)
+            )
+    return [
+        float(chars),
+        float(len(cv.sections)),
+        float(entries),
+        float(details),
+        float(raw_chars),
+    ]
+
+
+class FitEstimator:
+    """Nearest-neighbour estimate of the auto-fit factor from CV features.
+
+    Observations are grouped by theme and page size. The prior spans the
+    factors of the closest earlier documents, widened by ``margin``. A
+    document seen again replaces its earlier observation, and each group
+    keeps only its ``max_observations`` most recent ones.
+    """
+
+    def __init__(
+        self,
+        neighbours: int = DEFAULT_NEIGHBOURS,
+        margin: float = DEFAULT_MARGIN,
+        max_observations: int = DEFAULT_MAX_OBSERVATIONS,
+    ) -> None:
+        self.neighbours = neighbours
+        self.margin = margin
+        self.max_observations = max_observations
+        self.observations: dict[str, list[tuple[list[float], float]]] = {}
+        self._new: list[Observation] = []
+
+    def observe(
+        self, cv: CVData, theme_name: str, page_size: str, factor: float
+    ) -> None:
+        """Record the factor auto-fit chose for a CV."""
+        observation = (_group(theme_name, page_size), cv_features(cv), factor)
+        self._store(*observation)
+        self._new.append(observation)
+
+    def take_new(self) -> list[Observation]:
+        """Return and forget the observations made since the last call.
+
+        Lets a worker process send what it learned to the process that
+        saves the model.
+        """
+        new, self._new = self._new, []
+        return new
+
+    def merge(self, observations: list[Observation]) -> None:
+        """Add observations taken by another estimator (see take_new)."""
+        for observation in observations:
+            self._store(*observation)
+
+    def _store(self, group: str, features: list[float], factor: float) -> None:
+        obs = self.observations.setdefault(group, [])
+        obs[:] = [o for o in obs if o[0] != features]
+        obs.append((features, factor))
+        del obs[: max(0, len(obs) - self.max_observations)]
+
+    def prior(
+        self, cv: CVData, theme_name: str, page_size: str
+    ) -> FitPrior | None:
+        """Estimate the factor range for a CV, or None without enough data."""
+        group = self.observations.get(_group(theme_name, page_size), [])
+        if len(group) < 2:
+            return None
+        target = _log_features(cv_features(cv))
+        nearest = sorted(
+            group, key=lambda obs: math.dist(_log_features(obs[0]), target)
+        )[: self.neighbours]
+        factors = [factor for _, factor in nearest]
+        return FitPrior(
+            low=min(factors) - self.margin,
+            high=min(1.0, max(factors) + self.margin),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the observations to a JSON model file."""
+        data = {
+            group: [{"features": f, "factor": factor} for f, factor in obs]
+            for group, obs in self.observations.items()
+        }
+        Path(path).write_text(json.dumps(data), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path, **kwargs) -> FitEstimator:
+        """Read an estimator from a JSON model file written by ``save``."""
+        estimator = cls(**kwargs)
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        for group, obs in data.items():
+            for o in obs:
+                estimator._store(group, list(o["features"]), float(o["factor"]))
+        return estimator
+
+
+def _group(theme_name: str, page_size: str) -> str:
+    return f"{theme_name}:{page_size.lower()}"
+
+
+def _log_features(features: list[float]) -> list[float]:
+    # Content sizes span orders of magnitude; compare them on a log scale.
+    return [math.log1p(f) for f in features]
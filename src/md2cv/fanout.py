@@ -0,0 +1,191 @@
+"""Render one CV in several themes and page sizes across worker processes."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+from md2cv.models import CVData
+from md2cv.photo import DEFAULT_DPI, DEFAULT_QUALITY, EmbeddedPhoto, load_photo
+from md2cv.stats import RenderStats
+from md2cv.themes import get_theme, preload_themes
+
+logger = logging.getLogger(__name__)
+
+
+class Variant(NamedTuple):
+    """One theme/page-size combination.
+
+    ``page_size`` is None for HTML-only variants, whose output does not
+    depend on the page size.
+    """
+
+    theme_name: str
+    page_size: str | None
+
+
+@dataclass
+class FanoutOptions:
+    """Rendering options shared by every variant."""
+
+    auto_fit: bool = True
+    fit_strategy: str = "search"
+    fit_workers: int = 1
+    use_cache: bool = True
+    emit_html: bool = False
+    html_only: bool = False
+    photo_dpi: int = DEFAULT_DPI
+    photo_quality: int = DEFAULT_QUALITY
+
+
+@dataclass
+class VariantResult:
+    """Outcome of rendering one variant."""
+
+    variant: Variant
+    outputs: list[Path] = field(default_factory=list)
+    error: str | None = None
+    seconds: float = 0.0
+    stats: RenderStats = field(default_factory=RenderStats)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def variants(
+    themes: Iterable[str], page_sizes: Iterable[str | None]
+) -> list[Variant]:
+    """Return every theme/page-size combination, without duplicates."""
+    combos = itertools.product(dict.fromkeys(themes), dict.fromkeys(page_sizes))
+    return [Variant(theme, size) for theme, size in combos]
+
+
+def variant_base(base: Path, variant: Variant) -> Path:
+    """Return ``<base>-<theme>-<page size>`` (without suffix) for a variant."""
+    parts = [base.name, variant.theme_name]
+    if variant.page_size:
+        parts.append(variant.page_size)
+    return base.with_name("-".join(parts))
+
+
+# Per-process state, populated by _init_worker.
+_worker: dict = {}
+
+
+def _init_worker(
+    cv: CVData,
+    photos: dict[str, EmbeddedPhoto | None],
+    options: FanoutOptions,
+    theme_names: list[str],
+) -> None:
+    """Receive the parsed CV and photos, load the themes and warm up WeasyPrint."""
+    from md2cv.cache import FitCache
+
+    _worker.update(
+        cv=cv,
+        photos=photos,
+        options=options,
+        fit_cache=FitCache() if options.use_cache else None,
+    )
+    themes = preload_themes(theme_names)
+    if not options.html_only:
+        from md2cv.context import get_render_context
+        from md2cv.renderer import render_body
+
+        try:
+            theme = themes[0]
+            body = render_body(CVData(name="warm-up"), theme)
+            get_render_context().render(body, theme.default_style, theme)
+        except Exception:
+            # Leave the error to surface per variant rather than break the pool.
+            logger.debug("WeasyPrint warm-up failed", exc_info=True)
+
+
+def _render_variant(variant: Variant, base: Path) -> VariantResult:
+    """Render a single variant inside a worker, capturing any failure."""
+    from md2cv.pdf import generate_pdf
+    from md2cv.renderer import render_html
+
+    options: FanoutOptions = _worker["options"]
+    cv: CVData = _worker["cv"]
+    photo = _worker["photos"][variant.theme_name]
+    result = VariantResult(variant=variant)
+    stats = result.stats
+    start = time.perf_counter()
+    try:
+        theme = get_theme(variant.theme_name)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        if not options.html_only:
+            pdf_path = base.with_suffix(".pdf")
+            generate_pdf(
+                cv,
+                output_path=pdf_path,
+                page_size=variant.page_size,
+                auto_fit=options.auto_fit,
+                fit_strategy=options.fit_strategy,
+                fit_workers=options.fit_workers,
+                fit_cache=_worker["fit_cache"],
+                theme=theme,
+                stats=stats,
+                photo=photo,
+            )
+            result.outputs.append(pdf_path)
+        if options.html_only or options.emit_html:
+            html_path = base.with_suffix(".html")
+            with stats.stage("render_html"):
+                html = render_html(cv, theme=theme, photo=photo)
+            html_path.write_text(html, encoding="utf-8")
+            result.outputs.append(html_path)
+    except Exception as exc:
+        # Reported per variant; one failure must not abort the others.
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.seconds = time.perf_counter() - start
+    stats.sample_rss()
+    return result
+
+
+def render_variants(
+    cv: CVData,
+    combos: list[Variant],
+    base: Path,
+    options: FanoutOptions,
+    jobs: int | None = None,
+) -> Iterator[VariantResult]:
+    """Render a CV in every variant, yielding results as they finish.
+
+    The CV is parsed and its photo prepared once per theme, in this
+    process, then handed to at most ``jobs`` worker processes. Outputs are named
+    ``<base>-<theme>-<page size>.pdf`` (and ``.html``), or
+    ``<base>-<theme>.html`` for variants without a page size.
+    """
+    theme_names = list(dict.fromkeys(v.theme_name for v in combos))
+    themes = preload_themes(theme_names)  # Fail fast on an unknown theme
+    # Themes differ in photo size, so each gets its own downscaled copy
+    photos = {
+        theme.name: load_photo(
+            cv.photo_path, theme.photo_size, options.photo_dpi, options.photo_quality
+        )
+        for theme in themes
+    }
+    jobs = min(jobs or os.cpu_count() or 1, len(combos))
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(cv, photos, options, theme_names),
+    ) as pool:
+        pending = {
+            pool.submit(_render_variant, variant, variant_base(base, variant))
+            for variant in combos
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (f.result() for f in done)
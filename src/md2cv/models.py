@@ -47,9 +47,13 @@ class CVData:
     sections: list[CVSection] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True)
 class StyleParams:
-    """All adjustable CSS values for rendering."""
+    """All adjustable CSS values for rendering.
+
+    Frozen, since themes share one instance; derive variants with
+    ``dataclasses.replace``.
+    """
 
     base_font_size: float = 10.0
     heading_font_size: float = 14.0
@@ -2,19 +2,134 @@
 
 from __future__ import annotations
 
+import hashlib
 import html
 import re
+from typing import NamedTuple
 
 import mistune
 
 from md2cv.models import CVData, CVEntry, CVSection, ContactInfo
 
 
+# Parsing keeps no state on the instance between calls, so one is shared.
+_markdown = mistune.create_markdown(renderer="ast")
+
+
 def parse_cv(markdown_text: str) -> CVData:
     """Parse a markdown CV into structured CVData."""
-    md = mistune.create_markdown(renderer="ast")
-    tokens = md(markdown_text)
-    return _walk_tokens(tokens)
+    return _walk_tokens(_markdown(markdown_text))
+
+
+class ParseResult(NamedTuple):
+    """A parsed CV plus the source digests used by parse_cv_incremental."""
+
+    cv: CVData
+    header_digest: str = ""
+    section_digests: tuple[str, ...] = ()
+
+
+# ATX level-2 heading and fenced-code delimiter lines. Only unindented
+# headings split the source: an indented "##" may belong to a list item,
+# and one that does not is caught when its chunk is parsed.
+_H2_LINE = re.compile(r"##(?:[ \t]|$)")
+_FENCE_LINE = re.compile(r" {0,3}(`{3,}|~{3,})(.*)")
+# Constructs that make a section's parse depend on the rest of the document:
+# link reference definitions, and HTML blocks that may swallow a "##" line.
+_NON_LOCAL = re.compile(r"^ {0,3}(?:\[[^\]\n]+\]:|<)", re.MULTILINE)
+
+
+def parse_cv_incremental(
+    previous: ParseResult | None, markdown_text: str
+) -> ParseResult:
+    """Parse a markdown CV, reusing unchanged sections of a previous parse.
+
+    The source is split on H2 headings and each chunk is hashed. Only
+    chunks whose hash is not in ``previous`` are parsed; the CVSection
+    objects of the others are reused as-is. Documents the split cannot
+    handle exactly (link reference definitions, HTML blocks, setext
+    headings) fall back to a full parse.
+
+    Args:
+        previous: Result of an earlier call, or None.
+        markdown_text: The new markdown source.
+
+    Returns:
+        The parse result; pass it back in on the next call.
+    """
+    if _NON_LOCAL.search(markdown_text):
+        return ParseResult(parse_cv(markdown_text))
+
+    header_text, chunks = _split_sections(markdown_text)
+    reusable: dict[str, CVSection] = {}
+    if previous is not None:
+        reusable = dict(zip(previous.section_digests, previous.cv.sections))
+
+    header_digest = _digest(header_text)
+    if previous is not None and previous.header_digest == header_digest:
+        cv = CVData(
+            name=previous.cv.name,
+            subtitle=previous.cv.subtitle,
+            contact=previous.cv.contact,
+        )
+    else:
+        header_tokens = _markdown(header_text)
+        cv = _walk_tokens(header_tokens)
+        if cv.sections or not _has_h1(header_tokens):
+            # Without an H1, parse_cv finds no sections at all; with a
+            # setext H2 the split was wrong. Either way, parse in full.
+            return ParseResult(parse_cv(markdown_text))
+
+    digests: list[str] = []
+    for chunk in chunks:
+        digest = _digest(chunk)
+        section = reusable.get(digest)
+        if section is None:
+            tokens = _markdown(chunk)
+            if any(
+                t["type"] == "heading" and t["attrs"]["level"] <= 2
+                for t in tokens[1:]
+            ):
+                return ParseResult(parse_cv(markdown_text))
+            heading = _extract_text(tokens[0]["children"])
+            section = _parse_section(heading, tokens[1:])
+        cv.sections.append(section)
+        digests.append(digest)
+
+    return ParseResult(cv, header_digest, tuple(digests))
+
+
+def _split_sections(markdown_text: str) -> tuple[str, list[str]]:
+    """Split source into the header and one chunk per ATX H2 heading."""
+    header: list[str] = []
+    chunks: list[list[str]] = []
+    current = header
+    fence: str | None = None
+    for line in markdown_text.splitlines(keepends=True):
+        match = _FENCE_LINE.match(line)
+        if fence is None:
+            if match and not (match.group(1)[0] == "`" and "`" in match.group(2)):
+                fence = match.group(1)
+            elif _H2_LINE.match(line):
+                current = []
+                chunks.append(current)
+        elif (
+            match
+            and match.group(1)[0] == fence[0]
+            and len(match.group(1)) >= len(fence)
+            and not match.group(2).strip()
+        ):
+            fence = None
+        current.append(line)
+    return "".join(header), ["".join(chunk) for chunk in chunks]
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _has_h1(tokens: list[dict]) -> bool:
+    return any(t["type"] == "heading" and t["attrs"]["level"] == 1 for t in tokens)
 
 
 def _walk_tokens(tokens: list[dict]) -> CVData:
@@ -89,123 +204,88 @@ def _walk_tokens(tokens: list[dict]) -> CVData:
 
 
 def _parse_section(heading: str, tokens: list[dict]) -> CVSection:
-    """Parse section tokens into a CVSection with structured entries or raw HTML."""
-    # Try H3-based entries first (CV.md format)
-    entries = _try_parse_h3_entries(tokens)
-    if entries:
-        return CVSection(heading=heading, entries=entries)
-
-    # Try bold-paragraph entries (existing format)
-    entries = _try_parse_entries(tokens)
-    if entries:
-        return CVSection(heading=heading, entries=entries)
-
-    # Fallback: render as raw HTML
-    raw = _tokens_to_html(tokens)
-    return CVSection(heading=heading, raw_html=raw)
+    """Parse section tokens into a CVSection with structured entries or raw HTML.
 
+    Classifies and builds the section in a single pass over its tokens:
 
-def _try_parse_h3_entries(tokens: list[dict]) -> list[CVEntry]:
-    """Try to parse tokens as H3-based CVEntry items.
-
-    Handles CV.md format: ### Title | Date, **Org**, **Skills:** tags, - bullets.
+    - any H3 heading makes it a list of H3 entries (CV.md format);
+    - otherwise bold paragraphs, each optionally followed by a bullet list,
+      are bold-paragraph entries (existing format), up to the first token
+      that breaks the pattern;
+    - otherwise the section is rendered as raw HTML.
     """
-    # Quick check: must have at least one h3
-    if not any(
-        t["type"] == "heading" and t["attrs"].get("level") == 3 for t in tokens
-    ):
-        return []
-
-    entries: list[CVEntry] = []
-    current: CVEntry | None = None
-    i = 0
+    h3_entries: list[CVEntry] = []
+    bold_entries: list[CVEntry] = []
+    current: CVEntry | None = None  # H3 entry receiving the following blocks
+    listable: CVEntry | None = None  # Bold entry a following list belongs to
+    bold_pattern = True
 
-    while i < len(tokens):
-        tok = tokens[i]
+    for tok in tokens:
         t = tok["type"]
-
-        if t in ("blank_line", "thematic_break"):
-            i += 1
+        if t == "blank_line":
             continue
 
         if t == "heading" and tok["attrs"].get("level") == 3:
-            if current is not None:
-                entries.append(current)
-            heading_text = _extract_text(tok["children"])
-            parts = [p.strip() for p in heading_text.split("|")]
-            current = CVEntry(title=parts[0].strip())
-            if len(parts) >= 2:
-                current.date_range = parts[1].strip()
-            i += 1
-            continue
-
-        if t == "paragraph" and current is not None:
-            if _has_bold(tok["children"]):
-                first_strong = _get_first_strong_text(tok["children"])
-                if first_strong.endswith(":"):
-                    # Tags line: e.g., **Skills:** Go, OpenTelemetry, ...
-                    full_text = _extract_text(tok["children"])
-                    colon_idx = full_text.find(":")
-                    current.tags = (
-                        full_text[colon_idx + 1:].strip() if colon_idx >= 0 else full_text
-                    )
-                else:
-                    # Organization line: e.g., **Acme Corp** | New York
-                    full_text = _extract_text(tok["children"])
-                    parts = [p.strip() for p in full_text.split("|") if p.strip()]
-                    current.organization = ", ".join(parts)
-            else:
-                # Plain paragraph: description text
-                current.description = _extract_text(tok["children"]).strip()
-            i += 1
+            current = _parse_h3_heading(tok)
+            h3_entries.append(current)
+        elif current is not None:
+            _add_to_h3_entry(current, tok)
+        elif not bold_pattern:
+            # Keep scanning only for an H3 heading
             continue
+        elif t == "paragraph" and _has_bold(tok["children"]):
+            listable = _parse_entry_header(tok["children"])
+            bold_entries.append(listable)
+        elif t == "list" and listable is not None:
+            listable.details = _extract_list_items(tok)
+            listable = None
+        else:
+            bold_pattern = False
 
-        if t == "list" and current is not None:
-            current.details = _extract_list_items(tok)
-            i += 1
-            continue
+    if h3_entries:
+        return CVSection(heading=heading, entries=h3_entries)
+    if bold_entries:
+        return CVSection(heading=heading, entries=bold_entries)
 
-        # Any other token: skip
-        i += 1
+    # Fallback: render as raw HTML
+    return CVSection(heading=heading, raw_html=_tokens_to_html(tokens))
 
-    if current is not None:
-        entries.append(current)
 
-    return entries
+def _parse_h3_heading(tok: dict) -> CVEntry:
+    """Start an H3 entry from its heading: ### Title | Date."""
+    parts = [p.strip() for p in _extract_text(tok["children"]).split("|")]
+    entry = CVEntry(title=parts[0])
+    if len(parts) >= 2:
+        entry.date_range = parts[1]
+    return entry
 
 
-def _try_parse_entries(tokens: list[dict]) -> list[CVEntry]:
-    """Try to parse tokens as structured CVEntry items.
+def _add_to_h3_entry(entry: CVEntry, tok: dict) -> None:
+    """Add a block following an H3 heading to its entry.
 
-    Looks for pattern: paragraph with **bold** (optionally with | separators)
-    followed by optional bullet list.
+    Handles **Org** lines, **Skills:** tags lines, plain description
+    paragraphs and - bullets; other blocks are ignored.
     """
-    entries: list[CVEntry] = []
-    i = 0
-
-    while i < len(tokens):
-        tok = tokens[i]
-        # Skip blank_line tokens
-        if tok["type"] == "blank_line":
-            i += 1
-            continue
-        if tok["type"] == "paragraph" and _has_bold(tok["children"]):
-            entry = _parse_entry_header(tok["children"])
-            i += 1
-            # Skip blank lines before list
-            while i < len(tokens) and tokens[i]["type"] == "blank_line":
-                i += 1
-            # Check for following list
-            if i < len(tokens) and tokens[i]["type"] == "list":
-                entry.details = _extract_list_items(tokens[i])
-                i += 1
-            entries.append(entry)
-        else:
-            # Not a structured entry pattern — bail out
-            if entries:
-                return entries
-            return []
-    return entries
+    t = tok["type"]
+    if t == "list":
+        entry.details = _extract_list_items(tok)
+        return
+    if t != "paragraph":
+        return
+
+    children = tok["children"]
+    full_text = _extract_text(children)
+    if not _has_bold(children):
+        # Plain paragraph: description text
+        entry.description = full_text.strip()
+    elif _get_first_strong_text(children).endswith(":"):
+        # Tags line: e.g., **Skills:** Go, OpenTelemetry, ...
+        colon_idx = full_text.find(":")
+        entry.tags = full_text[colon_idx + 1:].strip() if colon_idx >= 0 else full_text
+    else:
+        # Organization line: e.g., **Acme Corp** | New York
+        parts = [p.strip() for p in full_text.split("|") if p.strip()]
+        entry.organization = ", ".join(parts)
 
 
 def _has_bold(children: list[dict]) -> bool:
@@ -249,13 +329,11 @@ def _parse_entry_header(children: list[dict]) -> CVEntry:
             first_line.append(child)
 
     # Parse first line: bold title + pipe-separated org/date
-    parts: list[str] = []
     for child in first_line:
         if child["type"] == "strong":
             entry.title = _extract_text(child["children"])
-        parts.append(_extract_text_from_node(child))
 
-    full_text = "".join(parts)
+    full_text = _extract_text(first_line)
 
     # Find everything after the bold title
     title_end = full_text.find(entry.title) + len(entry.title)
@@ -300,35 +378,32 @@ def _extract_list_items(list_token: dict) -> list[str]:
 
 
 def _extract_text(children: list[dict]) -> str:
-    """Recursively extract plain text from AST children."""
+    """Extract plain text from AST children.
+
+    Walks the tree with an explicit stack and joins the pieces once, so
+    deeply nested inline markup costs no recursion.
+    """
     parts: list[str] = []
-    for child in children:
-        parts.append(_extract_text_from_node(child))
+    stack = children[::-1]
+    while stack:
+        node = stack.pop()
+        t = node["type"]
+        if t == "softbreak":
+            parts.append(" ")
+        elif t not in ("text", "codespan") and node.get("children"):
+            stack.extend(reversed(node["children"]))
+        else:
+            parts.append(node.get("raw", node.get("text", "")))
     return "".join(parts)
 
 
 def _extract_text_from_node(node: dict) -> str:
     """Extract text from a single AST node."""
-    if node["type"] == "text":
-        return node.get("raw", node.get("text", ""))
-    if node["type"] == "codespan":
-        return node.get("raw", node.get("text", ""))
-    if node["type"] in ("strong", "emphasis"):
-        return _extract_text(node["children"])
-    if node["type"] == "link":
-        return _extract_text(node["children"])
-    if node["type"] == "softbreak":
-        return " "
-    if "children" in node and node["children"]:
-        return _extract_text(node["children"])
-    return node.get("raw", node.get("text", ""))
+    return _extract_text([node])
 
 
 def _tokens_to_html(tokens: list[dict]) -> str:
     """Render AST tokens to simple HTML for raw_html fallback."""
-    md_renderer = mistune.create_markdown()
-    # Re-render by reconstructing markdown and parsing with default renderer
-    # Simpler: directly walk and produce HTML
     parts: list[str] = []
     for tok in tokens:
         parts.append(_token_to_html(tok))
@@ -1,21 +1,45 @@
-"""PDF generation with auto-fit binary search."""
+"""PDF generation with overflow-aware auto-fit search."""
 
 from __future__ import annotations
 
 import logging
-from dataclasses import replace
+import math
+import re
+import time
+from collections.abc import Generator
+from contextlib import ExitStack
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import BinaryIO
 
+from md2cv.cache import FitCache
+from md2cv.context import RenderContext, get_render_context
+from md2cv.estimate import FitEstimator, FitPrior
 from md2cv.models import CVData, StyleParams
-from md2cv.renderer import render_html
+from md2cv.renderer import EmbeddedPhoto, render_body
+from md2cv.stats import FitIteration, RenderStats
 from md2cv.themes import Theme, get_theme
 
 logger = logging.getLogger(__name__)
 
-# Auto-fit binary search parameters
+# Auto-fit search parameters
 MIN_SCALE = 0.65
 MAX_ITERATIONS = 12
-CONVERGENCE_THRESHOLD = 0.005
+FIT_TOLERANCE_PT = 0.05  # Resolution of the search, in points of base font size
+CACHE_FILL_DRIFT = 0.001  # Fill-ratio change that invalidates a cached factor
+MEASURE_PAGE_HEIGHT_MM = 5000.0  # Page height for the unpaginated measurement
+
+_MM_PER_UNIT = {"mm": 1.0, "cm": 10.0, "in": 25.4, "pt": 25.4 / 72, "px": 25.4 / 96}
+
+
+@dataclass
+class FitResult:
+    """Outcome of auto-fit for one document."""
+
+    factor: float = 1.0
+    renders: int = 0  # WeasyPrint layouts performed, including the final one
+    fits: bool = True
+    trace: list[FitIteration] = field(default_factory=list)  # Search probes
 
 
 def _scale_params(base: StyleParams, factor: float) -> StyleParams:
@@ -43,19 +67,515 @@ def _scale_params(base: StyleParams, factor: float) -> StyleParams:
     )
 
 
+class _FitSearch:
+    """Search state for the largest scale factor that fits on one page.
+
+    Candidate factors live on a grid between MIN_SCALE and 1.0 whose step
+    is ``tolerance_pt`` points of base font size, so the search ends on the
+    same factor whatever order the candidates are probed in. Each probe
+    reports the document's fill ratio (pages' worth of content), which is
+    used to predict where the content stops fitting instead of bisecting.
+    """
+
+    def __init__(
+        self,
+        base_font_size: float,
+        tolerance_pt: float = FIT_TOLERANCE_PT,
+        min_scale: float = MIN_SCALE,
+    ) -> None:
+        self.min_scale = min_scale
+        self.step = tolerance_pt / base_font_size
+        self.size = max(1, math.ceil((1.0 - min_scale) / self.step))
+        self.lo = -1  # Highest grid index known to fit
+        self.hi = self.size + 1  # Lowest grid index known to overflow
+        self.fills: dict[int, float] = {}
+        self.renders = 0
+        self._last_sides: list[bool] = []
+        self._hints: list[int] = []
+
+    def factor(self, index: int) -> float:
+        """Return the scale factor at a grid index."""
+        return min(1.0, self.min_scale + index * self.step)
+
+    def index(self, factor: float, floor: bool = False) -> int:
+        """Return the grid index nearest to a scale factor.
+
+        With ``floor``, return the highest grid index at or below it.
+        """
+        position = (factor - self.min_scale) / self.step
+        index = math.floor(position + 1e-9) if floor else round(position)
+        return max(0, min(self.size, index))
+
+    @property
+    def done(self) -> bool:
+        """Whether the fit boundary has been located to within one step."""
+        return self.hi - self.lo <= 1
+
+    @property
+    def best(self) -> float | None:
+        """Largest factor known to fit, or None if nothing fit yet."""
+        return self.factor(self.lo) if self.lo >= 0 else None
+
+    def record(self, factor: float, pages: int, fill: float) -> None:
+        """Record the outcome of laying out the CV at ``factor``."""
+        index = self.index(factor)
+        self.renders += 1
+        self.fills[index] = fill
+        fits = pages <= 1
+        if fits and index > self.lo:
+            self.lo = index
+        elif not fits and index < self.hi:
+            self.hi = index
+        self._last_sides = [*self._last_sides[-1:], fits]
+
+    def hint(self, *factors: float) -> None:
+        """Queue factors to probe first, as long as they are still useful."""
+        self._hints.extend(self.index(f) for f in factors)
+
+    def propose(self) -> float:
+        """Predict the next factor to probe."""
+        while self._hints:
+            index = self._hints.pop(0)
+            if self.lo < index < self.hi:
+                return self.factor(index)
+        return self.factor(self._clamp(self._predict()))
+
+    def propose_many(self, count: int) -> list[float]:
+        """Return up to ``count`` factors splitting the bracket evenly.
+
+        Probing all of them narrows the bracket by a factor of count + 1.
+        """
+        width = self.hi - self.lo
+        indices = {
+            self._clamp(self.lo + round(j * width / (count + 1)))
+            for j in range(1, count + 1)
+        }
+        return [self.factor(i) for i in sorted(indices)]
+
+    def _predict(self) -> int:
+        # Regula falsi degrades when one end of the bracket never moves;
+        # fall back to bisection after two probes land on the same side.
+        if (
+            self.lo >= 0
+            and len(self._last_sides) == 2
+            and self._last_sides[0] == self._last_sides[1]
+        ):
+            self._last_sides = []
+            return (self.lo + self.hi) // 2
+
+        # Secant through the two known points nearest the boundary: the
+        # bracket ends when both are known, else the two smallest overflows.
+        known = sorted(self.fills)
+        if self.lo >= 0:
+            points = [self.lo, self.hi]
+        else:
+            points = [i for i in known if i >= self.hi][:2]
+        points = [i for i in points if i in self.fills]
+
+        # Content height grows roughly with the square of the factor, so
+        # the square root of the fill ratio is close to linear in it.
+        if len(points) == 2:
+            (a, b) = points
+            root_a, root_b = math.sqrt(self.fills[a]), math.sqrt(self.fills[b])
+            if root_b > root_a:
+                f_a, f_b = self.factor(a), self.factor(b)
+                target = f_a + (1.0 - root_a) * (f_b - f_a) / (root_b - root_a)
+                return self.index(target)
+        for i in points:
+            if self.fills[i]:
+                return self.index(self.factor(i) / math.sqrt(self.fills[i]))
+        return (self.lo + self.hi) // 2
+
+    def _clamp(self, index: int) -> int:
+        return max(self.lo + 1, min(self.hi - 1, index))
+
+
+def _fill_ratio(doc) -> float:
+    """Return how many pages' worth of content a rendered document holds.
+
+    Every page but the last counts as full; the last page contributes the
+    fraction of its content area used by the root box.
+    """
+    # WeasyPrint does not expose the layout tree publicly.
+    page_box = doc.pages[-1]._page_box
+    return len(doc.pages) - 1 + _content_height(page_box) / page_box.height
+
+
+def _content_height(page_box) -> float:
+    """Return the height (in CSS px) used by the root box on a page."""
+    if not page_box.children:
+        return 0.0
+    root = page_box.children[0]
+    used = root.position_y + root.margin_height() - page_box.content_box_y()
+    return max(0.0, used)
+
+
+def _length_mm(value: str) -> float:
+    """Convert a CSS length such as '210mm' or '8.5in' to millimetres."""
+    match = re.fullmatch(r"\s*([\d.]+)\s*(mm|cm|in|pt|px)\s*", value)
+    if not match:
+        raise ValueError(f"Unsupported page length: {value!r}")
+    return float(match.group(1)) * _MM_PER_UNIT[match.group(2)]
+
+
+def _measure_factor(
+    body: str,
+    base_style: StyleParams,
+    theme: Theme,
+    context: RenderContext | None = None,
+) -> float:
+    """Predict the largest factor that fits from one unpaginated layout.
+
+    The CV is laid out at full scale on a very tall page. Its height at
+    other factors is then extrapolated with the same relationships
+    _scale_params applies: text height follows font size times line
+    height, and the number of wrapped lines follows font size over the
+    text width left between the margins.
+    """
+    tall = replace(base_style, page_height=f"{MEASURE_PAGE_HEIGHT_MM}mm")
+    doc = _render_document(body, tall, theme, context)
+    if len(doc.pages) > 1:
+        return MIN_SCALE
+    height = _content_height(doc.pages[0]._page_box) * _MM_PER_UNIT["px"]
+    del doc
+
+    page_width = _length_mm(base_style.page_width)
+    page_height = _length_mm(base_style.page_height)
+    base_width = page_width - base_style.margin_left - base_style.margin_right
+
+    def overflow(factor: float) -> float:
+        style = _scale_params(base_style, factor)
+        width = page_width - style.margin_left - style.margin_right
+        available = page_height - style.margin_top - style.margin_bottom
+        predicted = (
+            height
+            * factor
+            * factor
+            * (style.line_height / base_style.line_height)
+            * (base_width / width)
+        )
+        return predicted / available
+
+    if overflow(1.0) <= 1.0:
+        return 1.0
+    if overflow(MIN_SCALE) > 1.0:
+        return MIN_SCALE
+    lo, hi = MIN_SCALE, 1.0
+    for _ in range(40):
+        mid = (lo + hi) / 2
+        if overflow(mid) <= 1.0:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _render_document(
+    body: str,
+    style: StyleParams,
+    theme: Theme,
+    context: RenderContext | None = None,
+):
+    """Lay out pre-rendered body markup with WeasyPrint at a given style.
+
+    Returns:
+        The rendered WeasyPrint Document.
+    """
+    return (context or get_render_context()).render(body, style, theme)
+
+
 def _render_and_count_pages(
-    cv: CVData,
+    body: str,
     style: StyleParams,
     theme: Theme,
-) -> tuple[bytes, int]:
-    """Render CV to PDF bytes and return (pdf_bytes, page_count)."""
-    from weasyprint import HTML
+    context: RenderContext | None = None,
+) -> tuple[int, float]:
+    """Lay out the CV without serializing a PDF.
+
+    Returns:
+        (page_count, fill_ratio) for the laid-out document.
+    """
+    doc = _render_document(body, style, theme, context)
+    return len(doc.pages), _fill_ratio(doc)
+
+
+class _FirstProbe(list):
+    """The first layout an auto-fit search asks for.
+
+    A list of one factor, plus ``final_fill``: (fill, tolerance) such that
+    a one-page layout whose fill ratio is within ``tolerance`` of ``fill``
+    is final, or None if the search goes on regardless. Drivers can then
+    tell whether the probe's layout is worth keeping.
+    """
 
-    html_str = render_html(cv, style=style, theme=theme)
-    doc = HTML(string=html_str).render()
-    page_count = len(doc.pages)
-    pdf_bytes = doc.write_pdf()
-    return pdf_bytes, page_count
+    def __init__(self, factor: float, final_fill: tuple[float, float] | None):
+        super().__init__([factor])
+        self.final_fill = final_fill
+
+    def is_final(self, pages: int, fill: float) -> bool:
+        return _is_final_layout(pages, fill, self.final_fill)
+
+
+def _is_final_layout(
+    pages: int, fill: float, final_fill: tuple[float, float] | None
+) -> bool:
+    """Whether a first probe's layout is the final one (see _FirstProbe)."""
+    if final_fill is None or pages > 1:
+        return False
+    target, tolerance = final_fill
+    return abs(fill - target) <= tolerance
+
+
+def _fit_steps(
+    cv: CVData,
+    theme: Theme,
+    base_style: StyleParams,
+    page_size: str,
+    fit_tolerance: float,
+    fit_workers: int,
+    fit_cache: FitCache | None,
+    prior: FitPrior | None,
+    estimator: FitEstimator | None,
+    fit_strategy: str,
+    result: FitResult,
+) -> Generator[list[float] | None, object, tuple[float, bool]]:
+    """Run auto-fit as a generator of the layouts it needs.
+
+    Keeps the search policy apart from how layouts are run, so the same
+    steps can be driven in this process (_drive_fit) or from an event
+    loop (md2cv.aio). Yields the factors to lay out next, to be answered
+    with one ``(pages, fill)`` pair per factor, or None to ask for
+    _measure_factor's estimate. With ``fit_workers > 1`` each round
+    yields that many factors (k-ary search). The first round is a
+    _FirstProbe.
+
+    Returns:
+        (factor, reuse): the chosen factor, and whether the first layout
+        is already the final one. ``result`` is filled in, except for its
+        trace, which the driver records since it times the layouts.
+    """
+    cache_key = None
+    cached = None
+    if fit_cache is not None:
+        cache_key = fit_cache.key(cv, theme, base_style, fit_tolerance)
+        cached = fit_cache.get(cache_key)
+
+    if prior is None and estimator is not None and cached is None:
+        prior = estimator.prior(cv, theme.name, page_size)
+
+    search = _FitSearch(base_style.base_font_size, fit_tolerance)
+    hints: list[float] = []
+    extra_renders = 0
+
+    # First render at the cached factor, the measured or prior estimate,
+    # or full scale
+    if cached:
+        start = cached.factor
+    elif fit_strategy == "measure":
+        measured = yield None
+        extra_renders = 1
+        start = search.factor(search.index(measured))
+        hints = [start + search.step]
+    elif prior:
+        # Probe the bottom of the prior if its top overflowed, or just
+        # above its top if that fit. Both are floored onto the grid: an
+        # off-grid factor that fits would be recorded as the grid point
+        # above it, which may not.
+        start = search.factor(search.index(prior.high, floor=True))
+        low = search.factor(search.index(prior.low, floor=True))
+        hints = [low, start + search.step]
+    else:
+        start = 1.0
+    # Full scale is final whenever it fits; a cached factor only while the
+    # fill it gave is unchanged
+    if start == 1.0:
+        final_fill = (0.0, math.inf)
+    elif cached is not None:
+        final_fill = (cached.fill, CACHE_FILL_DRIFT)
+    else:
+        final_fill = None
+    probe = _FirstProbe(start, final_fill)
+    [(pages, fill)] = yield probe
+
+    if probe.is_final(pages, fill):
+        if estimator is not None:
+            estimator.observe(cv, theme.name, page_size, start)
+        result.factor, result.renders = start, 1 + extra_renders
+        result.fits = True
+        return start, True
+
+    if cached:
+        logger.info("Cached auto-fit factor %.3f no longer matches.", start)
+
+    search.record(start, pages, fill)
+    search.hint(*hints)
+
+    if fit_workers > 1:
+        for _ in range(MAX_ITERATIONS):
+            if search.done:
+                break
+            factors = search.propose_many(fit_workers)
+            for factor, (pages, fill) in zip(factors, (yield factors)):
+                search.record(factor, pages, fill)
+    else:
+        # Predict each candidate from the last
+        while not search.done and search.renders < MAX_ITERATIONS:
+            factor = search.propose()
+            [(pages, fill)] = yield [factor]
+            search.record(factor, pages, fill)
+
+    best_factor = search.best
+    logger.info(
+        "Auto-fit settled on factor %s after %d renders.",
+        f"{best_factor:.3f}" if best_factor is not None else "none",
+        search.renders,
+    )
+
+    if best_factor is not None:
+        if cache_key is not None:
+            fit_cache.put(cache_key, best_factor, search.fills[search.lo])
+        if estimator is not None:
+            estimator.observe(cv, theme.name, page_size, best_factor)
+
+    if best_factor is None:
+        logger.warning(
+            "Content overflows even at minimum scale. Producing multi-page PDF."
+        )
+        best_factor = MIN_SCALE
+
+    result.factor = best_factor
+    result.renders = search.renders + extra_renders + 1
+    result.fits = search.best is not None
+    return best_factor, False
+
+
+def _drive_fit(
+    steps: Generator[list[float] | None, object, tuple[float, bool]],
+    body: str,
+    base_style: StyleParams,
+    theme: Theme,
+    context: RenderContext | None = None,
+    fit_workers: int = 1,
+    trace: list[FitIteration] | None = None,
+):
+    """Answer _fit_steps in this process and return the final Document.
+
+    Single layouts run here, keeping the Document in case it turns out to
+    be the final one. Rounds of several factors are laid out in a process
+    pool, where each worker renders with its own default RenderContext;
+    their traced probes carry the wall time of the whole round.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    doc = None
+    reply = None
+    with ExitStack() as stack:
+        pool = None
+        try:
+            while True:
+                step = steps.send(reply)
+                doc = None
+                if step is None:
+                    reply = _measure_factor(body, base_style, theme, context)
+                    continue
+                styles = [_scale_params(base_style, f) for f in step]
+                start = time.perf_counter()
+                if len(step) == 1:
+                    doc = _render_document(body, styles[0], theme, context)
+                    reply = [(len(doc.pages), _fill_ratio(doc))]
+                else:
+                    if pool is None:
+                        pool = stack.enter_context(
+                            ProcessPoolExecutor(max_workers=fit_workers)
+                        )
+                    reply = list(
+                        pool.map(
+                            _render_and_count_pages,
+                            [body] * len(step),
+                            styles,
+                            [theme] * len(step),
+                        )
+                    )
+                seconds = time.perf_counter() - start
+                if trace is not None:
+                    trace.extend(
+                        FitIteration(factor, pages, fill, seconds)
+                        for factor, (pages, fill) in zip(step, reply)
+                    )
+        except StopIteration as stop:
+            factor, reuse = stop.value
+    if reuse:
+        return doc
+    del doc
+    return _render_document(body, _scale_params(base_style, factor), theme, context)
+
+
+def _page_style(theme: Theme, page_size: str) -> StyleParams:
+    """Return the theme's default style sized for ``page_size``."""
+    if page_size.lower() == "letter":
+        return replace(theme.default_style, page_width="8.5in", page_height="11in")
+    return theme.default_style
+
+
+def _fit_document(
+    cv: CVData,
+    page_size: str = "a4",
+    auto_fit: bool = True,
+    theme_name: str = "professional",
+    fit_tolerance: float = FIT_TOLERANCE_PT,
+    fit_workers: int = 1,
+    fit_cache: FitCache | None = None,
+    prior: FitPrior | None = None,
+    estimator: FitEstimator | None = None,
+    fit_strategy: str = "search",
+    context: RenderContext | None = None,
+    theme: Theme | None = None,
+    result: FitResult | None = None,
+    stats: RenderStats | None = None,
+    photo: EmbeddedPhoto | None = None,
+):
+    """Lay out the CV at the auto-fit scale and return the final Document.
+
+    Takes the same options as generate_pdf.
+    """
+    if result is None:
+        result = FitResult()
+    if stats is None:
+        stats = RenderStats()
+    if theme is None:
+        theme = get_theme(theme_name)
+    base_style = _page_style(theme, page_size)
+
+    if fit_strategy not in ("search", "measure"):
+        raise ValueError(f"Unknown fit strategy: {fit_strategy!r}")
+
+    # The body markup does not depend on the scale; render it once.
+    with stats.stage("render_html"):
+        body = render_body(cv, theme, photo)
+
+    with stats.stage("layout"):
+        if not auto_fit:
+            doc = _render_document(body, base_style, theme, context)
+            result.factor, result.renders = 1.0, 1
+            result.fits = len(doc.pages) <= 1
+            return doc
+
+        steps = _fit_steps(
+            cv,
+            theme,
+            base_style,
+            page_size,
+            fit_tolerance,
+            fit_workers,
+            fit_cache,
+            prior,
+            estimator,
+            fit_strategy,
+            result,
+        )
+        return _drive_fit(
+            steps, body, base_style, theme, context, fit_workers, result.trace
+        )
 
 
 def generate_pdf(
@@ -64,64 +584,125 @@ def generate_pdf(
     page_size: str = "a4",
     auto_fit: bool = True,
     theme_name: str = "professional",
+    fit_tolerance: float = FIT_TOLERANCE_PT,
+    fit_workers: int = 1,
+    fit_cache: FitCache | None = None,
+    prior: FitPrior | None = None,
+    estimator: FitEstimator | None = None,
+    fit_strategy: str = "search",
+    context: RenderContext | None = None,
+    theme: Theme | None = None,
+    result: FitResult | None = None,
+    stats: RenderStats | None = None,
+    photo: EmbeddedPhoto | None = None,
 ) -> Path:
     """Generate a PDF from CVData with optional auto-fit.
 
+    Candidate scales are only laid out; the PDF is serialized once, for
+    the chosen scale.
+
     Args:
         cv: Parsed CV data.
         output_path: Where to write the PDF.
         page_size: Page size ('a4' or 'letter').
         auto_fit: Whether to auto-shrink to fit one page.
         theme_name: Theme to use.
+        fit_tolerance: Auto-fit resolution, in points of base font size.
+        fit_workers: Number of processes probing candidate scales at once.
+            Any value lands on the same factor as the serial search.
+        fit_cache: Cache of earlier auto-fit results. On a hit, one render
+            at the cached factor verifies it before any search.
+        prior: Expected range of the best factor. The search probes its
+            ends first and stays correct if the range is wrong.
+        estimator: Supplies ``prior`` when none is given, and learns from
+            the factor chosen for this CV.
+        fit_strategy: 'search' starts at full scale (or the prior) and
+            searches by re-rendering. 'measure' first lays the CV out once
+            on an unbounded page, predicts the factor from its height, and
+            confirms the prediction with one or two renders.
+        context: WeasyPrint state shared across renders; defaults to the
+            process-wide RenderContext.
+        theme: Pre-loaded theme (if None, loads by theme_name).
+        result: If given, filled in with the chosen factor, the number of
+            renders it took and a trace of the search probes.
+        stats: If given, filled in with per-stage timings, the auto-fit
+            result, the output size and the peak RSS.
+        photo: Pre-loaded photo (if None, loads cv.photo_path).
 
     Returns:
         Path to the generated PDF file.
     """
     output_path = Path(output_path)
-    theme = get_theme(theme_name)
-    base_style = theme.default_style
+    if stats is None:
+        stats = RenderStats()
+    if result is None:
+        result = stats.fit or FitResult()
+    stats.fit = result
+    doc = _fit_document(
+        cv,
+        page_size=page_size,
+        auto_fit=auto_fit,
+        theme_name=theme_name,
+        fit_tolerance=fit_tolerance,
+        fit_workers=fit_workers,
+        fit_cache=fit_cache,
+        prior=prior,
+        estimator=estimator,
+        fit_strategy=fit_strategy,
+        context=context,
+        theme=theme,
+        result=result,
+        stats=stats,
+        photo=photo,
+    )
+    with stats.stage("write_pdf"):
+        doc.write_pdf(output_path)
+    stats.output_bytes = output_path.stat().st_size
+    stats.sample_rss()
+    return output_path
 
-    # Set page dimensions
-    if page_size.lower() == "letter":
-        base_style = replace(base_style, page_width="8.5in", page_height="11in")
 
-    # First render at full scale
-    pdf_bytes, page_count = _render_and_count_pages(cv, base_style, theme)
+def write_pdf(cv: CVData, target: BinaryIO, **options) -> None:
+    """Generate a PDF from CVData and write it to a binary file object.
 
-    if page_count <= 1 or not auto_fit:
-        output_path.write_bytes(pdf_bytes)
-        return output_path
+    The chosen layout is serialized straight into ``target`` (a pipe,
+    socket or upload stream), without building the PDF in memory first.
+    Accepts the same keyword options as generate_pdf.
+    """
+    stats = _prepare_stats(options)
+    doc = _fit_document(cv, **options)
+    start = _stream_position(target)
+    with stats.stage("write_pdf"):
+        doc.write_pdf(target)
+    if start is not None:
+        stats.output_bytes = _stream_position(target) - start
+    stats.sample_rss()
 
-    # Binary search for largest scale factor that fits on one page
-    lo, hi = MIN_SCALE, 1.0
-    best_pdf = pdf_bytes
-    best_factor = 1.0
 
-    for _ in range(MAX_ITERATIONS):
-        mid = (lo + hi) / 2
-        scaled_style = _scale_params(base_style, mid)
-        pdf_bytes, pages = _render_and_count_pages(cv, scaled_style, theme)
+def render_pdf(cv: CVData, **options) -> bytes:
+    """Generate a PDF from CVData and return its bytes instead of a file.
 
-        if pages <= 1:
-            best_pdf = pdf_bytes
-            best_factor = mid
-            lo = mid
-        else:
-            hi = mid
+    Accepts the same keyword options as generate_pdf.
+    """
+    stats = _prepare_stats(options)
+    doc = _fit_document(cv, **options)
+    with stats.stage("write_pdf"):
+        data = doc.write_pdf()
+    stats.output_bytes = len(data)
+    stats.sample_rss()
+    return data
 
-        if hi - lo < CONVERGENCE_THRESHOLD:
-            break
-
-    if best_factor < 1.0:
-        # Check if min scale still overflows
-        min_style = _scale_params(base_style, MIN_SCALE)
-        _, min_pages = _render_and_count_pages(cv, min_style, theme)
-        if min_pages > 1:
-            logger.warning(
-                "Content overflows even at minimum scale. "
-                "Producing multi-page PDF."
-            )
-            best_pdf = _render_and_count_pages(cv, min_style, theme)[0]
-
-    output_path.write_bytes(best_pdf)
-    return output_path
+
+def _prepare_stats(options: dict) -> RenderStats:
+    """Ensure ``options`` carries stats and a FitResult linked to them."""
+    stats = options["stats"] = options.get("stats") or RenderStats()
+    stats.fit = options["result"] = options.get("result") or stats.fit or FitResult()
+    return stats
+
+
+def _stream_position(stream: BinaryIO) -> int | None:
+    """Return the stream position, or None if it is not seekable (a pipe)."""
+    try:
+        return stream.tell() if stream.seekable() else None
+    except (AttributeError, OSError):
+        return None
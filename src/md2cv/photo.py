@@ -0,0 +1,182 @@
+"""Photo preparation: downscale to display size, recompress, and cache.
+
+Themes show the photo in a small box (``.photo`` in their CSS), so a
+camera JPEG is embedded at a fraction of its size: cropped to the box's
+aspect ratio (as ``object-fit: cover`` would), resized to the box at the
+requested print DPI, converted to sRGB and re-encoded without metadata.
+Results are cached by content hash in memory and under
+``$XDG_CACHE_HOME/md2cv/photos``. Without Pillow, or for an image it
+cannot decode, the file is embedded as it is.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+import mimetypes
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from md2cv import __version__
+from md2cv.cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DPI = 300
+DEFAULT_QUALITY = 85
+CSS_PX_PER_INCH = 96
+MAX_MEMORY_ENTRIES = 32
+MAX_DISK_ENTRIES = 256
+
+_SUFFIXES = {"image/jpeg": ".jpg", "image/png": ".png"}
+
+
+class EmbeddedPhoto(NamedTuple):
+    """A photo ready to embed: base64 data and its MIME type."""
+
+    data: str
+    mime: str
+
+
+# Cache key -> prepared photo, oldest first
+_memory: dict[str, EmbeddedPhoto] = {}
+
+
+def load_photo(
+    path: str | Path | None,
+    box: tuple[float, float] | None = None,
+    dpi: int = DEFAULT_DPI,
+    quality: int = DEFAULT_QUALITY,
+) -> EmbeddedPhoto | None:
+    """Read a photo and prepare it for embedding (None if there is no such file).
+
+    Args:
+        path: Image file.
+        box: Display size (width, height) in CSS px. If None, the file is
+            embedded unchanged.
+        dpi: Print resolution the photo is resized for.
+        quality: JPEG quality of the re-encoded photo.
+    """
+    if not path:
+        return None
+    photo_path = Path(path)
+    if not photo_path.is_file():
+        return None
+    data = photo_path.read_bytes()
+    if box is None:
+        mime, _ = mimetypes.guess_type(str(photo_path))
+        return _embed(data, mime or "image/jpeg")
+
+    size = _pixel_size(box, dpi)
+    key = hashlib.blake2b(
+        f"{__version__}:{size[0]}x{size[1]}:{quality}:".encode() + data,
+        digest_size=20,
+    ).hexdigest()
+    photo = _memory.pop(key, None) or _load_cached(key)
+    if photo is None:
+        try:
+            prepared, mime = _prepare(data, size, quality)
+        except Exception:
+            # Pillow missing, or a format it cannot read: embed as is
+            logger.debug("Embedding %s unprocessed", photo_path, exc_info=True)
+            mime, _ = mimetypes.guess_type(str(photo_path))
+            return _embed(data, mime or "image/jpeg")
+        _store_cached(key, prepared, mime)
+        photo = _embed(prepared, mime)
+    _memory[key] = photo
+    while len(_memory) > MAX_MEMORY_ENTRIES:
+        del _memory[next(iter(_memory))]
+    return photo
+
+
+def _pixel_size(box: tuple[float, float], dpi: int) -> tuple[int, int]:
+    """Convert a CSS px box to image pixels at ``dpi``."""
+    return tuple(max(1, round(side * dpi / CSS_PX_PER_INCH)) for side in box)
+
+
+def _prepare(data: bytes, size: tuple[int, int], quality: int) -> tuple[bytes, str]:
+    """Crop, downscale, convert to sRGB and re-encode an image.
+
+    Returns:
+        (encoded bytes, MIME type): PNG if the image has transparency,
+        JPEG otherwise.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image = _to_srgb(image)
+        # Never upscale: past the source's resolution, only crop.
+        scale = max(size[0] / image.width, size[1] / image.height)
+        if scale > 1:
+            size = (round(size[0] / scale), round(size[1] / scale))
+        image = ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+
+        out = io.BytesIO()
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            image.save(out, "PNG", optimize=True)
+            return out.getvalue(), "image/png"
+        image.convert("RGB").save(out, "JPEG", quality=quality, optimize=True)
+        return out.getvalue(), "image/jpeg"
+
+
+def _to_srgb(image):
+    """Convert an image with an embedded ICC profile to sRGB, if possible."""
+    icc = image.info.get("icc_profile")
+    if not icc:
+        return image
+    try:
+        from PIL import ImageCms
+
+        mode = "RGBA" if "A" in image.mode else "RGB"
+        return ImageCms.profileToProfile(
+            image,
+            ImageCms.ImageCmsProfile(io.BytesIO(icc)),
+            ImageCms.createProfile("sRGB"),
+            outputMode=mode,
+        )
+    except Exception:
+        logger.debug("Could not convert photo colour profile", exc_info=True)
+        return image
+
+
+def _embed(data: bytes, mime: str) -> EmbeddedPhoto:
+    return EmbeddedPhoto(base64.b64encode(data).decode("ascii"), mime)
+
+
+def _cache_dir() -> Path:
+    return default_cache_dir() / "photos"
+
+
+def _load_cached(key: str) -> EmbeddedPhoto | None:
+    for mime, suffix in _SUFFIXES.items():
+        path = _cache_dir() / f"{key}{suffix}"
+        try:
+            data = path.read_bytes()
+            path.touch()
+        except OSError:
+            continue
+        return _embed(data, mime)
+    return None
+
+
+def _store_cached(key: str, data: bytes, mime: str) -> None:
+    try:
+        directory = _cache_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{key}{_SUFFIXES[mime]}"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        entries = sorted(
+            (p for p in directory.iterdir() if p.suffix in _SUFFIXES.values()),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for old in entries[: max(0, len(entries) - MAX_DISK_ENTRIES)]:
+            old.unlink(missing_ok=True)
+    except OSError:
+        # A read-only or full cache must never fail a render.
+        pass
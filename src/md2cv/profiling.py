@@ -0,0 +1,142 @@
+"""Opt-in profiling of pipeline stages (``--profile`` / ``MD2CV_PROFILE``).
+
+Each stage (parse, render_html, layout, write_pdf) is profiled with its
+own cProfile.Profile, while a CPU-time interval timer (SIGPROF) samples
+the Python stack. The output directory receives:
+
+- ``<stage>.pstats`` per stage and ``profile.pstats`` for all stages,
+  readable with ``python -m pstats`` or snakeviz;
+- ``stacks.collapsed``: sampled stacks rooted at the stage name, in the
+  collapsed format read by flamegraph.pl and speedscope.
+
+Stack sampling needs ``signal.setitimer`` and the main thread; elsewhere
+(e.g. Windows) only the pstats files are produced. Auto-fit probes run in
+worker processes (``--fit-workers``) are not profiled.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import pstats
+import signal
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.001  # CPU seconds between stack samples
+
+
+class Profiler:
+    """Per-stage cProfile data plus sampled, stage-tagged stacks.
+
+    Attach to a RenderStats (``stats.profiler = Profiler()``) so every
+    ``stats.stage(...)`` block is profiled under its stage name.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = interval
+        self.profiles: dict[str, cProfile.Profile] = {}
+        self._samples: dict[tuple[str, tuple[CodeType, ...]], int] = {}
+        self._active: list[cProfile.Profile] = []
+        self._stage: str | None = None
+        self._sampling = False
+        self._previous_handler = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Profile the ``with`` block as stage ``name``.
+
+        Nested stages pause the enclosing stage's profile, since only one
+        cProfile profiler can be active at a time.
+        """
+        self._start_sampler()
+        profile = self.profiles.setdefault(name, cProfile.Profile())
+        if self._active:
+            self._active[-1].disable()
+        previous, self._stage = self._stage, name
+        self._active.append(profile)
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._active.pop()
+            self._stage = previous
+            if self._active:
+                self._active[-1].enable()
+
+    def close(self) -> None:
+        """Stop stack sampling and restore the previous SIGPROF handler."""
+        if self._sampling:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+            self._sampling = False
+
+    @property
+    def stacks(self) -> Counter[str]:
+        """Sample counts per collapsed stack, rooted at the stage name."""
+        stacks: Counter[str] = Counter()
+        for (stage, codes), count in list(self._samples.items()):
+            labels = [stage]
+            labels += (
+                f"{code.co_qualname} ({Path(code.co_filename).name}:"
+                f"{code.co_firstlineno})"
+                for code in reversed(codes)
+            )
+            stacks[";".join(labels)] += count
+        return stacks
+
+    def write(self, directory: str | Path) -> list[Path]:
+        """Write pstats and collapsed stacks; return the files written."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        combined: pstats.Stats | None = None
+        for name, profile in self.profiles.items():
+            stats = pstats.Stats(profile)
+            path = directory / f"{name}.pstats"
+            stats.dump_stats(path)
+            written.append(path)
+            if combined is None:
+                combined = pstats.Stats(profile)
+            else:
+                combined.add(stats)
+        if combined is not None:
+            path = directory / "profile.pstats"
+            combined.dump_stats(path)
+            written.append(path)
+
+        path = directory / "stacks.collapsed"
+        stacks = self.stacks
+        lines = [f"{stack} {count}\n" for stack, count in sorted(stacks.items())]
+        path.write_text("".join(lines), encoding="utf-8")
+        written.append(path)
+        return written
+
+    def _start_sampler(self) -> None:
+        if self._sampling or not hasattr(signal, "setitimer"):
+            return
+        try:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_sample)
+        except ValueError:
+            # Signal handlers can only be installed from the main thread
+            logger.debug("Stack sampling unavailable outside the main thread")
+            return
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self._sampling = True
+
+    def _on_sample(self, signum, frame) -> None:
+        # Kept to builtin operations: cProfile records this handler too.
+        if self._stage is None:
+            return
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        key = (self._stage, tuple(codes))
+        self._samples[key] = self._samples.get(key, 0) + 1
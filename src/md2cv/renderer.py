@@ -1,22 +1,148 @@
-"""Renderer: CVData + StyleParams → HTML string via Jinja2."""
+"""Renderer: CVData + StyleParams → HTML string via Jinja2.
+
+The document body depends only on the CV and the style block only on
+StyleParams, so auto-fit renders the body once and re-renders just the
+style block for each candidate scale.
+
+Theme templates are compiled once per process and source, through a
+shared Environment whose bytecode cache (``$XDG_CACHE_HOME/md2cv/jinja``)
+lets new processes skip compilation too. A template is only recompiled
+when its source changes.
+"""
 
 from __future__ import annotations
 
-import base64
-import mimetypes
-from pathlib import Path
+import functools
+import threading
 
-from jinja2 import Environment
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, Template
+from jinja2.bccache import Bucket
+from jinja2.exceptions import TemplateNotFound
 
+from md2cv.assets import inline_assets
+from md2cv.cache import default_cache_dir
 from md2cv.models import CVData, StyleParams
+from md2cv.photo import EmbeddedPhoto, load_photo
 from md2cv.themes import Theme, get_theme
 
+_DOCUMENT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<style>
+{css}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+class _ThemeLoader(BaseLoader):
+    """Serves theme template sources by ``<theme>/<file>`` name.
+
+    Sources are taken from the Theme objects being rendered, so a custom
+    or edited theme never picks up another's compiled template.
+    """
+
+    def __init__(self) -> None:
+        self.sources: dict[str, str] = {}
+
+    def get_source(self, environment, name):
+        try:
+            source = self.sources[name]
+        except KeyError:
+            raise TemplateNotFound(name) from None
+        return source, None, lambda: self.sources.get(name) == source
+
+
+class _BytecodeCache(FileSystemBytecodeCache):
+    """Jinja bytecode kept under md2cv's cache directory.
+
+    Entries are keyed by template name and a checksum of the source. The
+    directory is resolved on each use, so it follows XDG_CACHE_HOME.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(directory="", pattern="%s.cache")
+
+    def _get_cache_filename(self, bucket: Bucket) -> str:
+        return str(default_cache_dir() / "jinja" / (self.pattern % bucket.key))
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            (default_cache_dir() / "jinja").mkdir(parents=True, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            # A read-only or full cache must never fail a render.
+            pass
+
+
+_loader = _ThemeLoader()
+# Compiled templates are cached by _compiled, not by the environment.
+_env = Environment(
+    loader=_loader, autoescape=False, cache_size=0, bytecode_cache=_BytecodeCache()
+)
+_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled(name: str, source: str) -> Template:
+    """Return the compiled template for a theme file's source."""
+    with _lock:
+        _loader.sources[name] = source
+        return _env.get_template(name)
+
+
+def render_body(
+    cv: CVData, theme: Theme, photo: EmbeddedPhoto | None = None
+) -> str:
+    """Render the document body markup for a CV.
+
+    Args:
+        cv: Parsed CV data.
+        theme: Loaded theme.
+        photo: Prepared photo (if None, loads cv.photo_path sized for the
+            theme at the default DPI).
+
+    Returns:
+        HTML markup for the contents of ``<body>``, with the photo embedded.
+    """
+    if photo is None:
+        photo = load_photo(cv.photo_path, theme.photo_size)
+
+    template = _compiled(f"{theme.name}/template.html", theme.template_string)
+    return template.render(
+        cv=cv,
+        photo=photo.data if photo else None,
+        photo_mime=photo.mime if photo else None,
+    )
+
+
+def render_style(style: StyleParams, theme: Theme) -> str:
+    """Render the StyleParams-dependent CSS rules of a theme."""
+    template = _compiled(f"{theme.name}/style.css", theme.style_string)
+    return template.render(style=style)
+
+
+def wrap_document(body: str, css: str = "") -> str:
+    """Wrap body markup in the HTML document skeleton with inline CSS."""
+    return _DOCUMENT.format(css=css, body=body)
+
+
+def assemble_html(theme: Theme, body: str, style_css: str) -> str:
+    """Combine rendered body markup and style rules into a full document."""
+    return wrap_document(body, f"{theme.static_css}\n{style_css}")
+
 
 def render_html(
     cv: CVData,
     style: StyleParams | None = None,
     theme: Theme | None = None,
     theme_name: str = "professional",
+    photo: EmbeddedPhoto | None = None,
 ) -> str:
     """Render CVData to a self-contained HTML string.
 
@@ -25,31 +151,17 @@ def render_html(
         style: Style parameters (overrides theme defaults if provided).
         theme: Pre-loaded theme (if None, loads by theme_name).
         theme_name: Theme to load if theme is not provided.
+        photo: Pre-loaded photo (if None, loads cv.photo_path).
 
     Returns:
-        Complete HTML string with inline CSS and embedded assets.
+        Complete HTML string with inline CSS and embedded assets
+        (``theme-asset:`` URLs become data URIs).
     """
     if theme is None:
         theme = get_theme(theme_name)
     if style is None:
         style = theme.default_style
 
-    # Handle photo embedding
-    photo_b64 = None
-    photo_mime = None
-    if cv.photo_path:
-        photo_path = Path(cv.photo_path)
-        if photo_path.is_file():
-            photo_b64 = base64.b64encode(photo_path.read_bytes()).decode("ascii")
-            mime, _ = mimetypes.guess_type(str(photo_path))
-            photo_mime = mime or "image/jpeg"
-
-    env = Environment(autoescape=False)
-    template = env.from_string(theme.template_string)
-
-    return template.render(
-        cv=cv,
-        style=style,
-        photo=photo_b64,
-        photo_mime=photo_mime,
-    )
+    body = render_body(cv, theme, photo)
+    html = assemble_html(theme, body, render_style(style, theme))
+    return inline_assets(html, theme)
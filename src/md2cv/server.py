@@ -0,0 +1,307 @@
+"""Render daemon: HTTP front end over a pool of warm worker processes.
+
+Endpoints:
+    POST /render   Markdown in, PDF or HTML out. The body is either raw
+                   markdown or JSON ``{"markdown": ..., "photo": <base64>,
+                   "photo_type": "image/png"}``. Query parameters:
+                   ``format`` (pdf|html), ``theme``, ``page_size`` and
+                   ``auto_fit`` (1|0).
+    GET  /health   JSON with queue depth, in-flight renders and render
+                   latency percentiles.
+
+Request bodies over ``max_body`` bytes are refused with 413.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import mimetypes
+import os
+import socketserver
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from md2cv.stats import percentile as _percentile
+from md2cv.themes import list_themes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_MAX_BODY = 16 * 1024 * 1024  # Bytes; room for a base64 photo
+LATENCY_WINDOW = 1000
+
+_CONTENT_TYPES = {"pdf": "application/pdf", "html": "text/html; charset=utf-8"}
+
+
+def _init_worker() -> None:
+    """Load every theme and warm up WeasyPrint once per worker process."""
+    from md2cv.context import get_render_context
+    from md2cv.models import CVData
+    from md2cv.renderer import render_body
+    from md2cv.themes import preload_themes
+
+    themes = preload_themes()
+    try:
+        context = get_render_context()
+        for theme in themes:
+            body = render_body(CVData(name="warm-up"), theme)
+            context.render(body, theme.default_style, theme)
+    except Exception:
+        # Leave the error to surface per request rather than break the pool.
+        logger.debug("WeasyPrint warm-up failed", exc_info=True)
+
+
+def _ping() -> None:
+    """No-op task used to start worker processes ahead of the first request."""
+
+
+def _render(
+    markdown: str,
+    photo: bytes | None,
+    photo_type: str | None,
+    fmt: str,
+    theme_name: str,
+    page_size: str,
+    auto_fit: bool,
+) -> bytes:
+    """Render one request inside a worker process."""
+    from md2cv.parser import parse_cv
+    from md2cv.pdf import render_pdf
+    from md2cv.renderer import render_html
+    from md2cv.themes import get_theme
+
+    theme = get_theme(theme_name)
+    cv = parse_cv(markdown)
+
+    with tempfile.TemporaryDirectory(prefix="md2cv-") as tmp:
+        if photo:
+            suffix = mimetypes.guess_extension(photo_type or "") or ".jpg"
+            photo_path = Path(tmp) / f"photo{suffix}"
+            photo_path.write_bytes(photo)
+            cv.photo_path = str(photo_path)
+        if fmt == "html":
+            return render_html(cv, theme=theme).encode("utf-8")
+        return render_pdf(cv, page_size=page_size, auto_fit=auto_fit, theme=theme)
+
+
+class QueueFull(Exception):
+    """Raised when a render is refused because the queue is full."""
+
+
+class RenderService:
+    """Admission control, metrics and a warm process pool for renders."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_body: int = DEFAULT_MAX_BODY,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.max_body = max_body
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker
+        )
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def start(self) -> None:
+        """Fork and warm every worker before accepting requests."""
+        futures = [self._pool.submit(_ping) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, dropping queued renders."""
+        self._pool.shutdown(cancel_futures=True)
+
+    def render(self, *args) -> bytes:
+        """Run ``_render(*args)`` on a worker, waiting for a free slot.
+
+        Raises:
+            QueueFull: if ``max_queue`` requests are already waiting.
+        """
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                raise QueueFull()
+            self._queued += 1
+        start = time.perf_counter()
+        try:
+            with self._slots:
+                with self._lock:
+                    self._queued -= 1
+                    self._in_flight += 1
+                try:
+                    result = self._pool.submit(_render, *args).result()
+                finally:
+                    with self._lock:
+                        self._in_flight -= 1
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        with self._lock:
+            self._completed += 1
+            self._latencies.append(time.perf_counter() - start)
+        return result
+
+    def metrics(self) -> dict:
+        """Return queue, throughput and latency figures."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "status": "ok",
+                "workers": self.workers,
+                "queue_depth": self._queued,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "latency_ms": {
+                    f"p{p}": _percentile(latencies, p) * 1000 for p in (50, 90, 99)
+                },
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "md2cv"
+    service: RenderService  # Set on the subclass built by make_server
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path == "/health":
+            self._send_json(200, self.service.metrics())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            self._send_json(404, {"error": "not found"})
+            return
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        fmt = query.get("format", "pdf").lower()
+        theme_name = query.get("theme", "professional")
+        page_size = query.get("page_size", "a4").lower()
+        auto_fit = query.get("auto_fit", "1") not in ("0", "false", "no")
+        if fmt not in _CONTENT_TYPES:
+            self._send_json(400, {"error": f"unsupported format: {fmt}"})
+            return
+        if page_size not in ("a4", "letter"):
+            self._send_json(400, {"error": f"unsupported page size: {page_size}"})
+            return
+        if theme_name not in list_themes():
+            self._send_json(400, {"error": f"unknown theme: {theme_name}"})
+            return
+
+        try:
+            markdown, photo, photo_type = self._read_payload()
+        except _BadRequest as exc:
+            self._send_json(exc.status, {"error": str(exc)})
+            return
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send_json(400, {"error": f"bad request body: {exc}"})
+            return
+
+        try:
+            data = self.service.render(
+                markdown, photo, photo_type, fmt, theme_name, page_size, auto_fit
+            )
+        except QueueFull:
+            self._send_json(503, {"error": "render queue is full"})
+            return
+        except Exception as exc:
+            logger.exception("Render failed")
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", _CONTENT_TYPES[fmt])
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_payload(self) -> tuple[str, bytes | None, str | None]:
+        header = self.headers.get("Content-Length")
+        if header is None:
+            raise _BadRequest(411, "Content-Length is required")
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise _BadRequest(400, f"invalid Content-Length: {header}")
+        if length > self.service.max_body:
+            # Refused before reading, so the body never reaches memory
+            raise _BadRequest(413, f"request body over {self.service.max_body} bytes")
+        raw = self.rfile.read(length)
+        if self.headers.get_content_type() != "application/json":
+            return raw.decode("utf-8"), None, None
+
+        payload = json.loads(raw)
+        if not isinstance(payload, dict):
+            raise _BadRequest(400, "JSON body must be an object")
+        markdown = payload.get("markdown")
+        photo = payload.get("photo")
+        photo_type = payload.get("photo_type")
+        if not isinstance(markdown, str):
+            raise _BadRequest(400, '"markdown" must be a string')
+        if not isinstance(photo, str | None) or not isinstance(photo_type, str | None):
+            raise _BadRequest(400, '"photo" and "photo_type" must be strings')
+        return markdown, base64.b64decode(photo) if photo else None, photo_type
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.info("%s - %s", self.address_string(), format % args)
+
+
+class _BadRequest(Exception):
+    """A request body the handler rejects with ``status``."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    service: RenderService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: str | None = None,
+) -> socketserver.BaseServer:
+    """Bind an HTTP server (TCP, or a Unix socket if given) to a service."""
+    handler = type("Handler", (_Handler,), {"service": service})
+    if socket_path:
+        Path(socket_path).unlink(missing_ok=True)
+        return _UnixHTTPServer(socket_path, handler)
+    return ThreadingHTTPServer((host, port), handler)
@@ -0,0 +1,196 @@
+"""Per-stage timings and auto-fit traces for ``--stats``."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from md2cv.pdf import FitResult
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Stage names, in pipeline order.
+STAGES = ("parse", "render_html", "layout", "write_pdf")
+
+# Upper bounds (ms) of the batch histogram buckets; the last is open-ended.
+HISTOGRAM_BOUNDS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class StageTiming:
+    """Wall-clock and CPU seconds spent in one pipeline stage."""
+
+    wall: float = 0.0
+    cpu: float = 0.0
+    calls: int = 0
+
+
+@dataclass
+class FitIteration:
+    """One auto-fit probe: the factor tried and what it laid out to."""
+
+    factor: float
+    pages: int
+    fill: float
+    seconds: float
+
+
+@dataclass
+class RenderStats:
+    """Everything ``--stats`` reports for one document.
+
+    Pass an instance to generate_pdf to have it filled in; time other
+    stages with ``stage``.
+    """
+
+    stages: dict[str, StageTiming] = field(default_factory=dict)
+    fit: FitResult | None = None
+    output_bytes: int | None = None
+    peak_rss_bytes: int | None = None
+
+    # Optional md2cv.profiling.Profiler; not a field, so not reported.
+    profiler = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Add the time spent in the ``with`` block to stage ``name``."""
+        profiling = self.profiler.stage(name) if self.profiler else nullcontext()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            with profiling:
+                yield
+        finally:
+            timing = self.stages.setdefault(name, StageTiming())
+            timing.wall += time.perf_counter() - wall
+            timing.cpu += time.process_time() - cpu
+            timing.calls += 1
+
+    def sample_rss(self) -> None:
+        """Record the process's peak resident set size so far."""
+        self.peak_rss_bytes = peak_rss()
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def format_text(self) -> str:
+        """Render a human-readable report."""
+        lines = [f"{'stage':<12} {'wall ms':>10} {'cpu ms':>10}"]
+        for name, timing in _ordered(self.stages):
+            lines.append(
+                f"{name:<12} {timing.wall * 1000:10.1f} {timing.cpu * 1000:10.1f}"
+            )
+        if self.fit is not None and self.fit.trace:
+            lines.append("")
+            lines.append(
+                f"{'probe':<6} {'factor':>8} {'pages':>6} {'fill':>7} {'ms':>8}"
+            )
+            for i, it in enumerate(self.fit.trace, 1):
+                lines.append(
+                    f"{i:<6} {it.factor:8.3f} {it.pages:6d} {it.fill:7.3f} "
+                    f"{it.seconds * 1000:8.1f}"
+                )
+        lines.append("")
+        if self.fit is not None:
+            lines.append(
+                f"final factor: {self.fit.factor:.3f} ({self.fit.renders} renders"
+                f"{'' if self.fit.fits else ', overflows'})"
+            )
+        if self.output_bytes is not None:
+            lines.append(f"output size:  {self.output_bytes} bytes")
+        if self.peak_rss_bytes is not None:
+            lines.append(f"peak RSS:     {self.peak_rss_bytes / 2**20:.1f} MiB")
+        return "\n".join(lines)
+
+
+def peak_rss() -> int | None:
+    """Return the peak resident set size of this process in bytes, if known."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def percentile(values: list[float], pct: int) -> float:
+    """Nearest-rank percentile of sorted values (0.0 when empty)."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))
+    return values[rank]
+
+
+def histogram(values: Iterable[float], bounds: Iterable[float]) -> dict[str, int]:
+    """Count values into buckets ``<= bound``, plus a final open bucket."""
+    bounds = list(bounds)
+    labels = [f"<={b:g}" for b in bounds] + [f">{bounds[-1]:g}"]
+    counts = dict.fromkeys(labels, 0)
+    for value in values:
+        for bound, label in zip(bounds, labels):
+            if value <= bound:
+                counts[label] += 1
+                break
+        else:
+            counts[labels[-1]] += 1
+    return counts
+
+
+def summarize(all_stats: list[RenderStats]) -> dict:
+    """Aggregate many documents' stats: percentiles and histograms per stage."""
+    summary: dict = {"files": len(all_stats), "stages": {}}
+    names = {name for stats in all_stats for name in stats.stages}
+    for name in [s for s in STAGES if s in names] + sorted(names - set(STAGES)):
+        wall_ms = sorted(
+            stats.stages[name].wall * 1000
+            for stats in all_stats
+            if name in stats.stages
+        )
+        summary["stages"][name] = {
+            "p50_ms": percentile(wall_ms, 50),
+            "p90_ms": percentile(wall_ms, 90),
+            "max_ms": wall_ms[-1],
+            "total_ms": sum(wall_ms),
+            "histogram_ms": histogram(wall_ms, HISTOGRAM_BOUNDS_MS),
+        }
+    renders = [stats.fit.renders for stats in all_stats if stats.fit is not None]
+    if renders:
+        summary["renders"] = {
+            str(count): renders.count(count) for count in sorted(set(renders))
+        }
+    rss = [s.peak_rss_bytes for s in all_stats if s.peak_rss_bytes is not None]
+    if rss:
+        summary["peak_rss_bytes"] = max(rss)
+    return summary
+
+
+def format_summary(summary: dict) -> str:
+    """Render a batch summary from ``summarize`` as text."""
+    lines = [f"{summary['files']} file(s)"]
+    for name, stage in summary["stages"].items():
+        lines.append(
+            f"{name:<12} p50 {stage['p50_ms']:8.1f} ms  p90 {stage['p90_ms']:8.1f} ms"
+            f"  max {stage['max_ms']:8.1f} ms"
+        )
+        width = max(stage["histogram_ms"].values())
+        for label, count in stage["histogram_ms"].items():
+            if count:
+                bar = "#" * max(1, round(count / width * 30))
+                lines.append(f"  {label:>8} ms {count:6d} {bar}")
+    if "renders" in summary:
+        counts = ", ".join(f"{k}: {v}" for k, v in summary["renders"].items())
+        lines.append(f"auto-fit renders per file: {counts}")
+    if "peak_rss_bytes" in summary:
+        lines.append(f"peak RSS (max): {summary['peak_rss_bytes'] / 2**20:.1f} MiB")
+    return "\n".join(lines)
+
+
+def _ordered(stages: dict[str, StageTiming]) -> list[tuple[str, StageTiming]]:
+    known = [(name, stages[name]) for name in STAGES if name in stages]
+    return known + sorted((k, v) for k, v in stages.items() if k not in STAGES)
@@ -1,51 +1,201 @@
-"""Theme registry: discover, load, and list themes."""
+"""Theme registry: discover, load, and list themes.
+
+Themes are searched for in the directories listed in ``MD2CV_THEME_PATH``
+(separated like PATH), then among the built-in themes; each is a
+``<name>/`` directory holding at least ``template.html``. Loaded themes
+are kept in memory and served again for as long as their files' mtimes
+and sizes are unchanged.
+"""
 
 from __future__ import annotations
 
+import os
+import re
 import tomllib
 from dataclasses import fields
 from importlib import resources
+from pathlib import Path
 from typing import NamedTuple
 
 from md2cv.models import StyleParams
 
+THEME_PATH_ENV = "MD2CV_THEME_PATH"
+DEFAULT_PHOTO_SIZE = (80.0, 80.0)  # CSS px, if a theme's CSS does not say
+
 _TEMPLATES_PKG = "md2cv.templates"
+_THEME_FILES = ("template.html", "theme.css", "style.css", "theme.toml")
+_FONT_STYLES = ("normal", "italic", "oblique")
+
+
+class FontFace(NamedTuple):
+    """A font file shipped with a theme, declared under ``[[fonts]]``."""
+
+    family: str
+    file: str
+    weight: str = "normal"
+    style: str = "normal"
 
 
 class Theme(NamedTuple):
-    """A loaded theme with its template and default style."""
+    """A loaded theme with its templates and default style.
+
+    ``template_string`` renders the document body from the CV,
+    ``static_css`` holds the rules that never change, and ``style_string``
+    renders the rules that depend on StyleParams. ``photo_size`` is the
+    (width, height) of the ``.photo`` box in CSS px, ``directory`` is
+    where ``theme-asset:`` URLs resolve, and ``fonts`` are the theme's own
+    font files, whose ``@font-face`` rules lead ``static_css``.
+    """
 
     name: str
     display_name: str
     description: str
     template_string: str
     default_style: StyleParams
+    static_css: str = ""
+    style_string: str = ""
+    photo_size: tuple[float, float] = DEFAULT_PHOTO_SIZE
+    directory: Path | None = None
+    fonts: tuple[FontFace, ...] = ()
+
+
+# Theme name -> (file stamp when loaded, Theme)
+_registry: dict[str, tuple[tuple, Theme]] = {}
+# (theme dirs, their subdirectories' mtimes) -> theme names, for list_themes
+_listing: tuple[tuple, list[str]] | None = None
+
+
+def theme_dirs() -> list[Path]:
+    """Return the directories searched for themes, in priority order."""
+    user = os.environ.get(THEME_PATH_ENV, "")
+    dirs = [Path(p).expanduser() for p in user.split(os.pathsep) if p]
+    return [*dirs, _builtin_dir()]
 
 
 def list_themes() -> list[str]:
-    """List available theme names by scanning the templates package."""
-    names: list[str] = []
-    templates = resources.files(_TEMPLATES_PKG)
-    for item in templates.iterdir():
-        if item.is_dir() and (item / "template.html").is_file():
-            names.append(item.name)
-    return sorted(names)
+    """List available theme names across all theme directories."""
+    global _listing
+    dirs = theme_dirs()
+    stamp = _listing_stamp(dirs)
+    if _listing is not None and _listing[0] == stamp:
+        return list(_listing[1])
 
+    names: set[str] = set()
+    for directory in dirs:
+        if not directory.is_dir():
+            continue
+        for item in directory.iterdir():
+            if item.is_dir() and (item / "template.html").is_file():
+                names.add(item.name)
+    _listing = (stamp, sorted(names))
+    return list(_listing[1])
 
-def get_theme(name: str) -> Theme:
-    """Load a theme by name from templates/<name>/."""
-    theme_dir = resources.files(_TEMPLATES_PKG) / name
-    template_path = theme_dir / "template.html"
-    toml_path = theme_dir / "theme.toml"
 
-    if not template_path.is_file():
+def get_theme(name: str) -> Theme:
+    """Return a theme by name, loading it only if its files changed."""
+    theme_dir = _find_theme(name)
+    if theme_dir is None:
         available = list_themes()
         raise ValueError(
             f"Theme '{name}' not found. Available themes: {', '.join(available)}"
         )
 
+    stamp = _stamp(theme_dir)
+    cached = _registry.get(name)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    theme = _load_theme(name, theme_dir)
+    _registry[name] = (stamp, theme)
+    return theme
+
+
+def preload_themes(names: list[str] | None = None) -> list[Theme]:
+    """Load themes (default: all) into the registry, e.g. at worker start."""
+    return [get_theme(name) for name in (names or list_themes())]
+
+
+def theme_files(name: str) -> list[Path]:
+    """Return the paths of the files that make up a theme, assets included."""
+    theme_dir = _find_theme(name) or _builtin_dir() / name
+    core = [theme_dir / filename for filename in _THEME_FILES]
+    assets = sorted(
+        path
+        for path in theme_dir.rglob("*")
+        if path.is_file()
+        and path not in core
+        and path.suffix not in (".py", ".pyc")
+        and not path.name.startswith(".")
+    )
+    return [*core, *assets]
+
+
+def _builtin_dir() -> Path:
+    return Path(str(resources.files(_TEMPLATES_PKG)))
+
+
+def _find_theme(name: str) -> Path | None:
+    """Return the directory of the first theme called ``name``, if any."""
+    if not name or Path(name).name != name or name.startswith("."):
+        return None
+    for directory in theme_dirs():
+        if (directory / name / "template.html").is_file():
+            return directory / name
+    return None
+
+
+def _stamp(theme_dir: Path) -> tuple:
+    """Identify the current state of a theme's files."""
+    state = []
+    for filename in _THEME_FILES:
+        try:
+            st = (theme_dir / filename).stat()
+        except OSError:
+            state.append(None)
+        else:
+            state.append((st.st_mtime_ns, st.st_size))
+    return (str(theme_dir), *state)
+
+
+def _listing_stamp(dirs: list[Path]) -> tuple:
+    """Identify the theme directories under each root.
+
+    Each subdirectory's own mtime is included, since adding a
+    ``template.html`` to an existing one does not touch its root.
+    """
+    stamp = []
+    for directory in dirs:
+        subdirs = []
+        if directory.is_dir():
+            subdirs = sorted(
+                (item.name, _mtime(item))
+                for item in directory.iterdir()
+                if item.is_dir()
+            )
+        stamp.append((str(directory), tuple(subdirs)))
+    return tuple(stamp)
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_theme(name: str, theme_dir: Path) -> Theme:
+    """Read a theme's files from ``theme_dir``."""
+    template_path = theme_dir / "template.html"
+    toml_path = theme_dir / "theme.toml"
+    css_path = theme_dir / "theme.css"
+    style_path = theme_dir / "style.css"
+
     template_string = template_path.read_text(encoding="utf-8")
+    static_css = css_path.read_text(encoding="utf-8") if css_path.is_file() else ""
+    style_string = (
+        style_path.read_text(encoding="utf-8") if style_path.is_file() else ""
+    )
     style = StyleParams()
+    fonts: tuple[FontFace, ...] = ()
 
     if toml_path.is_file():
         data = tomllib.loads(toml_path.read_text(encoding="utf-8"))
@@ -54,8 +204,11 @@ def get_theme(name: str) -> Theme:
         valid_fields = {f.name for f in fields(StyleParams)}
         filtered = {k: v for k, v in style_data.items() if k in valid_fields}
         style = StyleParams(**filtered)
+        fonts = _font_faces(name, data.get("fonts", []))
     else:
         meta = {}
+    if fonts:
+        static_css = f"{font_face_css(fonts)}\n{static_css}"
 
     return Theme(
         name=name,
@@ -63,4 +216,78 @@ def get_theme(name: str) -> Theme:
         description=meta.get("description", ""),
         template_string=template_string,
         default_style=style,
+        static_css=static_css,
+        style_string=style_string,
+        photo_size=_photo_size(static_css),
+        directory=theme_dir,
+        fonts=fonts,
     )
+
+
+def _font_faces(theme_name: str, entries: list[dict]) -> tuple[FontFace, ...]:
+    """Read and validate the ``[[fonts]]`` tables of a theme.toml."""
+    fonts = []
+    for entry in entries:
+        if not entry.get("family") or not entry.get("file"):
+            raise ValueError(
+                f"Theme '{theme_name}': every [[fonts]] entry needs a family "
+                "and a file."
+            )
+        font = FontFace(
+            family=str(entry["family"]),
+            file=str(entry["file"]),
+            weight=str(entry.get("weight", "normal")).strip().lower(),
+            style=str(entry.get("style", "normal")).strip().lower(),
+        )
+        if not _valid_weight(font.weight):
+            raise ValueError(
+                f"Theme '{theme_name}': font weight {font.weight!r} is not "
+                "normal, bold or a number from 1 to 1000 (or a range of two)."
+            )
+        if font.style not in _FONT_STYLES:
+            raise ValueError(
+                f"Theme '{theme_name}': font style {font.style!r} is not one "
+                f"of {', '.join(_FONT_STYLES)}."
+            )
+        fonts.append(font)
+    return tuple(fonts)
+
+
+def _valid_weight(weight: str) -> bool:
+    if weight in ("normal", "bold"):
+        return True
+    parts = weight.split()
+    return 1 <= len(parts) <= 2 and all(
+        p.isdigit() and 1 <= int(p) <= 1000 for p in parts
+    )
+
+
+def _css_string(value: str) -> str:
+    """Quote a value as a CSS string, escaping quotes and control characters."""
+    escaped = "".join(
+        f"\\{ord(c):x} " if c in '"\\' or ord(c) < 0x20 or ord(c) == 0x7F else c
+        for c in value
+    )
+    return f'"{escaped}"'
+
+
+def font_face_css(fonts: tuple[FontFace, ...]) -> str:
+    """Return ``@font-face`` rules loading each font from the theme's files."""
+    return "\n".join(
+        f"@font-face {{ font-family: {_css_string(font.family)}; "
+        f"src: url({_css_string(f'theme-asset:{font.file}')}); "
+        f"font-weight: {font.weight}; font-style: {font.style}; }}"
+        for font in fonts
+    )
+
+
+def _photo_size(css: str) -> tuple[float, float]:
+    """Read the width and height (px) of the ``.photo`` rule from theme CSS."""
+    rule = re.search(r"(?:^|[\s,}])\.photo\s*\{([^}]*)\}", css)
+    if rule is None:
+        return DEFAULT_PHOTO_SIZE
+    size = []
+    for prop, default in zip(("width", "height"), DEFAULT_PHOTO_SIZE):
+        match = re.search(rf"(?<![-\w]){prop}\s*:\s*([\d.]+)px", rule.group(1))
+        size.append(float(match.group(1)) if match else default)
+    return (size[0], size[1])
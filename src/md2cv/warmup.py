@@ -0,0 +1,115 @@
+"""Prepare a fresh environment so its first render is as fast as later ones.
+
+``md2cv warmup`` (e.g. as a Dockerfile step) builds fontconfig's font
+cache with ``fc-cache``, checks each theme's bundled fonts, and renders
+every theme once. Those renders compile the templates into the on-disk
+bytecode cache and load the fonts WeasyPrint resolves.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import time
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from md2cv.models import CVData
+from md2cv.themes import Theme, preload_themes
+
+
+class WarmupStep(NamedTuple):
+    """Outcome of one warm-up step."""
+
+    name: str
+    seconds: float = 0.0
+    detail: str = ""
+    error: str | None = None
+
+
+def build_font_cache() -> bool:
+    """Run ``fc-cache`` to build fontconfig's persistent font cache.
+
+    Returns:
+        False if ``fc-cache`` is not installed.
+
+    Raises:
+        subprocess.CalledProcessError: If ``fc-cache`` fails.
+    """
+    fc_cache = shutil.which("fc-cache")
+    if fc_cache is None:
+        return False
+    subprocess.run([fc_cache], check=True, capture_output=True)
+    return True
+
+
+def missing_fonts(theme: Theme) -> list[str]:
+    """Return the font files a theme declares but does not ship."""
+    from md2cv.assets import resolve_asset
+
+    missing = []
+    for font in theme.fonts:
+        try:
+            found = resolve_asset(f"theme-asset:{font.file}", theme).is_file()
+        except ValueError:
+            found = False
+        if not found:
+            missing.append(font.file)
+    return missing
+
+
+def warm_up(
+    theme_names: list[str] | None = None,
+    font_cache: bool = True,
+    pdf: bool = True,
+) -> Iterator[WarmupStep]:
+    """Run the warm-up steps, yielding each one's outcome as it finishes.
+
+    Args:
+        theme_names: Themes to warm up (default: all).
+        font_cache: Build the fontconfig cache first.
+        pdf: Also lay each theme out with WeasyPrint, not just render HTML.
+    """
+    if font_cache:
+        start = time.perf_counter()
+        try:
+            built = build_font_cache()
+        except (OSError, subprocess.CalledProcessError) as exc:
+            yield WarmupStep("font cache", error=f"fc-cache failed: {exc}")
+        else:
+            yield WarmupStep(
+                "font cache",
+                time.perf_counter() - start,
+                "" if built else "fc-cache not found; skipped",
+            )
+
+    from md2cv.renderer import render_body, render_html
+
+    context = None
+    for theme in preload_themes(theme_names):
+        start = time.perf_counter()
+        missing = missing_fonts(theme)
+        if missing:
+            yield WarmupStep(
+                f"theme {theme.name}", error=f"missing fonts: {', '.join(missing)}"
+            )
+            continue
+        try:
+            cv = CVData(name="warm-up")
+            render_html(cv, theme=theme)
+            if pdf:
+                from md2cv.context import get_render_context
+
+                context = context or get_render_context()
+                context.render(render_body(cv, theme), theme.default_style, theme)
+        except Exception as exc:
+            # Report per theme; the others can still be warmed up.
+            yield WarmupStep(
+                f"theme {theme.name}", error=f"{type(exc).__name__}: {exc}"
+            )
+            continue
+        yield WarmupStep(
+            f"theme {theme.name}",
+            time.perf_counter() - start,
+            f"{len(theme.fonts)} bundled font(s)" if theme.fonts else "",
+        )
@@ -0,0 +1,47 @@
+"""Polling file watcher used by ``md2cv --watch``."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+DEFAULT_INTERVAL = 0.5
+
+
+def snapshot(paths: Iterable[Path]) -> dict[Path, int | None]:
+    """Return each path's modification time (None if it does not exist)."""
+    stamps: dict[Path, int | None] = {}
+    for path in paths:
+        try:
+            stamps[path] = path.stat().st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def changed_paths(
+    before: dict[Path, int | None], after: dict[Path, int | None]
+) -> list[Path]:
+    """Return the paths whose modification time differs between snapshots."""
+    return [path for path, stamp in after.items() if before.get(path) != stamp]
+
+
+def watch(
+    paths: Iterable[Path],
+    on_change: Callable[[list[Path]], None],
+    interval: float = DEFAULT_INTERVAL,
+) -> None:
+    """Call ``on_change`` with the changed paths whenever any of them changes.
+
+    Runs until interrupted (KeyboardInterrupt).
+    """
+    paths = list(paths)
+    previous = snapshot(paths)
+    while True:
+        time.sleep(interval)
+        current = snapshot(paths)
+        changed = changed_paths(previous, current)
+        if changed:
+            previous = current
+            on_change(changed)
@@ -9,6 +9,12 @@ import pytest
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep md2cv's on-disk caches out of the user's home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def sample_minimal() -> str:
     return (FIXTURES_DIR / "sample_minimal.md").read_text()
@@ -0,0 +1,95 @@
+"""Tests for the asyncio API."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from md2cv.aio import AsyncRenderer, generate_pdf_async, render_html_async
+from md2cv.parser import parse_cv
+from md2cv.pdf import FitResult
+
+
+class _TrackingExecutor(ThreadPoolExecutor):
+    """Thread pool recording submissions and the most tasks run at once."""
+
+    def __init__(self, *args, on_submit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_submit = on_submit
+        self.submitted = 0
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        if self.on_submit:
+            self.on_submit(self.submitted)
+        return super().submit(self._track, fn, *args, **kwargs)
+
+    def _track(self, fn, *args, **kwargs):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class TestRenderHTMLAsync:
+    def test_renders_html(self, sample_short):
+        cv = parse_cv(sample_short)
+        html = asyncio.run(render_html_async(cv, theme_name="modern"))
+        assert html.startswith("<!DOCTYPE html>")
+        assert "John Smith" in html
+
+    def test_concurrency_limit(self, sample_short):
+        cv = parse_cv(sample_short)
+
+        async def render_many():
+            with _TrackingExecutor(max_workers=4) as executor:
+                renderer = AsyncRenderer(executor, max_concurrency=1)
+                pages = await asyncio.gather(
+                    *(renderer.render_html(cv) for _ in range(4))
+                )
+            return executor, pages
+
+        executor, pages = asyncio.run(render_many())
+        assert len(set(pages)) == 1
+        assert executor.peak == 1
+
+
+class TestGeneratePDFAsync:
+    def test_returns_pdf_bytes(self, sample_short):
+        cv = parse_cv(sample_short)
+        result = FitResult()
+        data = asyncio.run(generate_pdf_async(cv, result=result))
+        assert data[:5] == b"%PDF-"
+        assert result.renders >= len(result.trace) >= 1
+
+    def test_cancelled_between_iterations(self, sample_long):
+        # Three copies of the sections, so full scale surely overflows
+        sections = sample_long[sample_long.index("\n## ") :]
+        cv = parse_cv(sample_long + sections * 2)
+        result = FitResult()
+
+        async def render_and_cancel():
+            task = None
+
+            def cancel_on_second_probe(count):
+                # Submissions: body, first probe, second probe
+                if count == 3:
+                    task.cancel()
+
+            with _TrackingExecutor(on_submit=cancel_on_second_probe) as executor:
+                renderer = AsyncRenderer(executor)
+                task = asyncio.create_task(renderer.generate_pdf(cv, result=result))
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+            return executor
+
+        executor = asyncio.run(render_and_cancel())
+        assert executor.submitted == 3
+        assert len(result.trace) == 1
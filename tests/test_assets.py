@@ -0,0 +1,88 @@
+"""Tests for theme assets and the asset cache."""
+
+import base64
+import os
+import shutil
+
+import pytest
+
+from md2cv.assets import AssetCache, inline_assets, resolve_asset
+from md2cv.models import CVData
+from md2cv.renderer import render_html
+from md2cv.themes import THEME_PATH_ENV, get_theme, theme_dirs, theme_files
+
+
+@pytest.fixture
+def asset_theme(tmp_path, monkeypatch):
+    """A copy of the modern theme with a logo referenced from its CSS."""
+    directory = tmp_path / "themes"
+    shutil.copytree(theme_dirs()[-1] / "modern", directory / "branded")
+    (directory / "branded" / "img").mkdir()
+    (directory / "branded" / "img" / "logo.svg").write_text("<svg/>")
+    css = directory / "branded" / "theme.css"
+    css.write_text(
+        css.read_text() + "\nh1 { background: url(theme-asset:img/logo.svg); }"
+    )
+    monkeypatch.setenv(THEME_PATH_ENV, str(directory))
+    return get_theme("branded")
+
+
+class TestAssetCache:
+    def test_reads_each_file_once(self, tmp_path):
+        path = tmp_path / "font.woff2"
+        path.write_bytes(b"font")
+        cache = AssetCache()
+        assert cache.load(path) == cache.load(path)
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert cache.load(path).mime == "font/woff2"
+
+    def test_rereads_changed_file(self, tmp_path):
+        path = tmp_path / "logo.png"
+        path.write_bytes(b"one")
+        cache = AssetCache()
+        cache.load(path)
+        path.write_bytes(b"three")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.load(path).data == b"three"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = AssetCache(max_bytes=10)
+        for name in "abc":
+            (tmp_path / name).write_bytes(b"x" * 4)
+        cache.load(tmp_path / "a")
+        cache.load(tmp_path / "b")
+        cache.load(tmp_path / "a")
+        cache.load(tmp_path / "c")  # evicts b
+        cache.load(tmp_path / "a")
+        cache.load(tmp_path / "b")
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(OSError):
+            AssetCache().load(tmp_path / "nope.ttf")
+
+
+class TestThemeAssets:
+    def test_resolve(self, asset_theme):
+        path = resolve_asset("theme-asset:img/logo.svg", asset_theme)
+        assert path == asset_theme.directory.resolve() / "img" / "logo.svg"
+
+    def test_cannot_escape_theme_dir(self, asset_theme):
+        with pytest.raises(ValueError, match="outside"):
+            resolve_asset("theme-asset:../../secret.txt", asset_theme)
+
+    def test_inlined_in_html(self, asset_theme):
+        html = render_html(CVData(name="Jane"), theme=asset_theme)
+        encoded = base64.b64encode(b"<svg/>").decode("ascii")
+        assert f"url(data:image/svg+xml;base64,{encoded})" in html
+        assert "theme-asset:" not in html
+
+    def test_unresolved_left_alone(self, asset_theme):
+        text = "url(theme-asset:missing.png)"
+        assert inline_assets(text, asset_theme) == text
+
+    def test_assets_are_theme_files(self, asset_theme):
+        files = theme_files("branded")
+        assert asset_theme.directory / "img" / "logo.svg" in files
+        assert not any(path.suffix == ".py" for path in files)
@@ -0,0 +1,98 @@
+"""Tests for batch conversion."""
+
+import shutil
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from md2cv.batch import BatchOptions, collect_inputs, output_base, run_batch
+from md2cv.cli import main
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _copy_fixtures(dest: Path) -> Path:
+    dest.mkdir()
+    for md in FIXTURES_DIR.glob("*.md"):
+        shutil.copy(md, dest / md.name)
+    return dest
+
+
+class TestCollectInputs:
+    def test_directory(self, tmp_path):
+        src = _copy_fixtures(tmp_path / "cvs")
+        found = list(collect_inputs([str(src)]))
+        assert [p.name for p in found] == sorted(p.name for p in found)
+        assert len(found) == 3
+
+    def test_glob(self, tmp_path):
+        src = _copy_fixtures(tmp_path / "cvs")
+        found = list(collect_inputs([str(src / "sample_s*.md")]))
+        assert [p.name for p in found] == ["sample_short.md"]
+
+    def test_output_base(self, tmp_path):
+        assert output_base(Path("a/cv.md"), None) == Path("a/cv")
+        assert output_base(Path("a/cv.md"), tmp_path) == tmp_path / "cv"
+
+
+class TestRunBatch:
+    def test_html_batch_reports_failures(self, tmp_path):
+        src = _copy_fixtures(tmp_path / "cvs")
+        (src / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+        out = tmp_path / "out"
+        options = BatchOptions(html_only=True)
+        results = list(run_batch(collect_inputs([str(src)]), options, out, jobs=2))
+        assert len(results) == 4
+        failed = [r for r in results if not r.ok]
+        assert [r.input_path.name for r in failed] == ["broken.md"]
+        assert (out / "sample_short.html").exists()
+
+    def test_output_collision_reported(self, tmp_path):
+        for name, person in (("a", "Alice"), ("b", "Bob")):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "cv.md").write_text(f"# {person}\n", encoding="utf-8")
+        inputs = [tmp_path / "a" / "cv.md", tmp_path / "a" / "cv.md"]
+        inputs.append(tmp_path / "b" / "cv.md")
+        out = tmp_path / "out"
+        options = BatchOptions(html_only=True)
+        results = list(run_batch(inputs, options, out, jobs=1))
+        assert len(results) == 2
+        [failed] = [r for r in results if not r.ok]
+        assert failed.input_path == tmp_path / "b" / "cv.md"
+        assert "already written" in failed.error
+        html = (out / "cv.html").read_text(encoding="utf-8")
+        assert "Alice" in html and "Bob" not in html
+
+    def test_cli_batch(self, tmp_path):
+        src = _copy_fixtures(tmp_path / "cvs")
+        out = tmp_path / "out"
+        result = CliRunner().invoke(
+            main, ["batch", str(src), "--html-only", "-j", "1", "--out-dir", str(out)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Converted 3 file(s), 0 failed." in result.output
+        assert (out / "sample_long.html").exists()
+
+    def test_skip_unchanged(self, tmp_path):
+        src = _copy_fixtures(tmp_path / "cvs")
+        out = tmp_path / "out"
+        args = ["batch", str(src), "--html-only", "-j", "1", "--out-dir", str(out)]
+        args.append("--skip-unchanged")
+        first = CliRunner().invoke(main, args)
+        assert "Converted 3 file(s), 0 unchanged, 0 failed." in first.output
+        (src / "sample_short.md").write_text("# Someone Else\n", encoding="utf-8")
+        second = CliRunner().invoke(main, args)
+        assert second.exit_code == 0, second.output
+        assert "Converted 1 file(s), 2 unchanged, 0 failed." in second.output
+
+    def test_fit_model_saved_once_with_all_workers(self, tmp_path):
+        import json
+
+        src = _copy_fixtures(tmp_path / "cvs")
+        model = tmp_path / "model.json"
+        options = BatchOptions(fit_model=str(model))
+        for _ in range(2):
+            results = list(run_batch(collect_inputs([str(src)]), options, jobs=2))
+            assert all(r.ok for r in results)
+        observations = json.loads(model.read_text())["professional:a4"]
+        assert len(observations) == 3  # Repeated runs replace, not append
@@ -0,0 +1,68 @@
+"""Tests for the benchmark suite's regression check."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+from suite import compare_results  # noqa: E402
+
+
+def _results(**cases):
+    return {"cases": cases}
+
+
+class TestCompareResults:
+    def test_slowdown_over_threshold(self):
+        regressions = compare_results(
+            _results(small={"parse_ms": 10.0, "pdf_ms": 100.0}),
+            _results(small={"parse_ms": 10.5, "pdf_ms": 150.0}),
+            threshold=0.2,
+            min_ms=1.0,
+        )
+        assert regressions == ["small pdf_ms: 100.0 -> 150.0 ms (+50%)"]
+
+    def test_small_absolute_slowdown_ignored(self):
+        regressions = compare_results(
+            _results(small={"parse_ms": 1.0}),
+            _results(small={"parse_ms": 1.8}),
+            threshold=0.2,
+            min_ms=1.0,
+        )
+        assert regressions == []
+
+    def test_improvement(self):
+        regressions = compare_results(
+            _results(small={"pdf_ms": 100.0, "fit_renders": 4}),
+            _results(small={"pdf_ms": 50.0, "fit_renders": 2}),
+            threshold=0.2,
+            min_ms=1.0,
+        )
+        assert regressions == []
+
+    def test_more_fit_renders(self):
+        regressions = compare_results(
+            _results(small={"fit_renders": 2}),
+            _results(small={"fit_renders": 3}),
+            threshold=0.2,
+            min_ms=1.0,
+        )
+        assert regressions == ["small fit_renders: 2 -> 3"]
+
+    def test_missing_and_new_cases_skipped(self):
+        regressions = compare_results(
+            _results(small={"pdf_ms": 100.0}),
+            _results(large={"pdf_ms": 900.0}),
+            threshold=0.2,
+            min_ms=1.0,
+        )
+        assert regressions == []
+
+    def test_zero_baseline(self):
+        regressions = compare_results(
+            _results(small={"layout_ms": 0.0}),
+            _results(small={"layout_ms": 20.0}),
+            threshold=0.2,
+            min_ms=1.0,
+        )
+        assert regressions == ["small layout_ms: 0.0 -> 20.0 ms (n/a)"]
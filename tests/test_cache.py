@@ -0,0 +1,100 @@
+"""Tests for the auto-fit cache and build stamps."""
+
+import os
+import shutil
+
+from md2cv.cache import BuildCache, FitCache, default_cache_dir
+from md2cv.models import CVData, StyleParams
+from md2cv.themes import THEME_PATH_ENV, get_theme, theme_dirs
+
+
+class TestFitCache:
+    def test_default_dir_honours_xdg(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "md2cv"
+
+    def test_roundtrip(self, tmp_path):
+        cache = FitCache(tmp_path)
+        cache.put("abc", 0.875, 0.98)
+        entry = cache.get("abc")
+        assert entry.factor == 0.875
+        assert entry.fill == 0.98
+
+    def test_miss(self, tmp_path):
+        assert FitCache(tmp_path).get("missing") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "bad.json").write_text("not json")
+        assert FitCache(tmp_path).get("bad") is None
+
+    def test_lru_eviction(self, tmp_path):
+        cache = FitCache(tmp_path, max_entries=2)
+        cache.put("a", 0.9, 0.9)
+        cache.put("b", 0.8, 0.9)
+        os.utime(tmp_path / "a.json", (0, 0))
+        os.utime(tmp_path / "b.json", (1, 1))
+        cache.get("a")  # Refreshes "a", leaving "b" least recently used
+        cache.put("c", 0.7, 0.9)
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_key_depends_on_content_and_page_size(self):
+        theme = get_theme("professional")
+        style = theme.default_style
+        key = FitCache.key(CVData(name="Jane"), theme, style, 0.05)
+        assert key == FitCache.key(CVData(name="Jane"), theme, style, 0.05)
+        assert key != FitCache.key(CVData(name="John"), theme, style, 0.05)
+        letter = StyleParams(page_width="8.5in", page_height="11in")
+        assert key != FitCache.key(CVData(name="Jane"), theme, letter, 0.05)
+        other = get_theme("modern")
+        assert key != FitCache.key(CVData(name="Jane"), other, style, 0.05)
+
+    def test_key_depends_on_theme_assets(self, tmp_path, monkeypatch):
+        shutil.copytree(theme_dirs()[-1] / "modern", tmp_path / "mine")
+        font = tmp_path / "mine" / "fonts" / "Inter.woff2"
+        font.parent.mkdir()
+        font.write_bytes(b"one")
+        monkeypatch.setenv(THEME_PATH_ENV, str(tmp_path))
+        theme = get_theme("mine")
+        key = FitCache.key(CVData(name="Jane"), theme, theme.default_style, 0.05)
+        font.write_bytes(b"other")
+        assert key != FitCache.key(
+            CVData(name="Jane"), theme, theme.default_style, 0.05
+        )
+
+
+class TestBuildCache:
+    OPTIONS = {"page_size": "a4", "html_only": False}
+
+    def test_digest_covers_inputs(self, tmp_path):
+        builds = BuildCache(tmp_path / "builds")
+        photo = tmp_path / "photo.png"
+        photo.write_bytes(b"one")
+        digest = builds.digest("# A", "modern", self.OPTIONS, photo)
+        assert digest == builds.digest(b"# A", "modern", self.OPTIONS, photo)
+        assert digest != builds.digest("# B", "modern", self.OPTIONS, photo)
+        assert digest != builds.digest("# A", "professional", self.OPTIONS, photo)
+        assert digest != builds.digest("# A", "modern", {"page_size": "letter"}, photo)
+        photo.write_bytes(b"two")
+        assert digest != builds.digest("# A", "modern", self.OPTIONS, photo)
+
+    def test_up_to_date_after_record(self, tmp_path):
+        builds = BuildCache(tmp_path / "builds")
+        out = tmp_path / "cv.pdf"
+        out.write_bytes(b"%PDF-")
+        base = tmp_path / "cv"
+        assert not builds.up_to_date(base, "d1")
+        builds.record(base, "d1", [out])
+        assert builds.up_to_date(base, "d1")
+        assert not builds.up_to_date(base, "d2")
+
+    def test_changed_or_missing_output_is_stale(self, tmp_path):
+        builds = BuildCache(tmp_path / "builds")
+        out = tmp_path / "cv.pdf"
+        out.write_bytes(b"%PDF-")
+        builds.record(tmp_path / "cv", "d1", [out])
+        out.write_bytes(b"%PDF-edited")
+        assert not builds.up_to_date(tmp_path / "cv", "d1")
+        out.unlink()
+        assert not builds.up_to_date(tmp_path / "cv", "d1")
@@ -91,6 +91,21 @@ class TestCLI:
         )
         assert result.exit_code == 0, result.output
 
+    def test_no_cache_flag(self, tmp_path):
+        runner = CliRunner()
+        out = tmp_path / "out.pdf"
+        result = runner.invoke(
+            main,
+            [
+                str(FIXTURES_DIR / "sample_long.md"),
+                "-o",
+                str(out),
+                "--no-cache",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert not (tmp_path / "cache" / "md2cv").exists()
+
     def test_missing_input_file(self):
         runner = CliRunner()
         result = runner.invoke(main, ["nonexistent.md"])
@@ -110,3 +125,92 @@ class TestCLI:
         assert result.exit_code == 0, result.output
         expected = tmp_path / "resume.pdf"
         assert expected.exists()
+
+    def test_stats_json(self, tmp_path):
+        import json
+
+        runner = CliRunner()
+        out = tmp_path / "out.html"
+        result = runner.invoke(
+            main,
+            [
+                str(FIXTURES_DIR / "sample_short.md"),
+                "-o",
+                str(out),
+                "--html-only",
+                "--stats",
+                "--stats-format",
+                "json",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.stderr)
+        assert set(report["stages"]) == {"parse", "render_html"}
+        assert report["output_bytes"] == out.stat().st_size
+
+    def test_stats_flag_before_input(self, tmp_path):
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "--stats",
+                str(FIXTURES_DIR / "sample_short.md"),
+                "-o",
+                str(tmp_path / "out.html"),
+                "--html-only",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "parse" in result.stderr
+
+    def test_stdin_to_stdout(self):
+        runner = CliRunner()
+        markdown = (FIXTURES_DIR / "sample_short.md").read_text(encoding="utf-8")
+        result = runner.invoke(main, ["-", "--html-only"], input=markdown)
+        assert result.exit_code == 0, result.output
+        assert result.stdout.startswith("<!DOCTYPE html>")
+        assert "John Smith" in result.stdout
+
+    def test_stdout_rejects_html_sidecar(self, tmp_path):
+        runner = CliRunner()
+        result = runner.invoke(
+            main, [str(FIXTURES_DIR / "sample_short.md"), "-o", "-", "--html"]
+        )
+        assert result.exit_code == 2
+
+    def test_skip_unchanged(self, tmp_path):
+        runner = CliRunner()
+        out = tmp_path / "out.html"
+        args = [
+            str(FIXTURES_DIR / "sample_short.md"),
+            "-o",
+            str(out),
+            "--html-only",
+            "--skip-unchanged",
+        ]
+        assert runner.invoke(main, args).exit_code == 0
+        result = runner.invoke(main, args)
+        assert result.exit_code == 0, result.output
+        assert "up to date" in result.output
+        result = runner.invoke(main, [*args, "--theme", "modern"])
+        assert "HTML written to" in result.output
+
+    def test_skip_unchanged_shares_stamps_with_batch(self, tmp_path):
+        source = tmp_path / "cv.md"
+        text = (FIXTURES_DIR / "sample_short.md").read_text()
+        source.write_bytes(text.replace("\n", "\r\n").encode())
+        runner = CliRunner()
+        args = [str(source), "--html-only", "--skip-unchanged"]
+        batch = runner.invoke(main, ["batch", *args])
+        assert batch.exit_code == 0, batch.output
+        result = runner.invoke(main, args)
+        assert result.exit_code == 0, result.output
+        assert "up to date" in result.output
+
+    def test_warmup(self):
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["warmup", "--no-font-cache", "--html-only", "--theme", "modern"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "theme modern:" in result.output
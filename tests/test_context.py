@@ -0,0 +1,55 @@
+"""Tests for the shared WeasyPrint render context."""
+
+from md2cv import context as context_module
+from md2cv.context import RenderContext, get_render_context
+from md2cv.models import CVData
+from md2cv.renderer import render_body
+from md2cv.themes import get_theme
+
+
+class TestRenderContext:
+    def test_default_context_is_shared(self):
+        assert get_render_context() is get_render_context()
+
+    def test_one_context_per_thread(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(get_render_context).result()
+        assert other is not get_render_context()
+
+    def test_static_stylesheet_parsed_once(self):
+        context = RenderContext()
+        theme = get_theme("professional")
+        assert context.static_stylesheet(theme) is context.static_stylesheet(theme)
+
+    def test_static_stylesheets_bounded(self, monkeypatch):
+        monkeypatch.setattr(context_module, "MAX_STATIC_SHEETS", 2)
+        context = RenderContext()
+        theme = get_theme("professional")
+        first = context.static_stylesheet(theme)
+        for css in ("p { color: red }", "p { color: blue }"):
+            context.static_stylesheet(theme._replace(static_css=css))
+        assert len(context._static_sheets) == 2
+        assert context.static_stylesheet(theme) is not first
+
+    def test_renders_one_page(self):
+        context = RenderContext()
+        theme = get_theme("modern")
+        body = render_body(CVData(name="Jane"), theme)
+        doc = context.render(body, theme.default_style, theme)
+        assert len(doc.pages) == 1
+
+    def test_theme_assets_read_once(self, tmp_path):
+        from md2cv.assets import AssetCache
+
+        logo = tmp_path / "logo.svg"
+        logo.write_text('<svg xmlns="http://www.w3.org/2000/svg" width="4"/>')
+        theme = get_theme("modern")._replace(directory=tmp_path)
+        context = RenderContext(AssetCache())
+        body = render_body(CVData(name="Jane"), theme)
+        body += '<img src="theme-asset:logo.svg">'
+        for _ in range(2):
+            context.render(body, theme.default_style, theme)
+        assert context.assets.misses == 1
+        assert context.assets.hits >= 1
@@ -0,0 +1,80 @@
+"""Tests for auto-fit warm-start priors."""
+
+from md2cv.estimate import FitEstimator, cv_features
+from md2cv.models import CVData, CVEntry, CVSection
+from md2cv.parser import parse_cv
+
+
+def _cv(entries: int) -> CVData:
+    section = CVSection(
+        heading="Experience",
+        entries=[
+            CVEntry(title=f"Role {i}", details=["Did a thing"] * 3)
+            for i in range(entries)
+        ],
+    )
+    return CVData(name="Jane", sections=[section])
+
+
+class TestCVFeatures:
+    def test_counts_entries_and_details(self, sample_short):
+        chars, sections, entries, details, raw = cv_features(parse_cv(sample_short))
+        assert sections == 3
+        assert entries == 4
+        assert details >= 3
+        assert chars > 0
+        assert raw > 0
+
+
+class TestFitEstimator:
+    def test_no_prior_without_data(self):
+        estimator = FitEstimator()
+        assert estimator.prior(_cv(3), "professional", "a4") is None
+
+    def test_prior_from_similar_documents(self):
+        estimator = FitEstimator(neighbours=2, margin=0.01)
+        estimator.observe(_cv(10), "professional", "a4", 0.80)
+        estimator.observe(_cv(11), "professional", "a4", 0.78)
+        estimator.observe(_cv(2), "professional", "a4", 1.0)
+        prior = estimator.prior(_cv(10), "professional", "a4")
+        assert abs(prior.low - 0.77) < 1e-9
+        assert abs(prior.high - 0.81) < 1e-9
+
+    def test_groups_by_theme_and_page_size(self):
+        estimator = FitEstimator()
+        estimator.observe(_cv(10), "professional", "a4", 0.8)
+        estimator.observe(_cv(11), "professional", "a4", 0.8)
+        assert estimator.prior(_cv(10), "modern", "a4") is None
+        assert estimator.prior(_cv(10), "professional", "letter") is None
+
+    def test_save_and_load(self, tmp_path):
+        estimator = FitEstimator()
+        estimator.observe(_cv(10), "professional", "a4", 0.8)
+        estimator.observe(_cv(11), "professional", "a4", 0.9)
+        path = tmp_path / "model.json"
+        estimator.save(path)
+        loaded = FitEstimator.load(path)
+        assert loaded.prior(_cv(10), "professional", "a4") == estimator.prior(
+            _cv(10), "professional", "a4"
+        )
+
+    def test_repeated_document_replaces_observation(self):
+        estimator = FitEstimator(max_observations=3)
+        for _ in range(5):
+            estimator.observe(_cv(10), "professional", "a4", 0.8)
+        estimator.observe(_cv(10), "professional", "a4", 0.7)
+        assert estimator.observations["professional:a4"] == [
+            (cv_features(_cv(10)), 0.7)
+        ]
+        for n in range(5):
+            estimator.observe(_cv(n), "professional", "a4", 0.9)
+        assert len(estimator.observations["professional:a4"]) == 3
+
+    def test_take_new_and_merge(self):
+        worker = FitEstimator()
+        worker.observe(_cv(10), "professional", "a4", 0.8)
+        new = worker.take_new()
+        assert worker.take_new() == []
+        parent = FitEstimator()
+        parent.merge(new)
+        assert parent.observations == worker.observations
@@ -0,0 +1,76 @@
+"""Tests for rendering one CV in several themes and page sizes."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from md2cv.cli import main
+from md2cv.fanout import FanoutOptions, Variant, render_variants, variant_base, variants
+from md2cv.parser import parse_cv
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestVariants:
+    def test_product_without_duplicates(self):
+        assert variants(["modern", "professional", "modern"], ["a4", "letter"]) == [
+            Variant("modern", "a4"),
+            Variant("modern", "letter"),
+            Variant("professional", "a4"),
+            Variant("professional", "letter"),
+        ]
+
+    def test_variant_base(self):
+        base = Path("out/cv")
+        assert variant_base(base, Variant("modern", "a4")) == Path("out/cv-modern-a4")
+        assert variant_base(base, Variant("modern", None)) == Path("out/cv-modern")
+
+
+class TestRenderVariants:
+    def test_html_variants(self, tmp_path):
+        cv = parse_cv((FIXTURES_DIR / "sample_short.md").read_text(encoding="utf-8"))
+        combos = variants(["modern", "professional"], [None])
+        options = FanoutOptions(html_only=True)
+        results = list(render_variants(cv, combos, tmp_path / "cv", options, jobs=2))
+        assert sorted(r.variant for r in results) == combos
+        assert all(r.ok for r in results)
+        assert "<html" in (tmp_path / "cv-modern.html").read_text()
+        assert (tmp_path / "cv-professional.html").exists()
+
+    def test_cli_fan_out(self, tmp_path):
+        out = tmp_path / "cv.html"
+        result = CliRunner().invoke(
+            main,
+            [
+                str(FIXTURES_DIR / "sample_short.md"),
+                "-o",
+                str(out),
+                "--html-only",
+                "--theme",
+                "modern",
+                "--theme",
+                "professional",
+                "--page-size",
+                "a4",
+                "--page-size",
+                "letter",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "Rendered 2 variant(s), 0 failed." in result.output
+        assert (tmp_path / "cv-modern.html").exists()
+
+    def test_cli_fan_out_rejects_stdout(self):
+        result = CliRunner().invoke(
+            main,
+            [
+                str(FIXTURES_DIR / "sample_short.md"),
+                "-o",
+                "-",
+                "--theme",
+                "modern",
+                "--theme",
+                "professional",
+            ],
+        )
+        assert result.exit_code == 2
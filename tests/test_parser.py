@@ -1,6 +1,6 @@
 """Tests for the markdown parser."""
 
-from md2cv.parser import parse_cv
+from md2cv.parser import parse_cv, parse_cv_incremental
 
 
 class TestParseCV:
@@ -76,3 +76,68 @@ class TestParseCV:
         entry = cv.sections[0].entries[0]
         assert entry.title == "Title"
         assert entry.date_range == "2020–2023"
+
+
+class TestParseCVIncremental:
+    def test_matches_full_parse(self, sample_long):
+        result = parse_cv_incremental(None, sample_long)
+        assert result.cv == parse_cv(sample_long)
+        assert len(result.section_digests) == len(result.cv.sections)
+
+    def test_reuses_unchanged_sections(self, sample_short):
+        first = parse_cv_incremental(None, sample_short)
+        edited = sample_short.replace("Acme Corp", "Acme Inc")
+        second = parse_cv_incremental(first, edited)
+        assert second.cv == parse_cv(edited)
+        reused = [
+            new is old for new, old in zip(second.cv.sections, first.cv.sections)
+        ]
+        assert reused.count(False) == 1
+        assert second.cv.sections[0].entries[0].organization == "Acme Inc"
+
+    def test_does_not_mutate_previous(self, sample_short):
+        first = parse_cv_incremental(None, sample_short)
+        before = parse_cv(sample_short)
+        parse_cv_incremental(first, sample_short + "\n## Extra\n\nMore.\n")
+        assert first.cv == before
+
+    def test_fenced_h2_is_not_a_boundary(self):
+        text = "# Name\n\n## Notes\n\n```\n## not a heading\n```\n\n## Skills\n\nGo\n"
+        result = parse_cv_incremental(None, text)
+        assert result.cv == parse_cv(text)
+        assert [s.heading for s in result.cv.sections] == ["Notes", "Skills"]
+
+    def test_h2_inside_list_item_is_not_a_boundary(self):
+        text = "# A\n\n## S\n\n- item\n  ## inner\n\n## T\n\ntext\n"
+        result = parse_cv_incremental(None, text)
+        assert result.cv == parse_cv(text)
+        assert [s.heading for s in result.cv.sections] == ["S", "T"]
+
+    def test_indented_top_level_h2_falls_back(self):
+        text = "# A\n\n## S\n\ntext\n\n  ## T\n\nmore\n"
+        result = parse_cv_incremental(None, text)
+        assert result.cv == parse_cv(text)
+        assert [s.heading for s in result.cv.sections] == ["S", "T"]
+
+    def test_setext_heading_falls_back(self):
+        text = "# Name\n\n## One\n\nText\n\nTwo\n---\n\nMore\n"
+        result = parse_cv_incremental(None, text)
+        assert result.cv == parse_cv(text)
+        assert result.section_digests == ()
+
+
+class TestLargeSections:
+    def test_long_publication_list(self):
+        lines = ["# Name", "", "email", "", "## Publications", ""]
+        for i in range(2000):
+            lines += [f"**Paper {i}** | Journal | {2000 + i % 20}", f"- Author {i}", ""]
+        cv = parse_cv("\n".join(lines))
+        entries = cv.sections[0].entries
+        assert len(entries) == 2000
+        assert entries[-1].title == "Paper 1999"
+        assert entries[-1].details == ["Author 1999"]
+
+    def test_bold_entries_stop_at_first_other_block(self):
+        md = "# N\n\ne\n\n## S\n\n**A** | 2020\n\n**B** | 2021\n\nPlain text\n\n**C**\n"
+        cv = parse_cv(md)
+        assert [e.title for e in cv.sections[0].entries] == ["A", "B"]
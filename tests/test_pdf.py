@@ -1,8 +1,25 @@
 """Tests for PDF generation."""
 
+import io
+import math
+
+import pytest
+
+from md2cv.estimate import FitPrior
 from md2cv.models import CVData, CVEntry, CVSection, ContactInfo, StyleParams
 from md2cv.parser import parse_cv
-from md2cv.pdf import _scale_params, generate_pdf
+from md2cv.pdf import (
+    MAX_ITERATIONS,
+    MIN_SCALE,
+    FitResult,
+    _FitSearch,
+    _fit_steps,
+    _length_mm,
+    _scale_params,
+    generate_pdf,
+    write_pdf,
+)
+from md2cv.stats import RenderStats
 
 
 class TestScaleParams:
@@ -37,6 +54,17 @@ class TestScaleParams:
         assert scaled.base_font_size == 6.5
 
 
+class TestLengthMM:
+    def test_units(self):
+        assert _length_mm("210mm") == 210.0
+        assert abs(_length_mm("8.5in") - 215.9) < 1e-9
+        assert _length_mm("2cm") == 20.0
+
+    def test_rejects_unknown_unit(self):
+        with pytest.raises(ValueError):
+            _length_mm("10em")
+
+
 class TestGeneratePDF:
     def test_generates_pdf_file(self, tmp_path, sample_short):
         cv = parse_cv(sample_short)
@@ -60,9 +88,199 @@ class TestGeneratePDF:
         result = generate_pdf(cv, out, auto_fit=False)
         assert result.exists()
 
+    def test_measure_strategy(self, tmp_path, sample_long):
+        cv = parse_cv(sample_long)
+        out = tmp_path / "test.pdf"
+        result = generate_pdf(cv, out, fit_strategy="measure")
+        assert result.exists()
+
     def test_auto_fit_long_cv(self, tmp_path, sample_long):
         cv = parse_cv(sample_long)
         out = tmp_path / "test.pdf"
         result = generate_pdf(cv, out, auto_fit=True)
         assert result.exists()
         assert result.stat().st_size > 0
+
+    def test_write_to_stream(self, sample_short):
+        cv = parse_cv(sample_short)
+        buffer = io.BytesIO()
+        stats = RenderStats()
+        write_pdf(cv, buffer, stats=stats)
+        assert buffer.getvalue()[:5] == b"%PDF-"
+        assert stats.output_bytes == len(buffer.getvalue())
+        assert stats.fit.renders >= 1
+
+
+def _run_search(search, fill_at):
+    """Drive a _FitSearch against a synthetic fill function."""
+    while not search.done and search.renders < MAX_ITERATIONS:
+        factor = search.propose()
+        fill = fill_at(factor)
+        search.record(factor, math.ceil(fill), fill)
+    return search
+
+
+class TestFitSearch:
+    def test_grid_step_from_tolerance(self):
+        search = _FitSearch(10.0, tolerance_pt=0.05)
+        assert abs(search.step - 0.005) < 1e-9
+        assert search.factor(search.size) == 1.0
+        assert search.factor(0) == MIN_SCALE
+
+    def test_converges_to_largest_fitting_factor(self):
+        def fill_at(f):
+            return 1.3 * f * f
+
+        search = _FitSearch(10.0)
+        search.record(1.0, 2, fill_at(1.0))
+        _run_search(search, fill_at)
+        assert search.done
+        assert fill_at(search.best) <= 1.0
+        assert fill_at(search.best + search.step) > 1.0
+
+    def test_few_renders_for_typical_overflow(self):
+        def fill_at(f):
+            return 1.25 * f**2.1
+
+        search = _FitSearch(10.0)
+        search.record(1.0, 2, fill_at(1.0))
+        _run_search(search, fill_at)
+        assert search.renders <= 4
+
+    def test_nothing_fits(self):
+        def fill_at(f):
+            return 5.0 * f
+
+        search = _FitSearch(10.0)
+        search.record(1.0, 5, fill_at(1.0))
+        _run_search(search, fill_at)
+        assert search.done
+        assert search.best is None
+
+    def test_propose_many_splits_bracket(self):
+        search = _FitSearch(10.0)
+        search.record(1.0, 2, 1.2)
+        factors = search.propose_many(3)
+        assert len(factors) == 3
+        assert factors == sorted(factors)
+        assert all(MIN_SCALE <= f < 1.0 for f in factors)
+
+    def test_parallel_matches_serial(self):
+        for coeff in (1.05, 1.3, 1.8):
+
+            def fill_at(f):
+                return coeff * f**2.2
+
+            serial = _FitSearch(10.0)
+            serial.record(1.0, 2, fill_at(1.0))
+            _run_search(serial, fill_at)
+
+            parallel = _FitSearch(10.0)
+            parallel.record(1.0, 2, fill_at(1.0))
+            while not parallel.done:
+                for factor in parallel.propose_many(4):
+                    fill = fill_at(factor)
+                    parallel.record(factor, math.ceil(fill), fill)
+            assert parallel.best == serial.best
+
+    def test_hints_probed_first_while_useful(self):
+        search = _FitSearch(10.0)
+        search.record(0.9, 2, 1.1)
+        search.hint(0.95, 0.85)
+        # 0.95 is above a known overflow, so it is skipped
+        assert abs(search.propose() - 0.85) < 1e-9
+
+
+def _drive_steps(
+    fill_at, fit_workers=1, fit_strategy="search", measured=None, prior=None
+):
+    """Answer _fit_steps with a synthetic fill function; return its outcome."""
+    result = FitResult()
+    steps = _fit_steps(
+        CVData(name="Test"),
+        None,
+        StyleParams(base_font_size=10.0),
+        "a4",
+        0.05,
+        fit_workers,
+        None,
+        prior,
+        None,
+        fit_strategy,
+        result,
+    )
+    rounds = []
+    reply = None
+    try:
+        while True:
+            step = steps.send(reply)
+            if step is None:
+                reply = measured
+                continue
+            rounds.append(step)
+            reply = [(math.ceil(fill_at(f)), fill_at(f)) for f in step]
+    except StopIteration as stop:
+        return stop.value, result, rounds
+
+
+class TestFitSteps:
+    def test_fits_at_full_scale(self):
+        (factor, reuse), result, rounds = _drive_steps(lambda f: 0.8 * f * f)
+        assert (factor, reuse) == (1.0, True)
+        assert rounds == [[1.0]]
+        assert result.renders == 1
+
+    def test_first_probe_final_only_at_full_scale(self):
+        _, _, rounds = _drive_steps(lambda f: 0.8 * f * f)
+        assert rounds[0].is_final(1, 0.8)
+        assert not rounds[0].is_final(2, 1.2)
+        _, _, rounds = _drive_steps(
+            lambda f: 1.3 * f * f, fit_strategy="measure", measured=0.877
+        )
+        assert rounds[0].final_fill is None
+        assert not rounds[0].is_final(1, 0.99)
+
+    def test_searches_after_overflow(self):
+        def fill_at(f):
+            return 1.3 * f * f
+
+        (factor, reuse), result, rounds = _drive_steps(fill_at)
+        assert not reuse
+        assert fill_at(factor) <= 1.0
+        assert fill_at(factor + 0.005) > 1.0
+        assert result.factor == factor
+        assert result.renders == len(rounds) + 1
+
+    def test_parallel_rounds(self):
+        def fill_at(f):
+            return 1.3 * f * f
+
+        (serial, _), _, _ = _drive_steps(fill_at)
+        (factor, _), _, rounds = _drive_steps(fill_at, fit_workers=3)
+        assert factor == serial
+        assert max(len(r) for r in rounds) == 3
+
+    def test_measure_asks_for_estimate_first(self):
+        def fill_at(f):
+            return 1.3 * f * f
+
+        (factor, _), result, rounds = _drive_steps(
+            fill_at, fit_strategy="measure", measured=0.877
+        )
+        assert abs(rounds[0][0] - 0.875) < 1e-9
+        assert fill_at(factor) <= 1.0
+        assert result.renders == len(rounds) + 2
+
+    def test_prior_snapped_to_grid_below(self):
+        # The page boundary falls between grid points 0.845 and 0.85, and
+        # the prior's top sits just below 0.85
+        def fill_at(f):
+            return f / 0.8482
+
+        prior = FitPrior(0.80, 0.8479)
+        (serial, _), result, rounds = _drive_steps(fill_at, prior=prior)
+        assert abs(rounds[0][0] - 0.845) < 1e-9
+        assert abs(serial - 0.845) < 1e-9
+        assert result.fits
+        (parallel, _), _, _ = _drive_steps(fill_at, fit_workers=3, prior=prior)
+        assert parallel == serial
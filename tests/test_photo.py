@@ -0,0 +1,82 @@
+"""Tests for photo preparation."""
+
+import base64
+import io
+
+import pytest
+
+from md2cv import photo as photo_module
+from md2cv.photo import load_photo
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _decode(photo):
+    return Image.open(io.BytesIO(base64.b64decode(photo.data)))
+
+
+@pytest.fixture
+def camera_jpeg(tmp_path):
+    """A large landscape JPEG carrying EXIF metadata."""
+    image = Image.new("RGB", (3000, 2000), (200, 120, 80))
+    exif = Image.Exif()
+    exif[0x010F] = "Camera Maker"
+    path = tmp_path / "portrait.jpg"
+    image.save(path, "JPEG", quality=95, exif=exif)
+    return path
+
+
+class TestLoadPhoto:
+    def test_missing_file(self, tmp_path):
+        assert load_photo(None) is None
+        assert load_photo(tmp_path / "nope.jpg", (80, 80)) is None
+
+    def test_no_box_embeds_unchanged(self, camera_jpeg):
+        photo = load_photo(camera_jpeg)
+        assert base64.b64decode(photo.data) == camera_jpeg.read_bytes()
+        assert photo.mime == "image/jpeg"
+
+    def test_downscaled_to_box_at_dpi(self, camera_jpeg):
+        photo = load_photo(camera_jpeg, (80, 80), dpi=300)
+        image = _decode(photo)
+        assert photo.mime == "image/jpeg"
+        assert image.size == (250, 250)  # 80 px at 300 / 96 DPI, cropped square
+        assert len(base64.b64decode(photo.data)) < camera_jpeg.stat().st_size
+
+    def test_metadata_stripped(self, camera_jpeg):
+        assert not _decode(load_photo(camera_jpeg, (80, 80))).getexif()
+
+    def test_never_upscaled(self, tmp_path):
+        path = tmp_path / "small.jpg"
+        Image.new("RGB", (100, 50), "white").save(path, "JPEG")
+        assert _decode(load_photo(path, (80, 80), dpi=300)).size == (50, 50)
+
+    def test_transparency_kept_as_png(self, tmp_path):
+        path = tmp_path / "cutout.png"
+        Image.new("RGBA", (1000, 1000), (0, 0, 0, 0)).save(path)
+        photo = load_photo(path, (80, 80))
+        assert photo.mime == "image/png"
+        assert _decode(photo).mode == "RGBA"
+
+    def test_undecodable_embedded_as_is(self, tmp_path):
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"not an image")
+        photo = load_photo(path, (80, 80))
+        assert base64.b64decode(photo.data) == b"not an image"
+        assert photo.mime == "image/png"
+
+    def test_cached_in_memory_and_on_disk(self, camera_jpeg, monkeypatch):
+        first = load_photo(camera_jpeg, (75, 75))
+        prepared = []
+        monkeypatch.setattr(
+            photo_module, "_prepare", lambda *args: prepared.append(args)
+        )
+        assert load_photo(camera_jpeg, (75, 75)) == first
+        photo_module._memory.clear()
+        assert load_photo(camera_jpeg, (75, 75)) == first
+        assert prepared == []
+
+    def test_options_change_the_result(self, camera_jpeg):
+        default = load_photo(camera_jpeg, (80, 80))
+        assert _decode(load_photo(camera_jpeg, (80, 80), dpi=150)).size == (125, 125)
+        assert load_photo(camera_jpeg, (80, 80), quality=40) != default
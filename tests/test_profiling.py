@@ -0,0 +1,63 @@
+"""Tests for the stage profiler."""
+
+import pstats
+import signal
+import time
+
+import pytest
+
+from md2cv.profiling import Profiler
+from md2cv.stats import RenderStats
+
+
+def _spin(seconds: float) -> None:
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        sum(range(100))
+
+
+class TestProfiler:
+    @pytest.mark.skipif(
+        not hasattr(signal, "setitimer"), reason="stack sampling needs setitimer"
+    )
+    def test_writes_pstats_and_stacks(self, tmp_path):
+        profiler = Profiler()
+        stats = RenderStats()
+        stats.profiler = profiler
+        try:
+            with stats.stage("parse"):
+                _spin(0.05)
+            with stats.stage("layout"):
+                _spin(0.05)
+        finally:
+            profiler.close()
+
+        written = {p.name for p in profiler.write(tmp_path)}
+        assert {"parse.pstats", "layout.pstats", "profile.pstats"} <= written
+        parse_stats = pstats.Stats(str(tmp_path / "parse.pstats"))
+        functions = {func for _, _, func in parse_stats.stats}
+        assert "_spin" in functions
+
+        lines = (tmp_path / "stacks.collapsed").read_text().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert stack.split(";")[0] in ("parse", "layout")
+            assert int(count) > 0
+
+    def test_nested_stages(self):
+        profiler = Profiler()
+        try:
+            with profiler.stage("layout"):
+                with profiler.stage("write_pdf"):
+                    _spin(0.01)
+                _spin(0.01)
+        finally:
+            profiler.close()
+        assert set(profiler.profiles) == {"layout", "write_pdf"}
+
+    def test_stats_unaffected_without_profiler(self):
+        stats = RenderStats()
+        with stats.stage("parse"):
+            pass
+        assert "profiler" not in stats.to_dict()
@@ -1,7 +1,14 @@
 """Tests for the HTML renderer."""
 
 from md2cv.models import CVData, CVEntry, CVSection, ContactInfo, StyleParams
-from md2cv.renderer import render_html
+from md2cv.renderer import (
+    _compiled,
+    assemble_html,
+    render_body,
+    render_html,
+    render_style,
+)
+from md2cv.themes import get_theme
 
 
 class TestRenderHTML:
@@ -87,3 +94,47 @@ class TestRenderHTML:
         assert "<img" in html
         assert "base64" in html
         assert 'class="photo"' in html
+
+
+class TestSplitRendering:
+    def test_body_has_no_style_values(self):
+        body = render_body(CVData(name="Jane"), get_theme("professional"))
+        assert "Jane" in body
+        assert "<style>" not in body
+        assert "pt;" not in body
+
+    def test_style_block_tracks_params(self):
+        css = render_style(StyleParams(base_font_size=7.5), get_theme("modern"))
+        assert "7.5pt" in css
+        assert "@page" in css
+
+    def test_matches_full_render(self):
+        theme = get_theme("modern")
+        cv = CVData(name="Jane")
+        style = StyleParams(base_font_size=8.0)
+        html = assemble_html(theme, render_body(cv, theme), render_style(style, theme))
+        assert html == render_html(cv, style=style, theme=theme)
+
+
+class TestTemplateCache:
+    def test_compiled_once_per_source(self):
+        theme = get_theme("modern")
+        render_body(CVData(name="Jane"), theme)
+        misses = _compiled.cache_info().misses
+        render_body(CVData(name="John"), get_theme("modern"))
+        render_style(StyleParams(), theme)
+        render_style(StyleParams(base_font_size=9.0), theme)
+        assert _compiled.cache_info().misses <= misses + 1
+
+    def test_changed_source_recompiles(self):
+        theme = get_theme("modern")
+        edited = theme._replace(template_string="<h1>{{ cv.name }} (edited)</h1>")
+        assert render_body(CVData(name="Jane"), edited) == "<h1>Jane (edited)</h1>"
+        assert "(edited)" not in render_body(CVData(name="Jane"), theme)
+
+    def test_bytecode_cached_on_disk(self, tmp_path):
+        theme = get_theme("professional")._replace(
+            template_string="<p>{{ cv.name }} on disk</p>"
+        )
+        render_body(CVData(name="Jane"), theme)
+        assert list((tmp_path / "cache" / "md2cv" / "jinja").glob("*.cache"))
@@ -0,0 +1,95 @@
+"""Tests for the render server."""
+
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+
+import pytest
+
+from md2cv.server import RenderService, _percentile, make_server
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    service = RenderService(workers=1, max_queue=4, max_body=64 * 1024)
+    service.start()
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    service.shutdown()
+
+
+def _post(url, data, content_type="text/markdown"):
+    request = urllib.request.Request(
+        url, data=data, headers={"Content-Type": content_type}
+    )
+    return urllib.request.urlopen(request, timeout=60)
+
+
+class TestPercentile:
+    def test_empty(self):
+        assert _percentile([], 50) == 0.0
+
+    def test_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert _percentile(values, 50) == 50.0
+        assert _percentile(values, 99) == 99.0
+
+
+class TestServer:
+    def test_render_html(self, server_url, sample_short):
+        with _post(f"{server_url}/render?format=html", sample_short.encode()) as resp:
+            assert resp.status == 200
+            assert resp.headers["Content-Type"].startswith("text/html")
+            assert "John Smith" in resp.read().decode()
+
+    def test_render_json_payload(self, server_url):
+        payload = json.dumps({"markdown": "# Jane Doe\n"}).encode()
+        with _post(
+            f"{server_url}/render?format=html&theme=modern",
+            payload,
+            "application/json",
+        ) as resp:
+            assert "Jane Doe" in resp.read().decode()
+
+    def test_unknown_theme(self, server_url):
+        with pytest.raises(urllib.error.HTTPError) as err:
+            _post(f"{server_url}/render?theme=nope", b"# Jane")
+        assert err.value.code == 400
+
+    @pytest.mark.parametrize(
+        "payload", [b"[]", b'"x"', b'{"markdown": 1}', b'{"markdown": "#", "photo": 1}']
+    )
+    def test_malformed_json_payload(self, server_url, payload):
+        with pytest.raises(urllib.error.HTTPError) as err:
+            _post(f"{server_url}/render?format=html", payload, "application/json")
+        assert err.value.code == 400
+
+    @pytest.mark.parametrize(
+        "length, status", [(None, 411), ("-1", 400), ("x", 400), ("65537", 413)]
+    )
+    def test_bad_content_length(self, server_url, length, status):
+        url = urlsplit(server_url)
+        conn = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+        conn.putrequest("POST", "/render?format=html")
+        if length is not None:
+            conn.putheader("Content-Length", length)
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == status
+        conn.close()
+
+    def test_health(self, server_url, sample_short):
+        _post(f"{server_url}/render?format=html", sample_short.encode()).close()
+        with urllib.request.urlopen(f"{server_url}/health", timeout=10) as resp:
+            health = json.loads(resp.read())
+        assert health["status"] == "ok"
+        assert health["queue_depth"] == 0
+        assert health["completed"] >= 1
+        assert set(health["latency_ms"]) == {"p50", "p90", "p99"}
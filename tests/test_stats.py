@@ -0,0 +1,76 @@
+"""Tests for per-stage stats."""
+
+from md2cv.pdf import FitResult
+from md2cv.stats import (
+    FitIteration,
+    RenderStats,
+    histogram,
+    percentile,
+    summarize,
+)
+
+
+def _stats(parse_ms: float, renders: int) -> RenderStats:
+    stats = RenderStats()
+    with stats.stage("parse"):
+        pass
+    stats.stages["parse"].wall = parse_ms / 1000
+    stats.fit = FitResult(factor=0.9, renders=renders)
+    return stats
+
+
+class TestRenderStats:
+    def test_stage_accumulates(self):
+        stats = RenderStats()
+        for _ in range(3):
+            with stats.stage("render_html"):
+                pass
+        timing = stats.stages["render_html"]
+        assert timing.calls == 3
+        assert timing.wall >= 0 and timing.cpu >= 0
+
+    def test_stage_records_on_error(self):
+        stats = RenderStats()
+        try:
+            with stats.stage("parse"):
+                raise ValueError
+        except ValueError:
+            pass
+        assert stats.stages["parse"].calls == 1
+
+    def test_text_report(self):
+        stats = RenderStats()
+        with stats.stage("layout"):
+            pass
+        stats.fit = FitResult(
+            factor=0.85, renders=3, trace=[FitIteration(1.0, 2, 1.2, 0.05)]
+        )
+        stats.output_bytes = 1234
+        text = stats.format_text()
+        assert "layout" in text
+        assert "final factor: 0.850 (3 renders)" in text
+        assert "1234 bytes" in text
+
+    def test_to_dict(self):
+        stats = RenderStats(fit=FitResult(trace=[FitIteration(1.0, 1, 0.9, 0.1)]))
+        data = stats.to_dict()
+        assert data["fit"]["trace"][0]["pages"] == 1
+
+
+class TestAggregates:
+    def test_percentile(self):
+        assert percentile([], 50) == 0.0
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+
+    def test_histogram(self):
+        counts = histogram([5, 10, 11, 500], [10, 100])
+        assert counts == {"<=10": 2, "<=100": 1, ">100": 1}
+
+    def test_summarize(self):
+        summary = summarize([_stats(5, 1), _stats(30, 3), _stats(40, 3)])
+        assert summary["files"] == 3
+        parse = summary["stages"]["parse"]
+        assert parse["max_ms"] == 40
+        assert parse["histogram_ms"]["<=10"] == 1
+        assert parse["histogram_ms"]["<=50"] == 2
+        assert summary["renders"] == {"1": 1, "3": 2}
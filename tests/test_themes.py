@@ -0,0 +1,127 @@
+"""Tests for the theme registry."""
+
+import dataclasses
+import os
+import shutil
+
+import pytest
+
+from md2cv.themes import (
+    THEME_PATH_ENV,
+    get_theme,
+    list_themes,
+    preload_themes,
+    theme_dirs,
+    theme_files,
+)
+
+
+@pytest.fixture
+def user_themes(tmp_path, monkeypatch):
+    """A user theme directory holding a copy of the built-in modern theme."""
+    directory = tmp_path / "themes"
+    shutil.copytree(theme_dirs()[-1] / "modern", directory / "mine")
+    monkeypatch.setenv(THEME_PATH_ENV, str(directory))
+    return directory
+
+
+class TestRegistry:
+    def test_served_from_memory(self):
+        assert get_theme("modern") is get_theme("modern")
+
+    def test_style_is_immutable(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            get_theme("modern").default_style.base_font_size = 1.0
+
+    def test_user_theme_dir(self, user_themes):
+        assert "mine" in list_themes()
+        assert get_theme("mine").name == "mine"
+        assert theme_files("mine")[0].parent == user_themes / "mine"
+
+    def test_listed_once_template_added(self, user_themes):
+        draft = user_themes / "draft"
+        draft.mkdir()
+        assert "draft" not in list_themes()
+        shutil.copy(user_themes / "mine" / "template.html", draft)
+        stat = draft.stat()
+        os.utime(draft, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert "draft" in list_themes()
+
+    def test_reloads_when_files_change(self, user_themes):
+        before = get_theme("mine")
+        template = user_themes / "mine" / "template.html"
+        template.write_text("<h1>{{ cv.name }}</h1>", encoding="utf-8")
+        stat = template.stat()
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        after = get_theme("mine")
+        assert after is not before
+        assert after.template_string == "<h1>{{ cv.name }}</h1>"
+
+    def test_user_theme_shadows_builtin(self, user_themes):
+        shutil.copytree(user_themes / "mine", user_themes / "professional")
+        assert get_theme("professional").template_string == (
+            get_theme("modern").template_string
+        )
+
+    def test_preload(self, user_themes):
+        names = [theme.name for theme in preload_themes()]
+        assert names == list_themes()
+        assert [t.name for t in preload_themes(["modern"])] == ["modern"]
+
+    def test_unknown_theme(self):
+        with pytest.raises(ValueError, match="Available themes"):
+            get_theme("../modern")
+
+    def test_photo_size_from_css(self, user_themes):
+        assert get_theme("modern").photo_size == (75.0, 75.0)
+        css = user_themes / "mine" / "theme.css"
+        css.write_text(".photo-frame { width: 9px; }\n.photo { width: 60px; }")
+        assert get_theme("mine").photo_size == (60.0, 80.0)
+
+    def test_bundled_fonts(self, user_themes):
+        toml = user_themes / "mine" / "theme.toml"
+        toml.write_text(
+            toml.read_text()
+            + '\n[[fonts]]\nfamily = "Inter"\nfile = "fonts/Inter-Bold.woff2"\n'
+            + 'weight = 700\n'
+        )
+        theme = get_theme("mine")
+        assert theme.fonts[0].weight == "700"
+        assert theme.static_css.startswith(
+            '@font-face { font-family: "Inter"; '
+            'src: url("theme-asset:fonts/Inter-Bold.woff2"); '
+            "font-weight: 700; font-style: normal; }"
+        )
+
+    def test_font_needs_file(self, user_themes):
+        toml = user_themes / "mine" / "theme.toml"
+        toml.write_text(toml.read_text() + '\n[[fonts]]\nfamily = "Inter"\n')
+        with pytest.raises(ValueError, match=r"\[\[fonts\]\]"):
+            get_theme("mine")
+
+    def test_font_family_escaped(self, user_themes):
+        toml = user_themes / "mine" / "theme.toml"
+        toml.write_text(
+            toml.read_text()
+            + '\n[[fonts]]\nfamily = \'x"; } body { color: red; }\'\nfile = "a.ttf"\n'
+        )
+        css = get_theme("mine").static_css
+        assert css.startswith('@font-face { font-family: "x\\22 ; } body')
+        assert css.count('"', 0, css.index("src:")) == 2
+
+    @pytest.mark.parametrize(
+        "line", ['weight = "700; color: red"', "weight = 0", 'style = "slanted"']
+    )
+    def test_font_descriptors_validated(self, user_themes, line):
+        toml = user_themes / "mine" / "theme.toml"
+        toml.write_text(
+            toml.read_text() + f'\n[[fonts]]\nfamily = "A"\nfile = "a.ttf"\n{line}\n'
+        )
+        with pytest.raises(ValueError, match="font (weight|style)"):
+            get_theme("mine")
+
+
+def test_theme_files():
+    names = [p.name for p in theme_files("professional")]
+    assert "template.html" in names
+    assert all(p.parent.name == "professional" for p in theme_files("professional"))
@@ -0,0 +1,51 @@
+"""Tests for the warm-up steps."""
+
+import os
+import shutil
+
+import pytest
+
+from md2cv.themes import THEME_PATH_ENV, get_theme, theme_dirs
+from md2cv.warmup import missing_fonts, warm_up
+
+
+@pytest.fixture
+def font_theme(tmp_path, monkeypatch):
+    """A copy of the modern theme declaring one bundled font."""
+    directory = tmp_path / "themes"
+    theme_dir = directory / "fonted"
+    shutil.copytree(theme_dirs()[-1] / "modern", theme_dir)
+    with open(theme_dir / "theme.toml", "a", encoding="utf-8") as toml:
+        toml.write('\n[[fonts]]\nfamily = "Inter"\nfile = "fonts/Inter.woff2"\n')
+    monkeypatch.setenv(THEME_PATH_ENV, str(directory))
+    return theme_dir
+
+
+class TestWarmUp:
+    def test_renders_each_theme(self):
+        steps = list(warm_up(["modern", "professional"], font_cache=False, pdf=False))
+        assert [step.name for step in steps] == ["theme modern", "theme professional"]
+        assert all(step.error is None for step in steps)
+
+    def test_missing_font_reported(self, font_theme):
+        assert missing_fonts(get_theme("fonted")) == ["fonts/Inter.woff2"]
+        (step,) = warm_up(["fonted"], font_cache=False, pdf=False)
+        assert "fonts/Inter.woff2" in step.error
+
+        (font_theme / "fonts").mkdir()
+        (font_theme / "fonts" / "Inter.woff2").write_bytes(b"wOF2")
+        (step,) = warm_up(["fonted"], font_cache=False, pdf=False)
+        assert step.error is None
+        assert step.detail == "1 bundled font(s)"
+
+    def test_runs_fc_cache(self, tmp_path, monkeypatch):
+        marker = tmp_path / "ran"
+        script = tmp_path / "bin" / "fc-cache"
+        script.parent.mkdir()
+        script.write_text(f"#!/bin/sh\ntouch {marker}\n")
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{script.parent}{os.pathsep}{os.environ['PATH']}")
+        step = next(warm_up(["modern"], font_cache=True, pdf=False))
+        assert step.name == "font cache"
+        assert step.error is None
+        assert marker.exists()
@@ -0,0 +1,88 @@
+"""Tests for the file watcher."""
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from md2cv import pdf
+from md2cv import watch as watch_module
+from md2cv.cli import main
+from md2cv.estimate import FitPrior
+from md2cv.pdf import FitResult
+from md2cv.watch import changed_paths, snapshot
+
+
+class TestSnapshot:
+    def test_missing_file(self, tmp_path):
+        path = tmp_path / "missing.md"
+        assert snapshot([path]) == {path: None}
+
+    def test_detects_modification(self, tmp_path):
+        a = tmp_path / "a.md"
+        b = tmp_path / "b.md"
+        a.write_text("one")
+        b.write_text("two")
+        before = snapshot([a, b])
+        stat = a.stat()
+        os.utime(a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert changed_paths(before, snapshot([a, b])) == [a]
+
+    def test_detects_creation(self, tmp_path):
+        path = tmp_path / "new.md"
+        before = snapshot([path])
+        path.write_text("hello")
+        assert changed_paths(before, snapshot([path])) == [path]
+
+    def test_unchanged(self, tmp_path):
+        path = tmp_path / "a.md"
+        path.write_text("one")
+        assert changed_paths(snapshot([path]), snapshot([path])) == []
+
+
+
+@pytest.fixture
+def watched_cv(tmp_path, monkeypatch):
+    """Run ``md2cv --watch`` on a CV with renders stubbed out.
+
+    Returns a function that applies each edit to the CV, passes it to the
+    watch loop's callback, and gives back the CLI result and the prior of
+    every render.
+    """
+    source = tmp_path / "cv.md"
+    source.write_text("# Jane Doe\n\n## Experience\n\n- Engineer\n")
+    priors = []
+
+    def generate_pdf(cv, output_path, prior=None, stats=None, **options):
+        priors.append(prior)
+        stats.fit = FitResult(factor=0.9 - 0.01 * len(priors), renders=1)
+
+    def run(*edits):
+        def watch(paths, on_change):
+            for edit in edits:
+                source.write_text(edit(source.read_text()))
+                on_change([source])
+
+        monkeypatch.setattr(pdf, "generate_pdf", generate_pdf)
+        monkeypatch.setattr(watch_module, "watch", watch)
+        result = CliRunner().invoke(
+            main, [str(source), "-o", str(tmp_path / "cv.pdf"), "--watch"]
+        )
+        assert result.exit_code == 0, result.output
+        return result, priors
+
+    return run
+
+
+class TestWatchRebuild:
+    def test_skips_when_content_unchanged(self, watched_cv):
+        result, priors = watched_cv(lambda text: text + "\n")
+        assert "No content changes; skipped rebuild." in result.output
+        assert priors == [None]
+
+    def test_starts_from_previous_factor(self, watched_cv):
+        result, priors = watched_cv(
+            lambda text: text + "- Manager\n", lambda text: text + "- Director\n"
+        )
+        assert "Rebuilt in" in result.output
+        assert priors == [None, FitPrior(0.89, 0.89), FitPrior(0.88, 0.88)]